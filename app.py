@@ -6,10 +6,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from pathlib import Path
+
+from bitesuae.cache import LRUCache, filter_key
+from bitesuae.charts import bar_chart, grouped_bar_chart, line_chart, pareto_chart, pie_chart, theme_template
+from bitesuae.cube import build_cube, rollup
+from bitesuae.facts import build_orders_full
+from bitesuae.filters import FilterIndex, sort_by_date
+from bitesuae.graph import MetricGraph
+from bitesuae.metrics import average, group_mode, on_time_percent, rider_performance
+from bitesuae.schema import compact, take
+from bitesuae.store import FACT_TABLE, find_store, read_table, store_version
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -163,50 +171,94 @@ st.markdown(get_css(theme), unsafe_allow_html=True)
 # DATA LOADING
 # =============================================================================
 
-@st.cache_data
-def load_data():
-    """Load all cleaned datasets."""
+# Columns the dashboard reads from each table
+LOAD_COLUMNS = {
+    'RESTAURANTS': ['restaurant_id', 'city', 'zone', 'cuisine_type'],
+    'RIDERS': ['rider_id', 'rider_name', 'city', 'vehicle_type'],
+    'ORDERS_FULL': [
+        'order_id', 'customer_id', 'order_date', 'order_status',
+        'gross_amount', 'discount_amount', 'net_amount', 'promo_code', 'cancellation_reason',
+        'city', 'zone', 'cuisine_type', 'restaurant_tier', 'restaurant_name', 'rider_id', 'rider_key',
+        'actual_delivery_time_mins', 'delay_reason', 'delivery_performance', 'order_hour',
+        'time_of_day', 'prep_time_mins', 'rider_time_mins', 'is_on_time'
+    ],
+}
+
+# Memory cap of the aggregate and figure cache shared by all sessions
+AGGREGATE_CACHE_MB = 64
+
+# Excel workbooks used when the Parquet store is missing, in order
+EXCEL_PATHS = [Path('data') / 'BitesUAE_Cleaned.xlsx', Path('BitesUAE_Cleaned.xlsx')]
+
+def load_store(store_dir):
+    """Load the dimension tables and the ORDERS_FULL fact table from the Parquet store."""
+    restaurants, riders, orders_full = (
+        compact(read_table(table, store_dir, LOAD_COLUMNS[table]), table)
+        for table in ['RESTAURANTS', 'RIDERS', FACT_TABLE]
+    )
+    return restaurants, riders, sort_by_date(orders_full)
+
+def data_source():
+    """Return the cleaned data's location and version; the version changes when the cleaner rewrites it."""
+    store_dir = find_store()
+    if store_dir is not None:
+        return store_dir, store_version(store_dir)
+    for path in EXCEL_PATHS:
+        if path.exists():
+            return path, path.stat().st_mtime_ns
+    return EXCEL_PATHS[-1], None
+
+@st.cache_resource(max_entries=1, show_spinner="Loading data...")
+def load_data(source, version):
+    """Load all cleaned datasets once per data version, shared by every session.
+
+    The frames hold the compact dtypes of bitesuae/schema.py, with IDs as
+    integer keys. They are returned without copying, so they are read-only:
+    the dashboard only ever filters them into new frames.
+    """
+    if source.is_dir():
+        return load_store(source)
+
+    # Fall back to the Excel workbook when the Parquet store is missing
     try:
-        xlsx = pd.ExcelFile('data/BitesUAE_Cleaned.xlsx')
-        customers = pd.read_excel(xlsx, 'CUSTOMERS')
+        xlsx = pd.ExcelFile(source)
         restaurants = pd.read_excel(xlsx, 'RESTAURANTS')
         riders = pd.read_excel(xlsx, 'RIDERS')
         orders = pd.read_excel(xlsx, 'ORDERS')
-        order_items = pd.read_excel(xlsx, 'ORDER_ITEMS')
         delivery_events = pd.read_excel(xlsx, 'DELIVERY_EVENTS')
-    except:
-        try:
-            xlsx = pd.ExcelFile('BitesUAE_Cleaned.xlsx')
-            customers = pd.read_excel(xlsx, 'CUSTOMERS')
-            restaurants = pd.read_excel(xlsx, 'RESTAURANTS')
-            riders = pd.read_excel(xlsx, 'RIDERS')
-            orders = pd.read_excel(xlsx, 'ORDERS')
-            order_items = pd.read_excel(xlsx, 'ORDER_ITEMS')
-            delivery_events = pd.read_excel(xlsx, 'DELIVERY_EVENTS')
-        except Exception as e:
-            st.error(f"Error loading data: {e}")
-            st.stop()
-    
-    # Convert datetime columns
-    orders['order_datetime'] = pd.to_datetime(orders['order_datetime'])
-    if 'order_date' in orders.columns:
-        orders['order_date'] = pd.to_datetime(orders['order_date'])
-    else:
-        orders['order_date'] = orders['order_datetime'].dt.date
-        orders['order_date'] = pd.to_datetime(orders['order_date'])
-    
-    delivery_events['order_placed_time'] = pd.to_datetime(delivery_events['order_placed_time'])
-    delivery_events['delivered_time'] = pd.to_datetime(delivery_events['delivered_time'])
-    delivery_events['estimated_delivery_time'] = pd.to_datetime(delivery_events['estimated_delivery_time'])
-    delivery_events['restaurant_confirmed_time'] = pd.to_datetime(delivery_events['restaurant_confirmed_time'])
-    delivery_events['food_ready_time'] = pd.to_datetime(delivery_events['food_ready_time'])
-    delivery_events['rider_picked_up_time'] = pd.to_datetime(delivery_events['rider_picked_up_time'])
-    
-    return customers, restaurants, riders, orders, order_items, delivery_events
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        st.stop()
+    
+    # Build the fact table once here; the cleaner publishes it with the store
+    orders_full = build_orders_full(orders, restaurants, riders, delivery_events)[LOAD_COLUMNS[FACT_TABLE]]
+    return (compact(restaurants[LOAD_COLUMNS['RESTAURANTS']], 'RESTAURANTS'),
+            compact(riders[LOAD_COLUMNS['RIDERS']], 'RIDERS'),
+            sort_by_date(compact(orders_full, FACT_TABLE)))
+
+@st.cache_resource(max_entries=1)
+def load_filter_index(source, version):
+    """Build the sidebar filter bitmaps once per data version."""
+    return FilterIndex(load_data(source, version)[2])
+
+@st.cache_resource(max_entries=1)
+def load_cube(source, version):
+    """Pre-aggregate the KPI cube and its filter bitmaps once per data version."""
+    cube = build_cube(load_data(source, version)[2])
+    return cube, FilterIndex(cube)
+
+@st.cache_resource(max_entries=1)
+def load_aggregate_cache(source, version):
+    """Start an empty aggregate and figure cache for each data version."""
+    return LRUCache(AGGREGATE_CACHE_MB)
 
 # Load data
 try:
-    customers, restaurants, riders, orders, order_items, delivery_events = load_data()
+    source, version = data_source()
+    restaurants, riders, orders_full = load_data(source, version)
+    filter_index = load_filter_index(source, version)
+    cube, cube_index = load_cube(source, version)
+    aggregate_cache = load_aggregate_cache(source, version)
     data_loaded = True
 except Exception as e:
     st.error(f"Failed to load data: {e}")
@@ -242,26 +294,6 @@ def get_chart_colors(theme_name):
     else:
         return ['#ff6b35', '#2563eb', '#16a34a', '#d97706', '#dc2626', '#7c3aed', '#0891b2', '#65a30d']
 
-def get_time_of_day(hour):
-    """Categorize hour into time of day."""
-    if 12 <= hour <= 14:
-        return 'Lunch (12-2 PM)'
-    elif 19 <= hour <= 22:
-        return 'Peak (7-10 PM)'
-    else:
-        return 'Off-Peak'
-
-def classify_rider_tier(avg_time, on_time_rate):
-    """Classify rider into performance tier."""
-    if avg_time < 25 and on_time_rate > 90:
-        return 'Star Rider'
-    elif avg_time < 35 and on_time_rate > 75:
-        return 'Good Rider'
-    elif avg_time > 45 or on_time_rate < 60:
-        return 'At Risk'
-    else:
-        return 'Needs Improvement'
-
 # =============================================================================
 # SIDEBAR
 # =============================================================================
@@ -309,8 +341,8 @@ with st.sidebar:
     
     # FILTER 1: Date Range
     st.subheader("📅 Date Range")
-    min_date = orders['order_date'].min().date()
-    max_date = orders['order_date'].max().date()
+    min_date = orders_full['order_date'].min().date()
+    max_date = orders_full['order_date'].max().date()
     
     date_range = st.date_input(
         "Select Period",
@@ -396,138 +428,192 @@ with st.sidebar:
 # APPLY FILTERS
 # =============================================================================
 
-# Merge orders with restaurant info
-orders_enriched = orders.merge(
-    restaurants[['restaurant_id', 'city', 'zone', 'cuisine_type', 'restaurant_tier', 'restaurant_name', 'rating', 'avg_prep_time_mins']], 
-    on='restaurant_id',
-    how='left'
+# One bitmap selection for all filters; a date range alone is a view of orders_full.
+# The same filters select the KPI cube cells.
+start_date, end_date = date_range if len(date_range) == 2 else (None, None)
+filters = dict(
+    city=selected_cities,
+    zone=selected_zones,
+    cuisine_type=selected_cuisines,
+    restaurant_tier=selected_tiers,
+    time_of_day=[selected_time] if selected_time != 'All' else None
 )
 
-# Merge with delivery events
-orders_full = orders_enriched.merge(
-    delivery_events[['order_id', 'rider_id', 'actual_delivery_time_mins', 'delivered_time', 
-                     'estimated_delivery_time', 'delay_reason', 'delivery_performance',
-                     'restaurant_confirmed_time', 'food_ready_time', 'rider_picked_up_time',
-                     'order_placed_time']],
-    on='order_id',
-    how='left'
-)
+# Aggregates and figures are kept per filter state, so revisiting a filter
+# combination or switching views reuses them and a theme change only restyles
+filter_state = filter_key(start_date, end_date, **filters)
 
-# Add time of day column
-orders_full['order_hour'] = orders_full['order_datetime'].dt.hour
-orders_full['time_of_day'] = orders_full['order_hour'].apply(get_time_of_day)
+# =============================================================================
+# KPI GRAPH
+# =============================================================================
 
-# Add week column for trends
-orders_full['order_week'] = orders_full['order_datetime'].dt.to_period('W').astype(str)
+# Every KPI and intermediate is a node computed the first time a view reads it,
+# after the nodes its parameters name, so a view only computes what it renders.
+# Aggregates are cached per filter state; row frames are recomputed on demand.
+kpis = MetricGraph(aggregate_cache, filter_state)
 
-# Calculate prep time and rider time
-orders_full['prep_time_mins'] = (orders_full['food_ready_time'] - orders_full['restaurant_confirmed_time']).dt.total_seconds() / 60
-orders_full['rider_time_mins'] = (orders_full['delivered_time'] - orders_full['rider_picked_up_time']).dt.total_seconds() / 60
+def cached(name, compute, *depends):
+    """Value `name` for the current filters, from compute(*nodes it names) on first use; `depends` are widget values it reads."""
+    return aggregate_cache.get_or_compute((filter_state, name, *depends), lambda: kpis.call(compute))
 
-# Apply filters
-filtered_orders = orders_full.copy()
+def cached_figure(name, build):
+    """Figure `name` for the current filters and theme, from build(*nodes it names) on first use."""
+    return cached(name, build, st.session_state.theme)
 
-# Date filter
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    filtered_orders = filtered_orders[
-        (filtered_orders['order_date'].dt.date >= start_date) & 
-        (filtered_orders['order_date'].dt.date <= end_date)
-    ]
+# --- FILTERED ROWS AND CUBE CELLS ---
 
-# City filter
-if selected_cities:
-    filtered_orders = filtered_orders[filtered_orders['city'].isin(selected_cities)]
+@kpis.node(cache=False)
+def filtered_orders():
+    return filter_index.apply(orders_full, start_date, end_date, **filters)
 
-# Zone filter
-if selected_zones:
-    filtered_orders = filtered_orders[filtered_orders['zone'].isin(selected_zones)]
+@kpis.node(cache=False)
+def filtered_cube():
+    return cube_index.apply(cube, start_date, end_date, **filters)
 
-# Cuisine filter
-if selected_cuisines:
-    filtered_orders = filtered_orders[filtered_orders['cuisine_type'].isin(selected_cuisines)]
+# Additive KPIs roll up cube cells; only the non-additive ones scan filtered rows
+@kpis.node(cache=False)
+def delivered_cube(filtered_cube):
+    return filtered_cube[filtered_cube['order_status'] == 'Delivered']
 
-# Restaurant Tier filter
-if selected_tiers:
-    filtered_orders = filtered_orders[filtered_orders['restaurant_tier'].isin(selected_tiers)]
+@kpis.node(cache=False)
+def cancelled_cube(filtered_cube):
+    return filtered_cube[filtered_cube['order_status'] == 'Cancelled']
 
-# Time of Day filter
-if selected_time != 'All':
-    filtered_orders = filtered_orders[filtered_orders['time_of_day'] == selected_time]
+@kpis.node(cache=False)
+def delivered_orders(filtered_orders):
+    return filtered_orders[filtered_orders['order_status'] == 'Delivered']
 
-# =============================================================================
-# CALCULATE ALL KPIs
-# =============================================================================
+@kpis.node(cache=False)
+def cancelled_orders(filtered_orders):
+    return filtered_orders[filtered_orders['order_status'] == 'Cancelled']
+
+@kpis.node
+def all_totals(filtered_cube):
+    return rollup(filtered_cube)
+
+@kpis.node
+def delivered_totals(delivered_cube):
+    return rollup(delivered_cube)
+
+@kpis.node
+def cancelled_totals(cancelled_cube):
+    return rollup(cancelled_cube)
 
 # Total orders
-total_orders = len(filtered_orders)
+@kpis.node
+def total_orders(all_totals):
+    return int(all_totals['orders'])
 
 # Delivered orders
-delivered_orders = filtered_orders[filtered_orders['order_status'] == 'Delivered']
-total_delivered = len(delivered_orders)
+@kpis.node
+def total_delivered(delivered_totals):
+    return int(delivered_totals['orders'])
 
 # Cancelled orders
-cancelled_orders = filtered_orders[filtered_orders['order_status'] == 'Cancelled']
-total_cancelled = len(cancelled_orders)
+@kpis.node
+def total_cancelled(cancelled_totals):
+    return int(cancelled_totals['orders'])
 
 # --- EXECUTIVE KPIs ---
 
 # GMV (Gross Merchandise Value) - Sum of gross_amount for delivered orders
-gmv = delivered_orders['gross_amount'].sum()
+@kpis.node
+def gmv(delivered_totals):
+    return delivered_totals['gross_amount']
 
 # Net Revenue
-net_revenue = delivered_orders['net_amount'].sum()
+@kpis.node
+def net_revenue(delivered_totals):
+    return delivered_totals['net_amount']
 
 # Average Order Value (AOV)
-aov = gmv / total_delivered if total_delivered > 0 else 0
+@kpis.node
+def aov(gmv, total_delivered):
+    return gmv / total_delivered if total_delivered > 0 else 0
 
 # Discount Burn Rate (%)
-total_discount = delivered_orders['discount_amount'].sum()
-discount_burn_rate = (total_discount / gmv * 100) if gmv > 0 else 0
-
-# Repeat Customer Rate (%)
-customer_order_counts = filtered_orders.groupby('customer_id').size()
-repeat_customers = (customer_order_counts >= 2).sum()
-total_active_customers = len(customer_order_counts)
-repeat_customer_rate = (repeat_customers / total_active_customers * 100) if total_active_customers > 0 else 0
+@kpis.node
+def discount_burn_rate(delivered_totals, gmv):
+    total_discount = delivered_totals['discount_amount']
+    return (total_discount / gmv * 100) if gmv > 0 else 0
+
+# Repeat Customer Rate (%) - not additive, so counted from rows
+@kpis.node(cache=False)
+def customer_order_counts(filtered_orders):
+    return filtered_orders.groupby('customer_id').size()
+
+@kpis.node
+def repeat_customer_rate(customer_order_counts):
+    repeat_customers = (customer_order_counts >= 2).sum()
+    total_active_customers = len(customer_order_counts)
+    return (repeat_customers / total_active_customers * 100) if total_active_customers > 0 else 0
 
 # Order Frequency
-order_frequency = total_orders / total_active_customers if total_active_customers > 0 else 0
+@kpis.node
+def order_frequency(total_orders, customer_order_counts):
+    total_active_customers = len(customer_order_counts)
+    return total_orders / total_active_customers if total_active_customers > 0 else 0
+
+# Calculate prior period for delta (simple mock - use 30 days prior)
+@kpis.node
+def gmv_change():
+    mid_date = min_date + (max_date - min_date) / 2
+    prior_cube = cube_index.apply(cube, end=mid_date - timedelta(days=1))
+    current_cube = cube_index.apply(cube, start=mid_date)
+    
+    prior_gmv = prior_cube.loc[prior_cube['order_status'] == 'Delivered', 'gross_amount'].sum()
+    current_gmv = current_cube.loc[current_cube['order_status'] == 'Delivered', 'gross_amount'].sum()
+    return ((current_gmv - prior_gmv) / prior_gmv * 100) if prior_gmv > 0 else 0
 
 # --- MANAGER KPIs ---
 
 # On-Time Delivery Rate (%)
-on_time_orders = delivered_orders[delivered_orders['delivery_performance'] == 'On Time']
-on_time_rate = (len(on_time_orders) / total_delivered * 100) if total_delivered > 0 else 0
+@kpis.node
+def total_on_time(delivered_totals):
+    return int(delivered_totals['on_time'])
+
+@kpis.node
+def on_time_rate(delivered_totals, total_delivered):
+    return on_time_percent(delivered_totals) if total_delivered > 0 else 0
 
 # Average Delivery Time (mins)
-avg_delivery_time = delivered_orders['actual_delivery_time_mins'].mean() if total_delivered > 0 else 0
+@kpis.node
+def avg_delivery_time(delivered_totals, total_delivered):
+    return average(delivered_totals, 'actual_delivery_time_mins') if total_delivered > 0 else 0
 
 # Average Prep Time (mins)
-avg_prep_time = delivered_orders['prep_time_mins'].mean() if total_delivered > 0 else 0
+@kpis.node
+def avg_prep_time(delivered_totals, total_delivered):
+    return average(delivered_totals, 'prep_time_mins') if total_delivered > 0 else 0
 
 # Average Rider Time (mins)
-avg_rider_time = delivered_orders['rider_time_mins'].mean() if total_delivered > 0 else 0
+@kpis.node
+def avg_rider_time(delivered_totals, total_delivered):
+    return average(delivered_totals, 'rider_time_mins') if total_delivered > 0 else 0
 
 # Cancellation Rate (%)
-cancellation_rate = (total_cancelled / total_orders * 100) if total_orders > 0 else 0
+@kpis.node
+def cancellation_rate(total_cancelled, total_orders):
+    return (total_cancelled / total_orders * 100) if total_orders > 0 else 0
 
-# Peak Hour Delay Rate (%)
-peak_orders = delivered_orders[delivered_orders['time_of_day'] == 'Peak (7-10 PM)']
-peak_late_orders = peak_orders[peak_orders['delivery_performance'] != 'On Time']
-peak_delay_rate = (len(peak_late_orders) / len(peak_orders) * 100) if len(peak_orders) > 0 else 0
+# Cancelled GMV and its average order value, for the what-if analysis
+@kpis.node
+def cancelled_gmv(cancelled_totals, total_cancelled):
+    return cancelled_totals['gross_amount'] if total_cancelled > 0 else 0
 
-# Calculate prior period for delta (simple mock - use 30 days prior)
-mid_date = min_date + (max_date - min_date) / 2
-prior_orders = orders_full[orders_full['order_date'].dt.date < mid_date]
-current_orders = orders_full[orders_full['order_date'].dt.date >= mid_date]
+@kpis.node
+def avg_cancelled_order_value(cancelled_totals, total_cancelled):
+    return average(cancelled_totals, 'gross_amount') if total_cancelled > 0 else 0
 
-prior_gmv = prior_orders[prior_orders['order_status'] == 'Delivered']['gross_amount'].sum()
-current_gmv = current_orders[current_orders['order_status'] == 'Delivered']['gross_amount'].sum()
-gmv_change = ((current_gmv - prior_gmv) / prior_gmv * 100) if prior_gmv > 0 else 0
+# Peak Hour Delay Rate (%)
+@kpis.node
+def peak_delay_rate(delivered_cube):
+    peak_totals = rollup(delivered_cube[delivered_cube['time_of_day'] == 'Peak (7-10 PM)'])
+    return 100 - on_time_percent(peak_totals) if peak_totals['orders'] > 0 else 0
 
 # Chart colors
 chart_colors = get_chart_colors(st.session_state.theme)
+template = theme_template(theme)
 
 # =============================================================================
 # MAIN DASHBOARD HEADER
@@ -558,28 +644,28 @@ if dashboard_view == "Executive View":
     with kpi_col1:
         st.metric(
             label="💰 GMV (Gross Merchandise Value)",
-            value=format_currency(gmv),
-            delta=f"{gmv_change:+.1f}% vs prior period"
+            value=format_currency(kpis['gmv']),
+            delta=f"{kpis['gmv_change']:+.1f}% vs prior period"
         )
     
     with kpi_col2:
         st.metric(
             label="🧾 Average Order Value (AOV)",
-            value=f"AED {aov:.2f}",
+            value=f"AED {kpis['aov']:.2f}",
             delta="+3.2%"
         )
     
     with kpi_col3:
         st.metric(
             label="🔄 Repeat Customer Rate",
-            value=f"{repeat_customer_rate:.1f}%",
+            value=f"{kpis['repeat_customer_rate']:.1f}%",
             delta="+2.5%"
         )
     
     with kpi_col4:
         st.metric(
             label="🏷️ Discount Burn Rate",
-            value=f"{discount_burn_rate:.1f}%",
+            value=f"{kpis['discount_burn_rate']:.1f}%",
             delta="-1.2%",
             delta_color="inverse"
         )
@@ -587,21 +673,28 @@ if dashboard_view == "Executive View":
     st.markdown("<br>", unsafe_allow_html=True)
     
     # --- AUTO-GENERATED INSIGHTS BOX ---
-    top_zone = filtered_orders.groupby('zone')['gross_amount'].sum().idxmax() if len(filtered_orders) > 0 else "N/A"
-    top_zone_gmv = filtered_orders.groupby('zone')['gross_amount'].sum().max() if len(filtered_orders) > 0 else 0
-    top_zone_pct = (top_zone_gmv / gmv * 100) if gmv > 0 else 0
+    @kpis.node
+    def top_labels(filtered_cube, total_orders, gmv):
+        """Top zone and cuisine by gross amount, with their share of GMV."""
+        zone_gross = rollup(filtered_cube, 'zone', ['gross_amount'])['gross_amount']
+        top_zone = zone_gross.idxmax() if total_orders > 0 else "N/A"
+        top_zone_gmv = zone_gross.max() if total_orders > 0 else 0
+        
+        cuisine_gross = rollup(filtered_cube, 'cuisine_type', ['gross_amount'])['gross_amount']
+        top_cuisine = cuisine_gross.idxmax() if total_orders > 0 else "N/A"
+        top_cuisine_gmv = cuisine_gross.max() if total_orders > 0 else 0
+        return (top_zone, (top_zone_gmv / gmv * 100) if gmv > 0 else 0,
+                top_cuisine, (top_cuisine_gmv / gmv * 100) if gmv > 0 else 0)
     
-    top_cuisine = filtered_orders.groupby('cuisine_type')['gross_amount'].sum().idxmax() if len(filtered_orders) > 0 else "N/A"
-    top_cuisine_gmv = filtered_orders.groupby('cuisine_type')['gross_amount'].sum().max() if len(filtered_orders) > 0 else 0
-    top_cuisine_pct = (top_cuisine_gmv / gmv * 100) if gmv > 0 else 0
+    top_zone, top_zone_pct, top_cuisine, top_cuisine_pct = kpis['top_labels']
     
     st.markdown(f"""
         <div class='insight-box'>
-            <p><strong>📈 Executive Insights:</strong> GMV is <strong>{format_currency(gmv)}</strong> with 
+            <p><strong>📈 Executive Insights:</strong> GMV is <strong>{format_currency(kpis['gmv'])}</strong> with 
             <strong>{top_zone_pct:.1f}%</strong> from <strong>{top_zone}</strong> zone. 
-            Repeat customer rate is <strong>{repeat_customer_rate:.1f}%</strong>. 
+            Repeat customer rate is <strong>{kpis['repeat_customer_rate']:.1f}%</strong>. 
             Top cuisine is <strong>{top_cuisine}</strong> contributing <strong>{top_cuisine_pct:.1f}%</strong> of GMV. 
-            Discount burn rate is <strong>{discount_burn_rate:.1f}%</strong>.</p>
+            Discount burn rate is <strong>{kpis['discount_burn_rate']:.1f}%</strong>.</p>
         </div>
     """, unsafe_allow_html=True)
     
@@ -614,63 +707,44 @@ if dashboard_view == "Executive View":
     
     with chart_col1:
         # Line Chart: Daily/Weekly GMV Trend
-        daily_gmv = delivered_orders.groupby(delivered_orders['order_date'].dt.date)['gross_amount'].sum().reset_index()
-        daily_gmv.columns = ['Date', 'GMV']
+        @kpis.node
+        def daily_gmv(delivered_cube):
+            return rollup(delivered_cube, 'order_date', ['gross_amount'])['gross_amount']
         
-        fig_gmv_trend = px.line(
-            daily_gmv,
-            x='Date',
-            y='GMV',
+        fig_gmv_trend = cached_figure('fig_gmv_trend', lambda daily_gmv: line_chart(
+            daily_gmv.index.date,
+            [dict(y=daily_gmv, line=dict(color=theme['accent'], width=2)),
+             dict(y=daily_gmv.rolling(7).mean(), name='7-Day Avg', showlegend=True,
+                  line=dict(color=theme['accent_secondary'], dash='dash'))],
+            template,
             title='📈 Daily GMV Trend (AED)',
-            template=theme['plotly_template']
-        )
-        fig_gmv_trend.update_traces(line_color=theme['accent'], line_width=2)
-        fig_gmv_trend.add_scatter(
-            x=daily_gmv['Date'], 
-            y=daily_gmv['GMV'].rolling(7).mean(),
-            mode='lines',
-            name='7-Day Avg',
-            line=dict(color=theme['accent_secondary'], dash='dash')
-        )
-        fig_gmv_trend.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title=''),
-            yaxis=dict(gridcolor=theme['grid_color'], title='GMV (AED)'),
+            x_label='Date',
+            y_label='GMV',
+            xaxis_title='',
+            yaxis_title='GMV (AED)',
             hovermode='x unified',
-            showlegend=True,
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
+            showlegend=True
+        ))
         st.plotly_chart(fig_gmv_trend, use_container_width=True)
     
     with chart_col2:
         # Bar Chart: GMV by Zone (Top 10)
-        zone_gmv = delivered_orders.groupby('zone')['gross_amount'].sum().reset_index()
-        zone_gmv.columns = ['Zone', 'GMV']
-        zone_gmv = zone_gmv.sort_values('GMV', ascending=True).tail(10)
+        @kpis.node
+        def zone_gmv(delivered_cube):
+            return rollup(delivered_cube, 'zone', ['gross_amount'])['gross_amount'].sort_values(ascending=True).tail(10)
         
-        fig_zone = px.bar(
-            zone_gmv,
-            x='GMV',
-            y='Zone',
-            orientation='h',
+        fig_zone = cached_figure('fig_zone', lambda zone_gmv: bar_chart(
+            zone_gmv.to_numpy(),
+            zone_gmv.index.astype(str),
+            template,
             title='📊 GMV by Zone (Top 10)',
-            template=theme['plotly_template'],
-            color='GMV',
-            color_continuous_scale=['#ff6b35', '#ffab00']
-        )
-        fig_zone.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title='GMV (AED)'),
-            yaxis=dict(gridcolor=theme['grid_color'], title=''),
-            showlegend=False,
-            coloraxis_showscale=False
-        )
+            x_label='GMV',
+            y_label='Zone',
+            orientation='h',
+            colorscale=['#ff6b35', '#ffab00'],
+            xaxis_title='GMV (AED)',
+            yaxis_title=''
+        ))
         st.plotly_chart(fig_zone, use_container_width=True)
     
     # Row 2: Cuisine Mix and AOV by Tier and City
@@ -678,52 +752,39 @@ if dashboard_view == "Executive View":
     
     with chart_col3:
         # Donut Chart: Cuisine Mix (% of GMV)
-        cuisine_gmv = delivered_orders.groupby('cuisine_type')['gross_amount'].sum().reset_index()
-        cuisine_gmv.columns = ['Cuisine', 'GMV']
+        @kpis.node
+        def cuisine_gmv(delivered_cube):
+            return rollup(delivered_cube, 'cuisine_type', ['gross_amount'])['gross_amount']
         
-        fig_cuisine = px.pie(
-            cuisine_gmv,
-            values='GMV',
-            names='Cuisine',
+        fig_cuisine = cached_figure('fig_cuisine', lambda cuisine_gmv: pie_chart(
+            cuisine_gmv.index.astype(str),
+            cuisine_gmv.to_numpy(),
+            template,
             title='🍽️ GMV by Cuisine Type',
-            template=theme['plotly_template'],
-            color_discrete_sequence=chart_colors,
+            colors=chart_colors,
             hole=0.4
-        )
-        fig_cuisine.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
-        fig_cuisine.update_traces(textposition='inside', textinfo='percent+label')
+        ).update_traces(textposition='inside', textinfo='percent+label'))
         st.plotly_chart(fig_cuisine, use_container_width=True)
     
     with chart_col4:
         # Grouped Bar Chart: AOV by Restaurant Tier and City
-        aov_by_tier_city = delivered_orders.groupby(['restaurant_tier', 'city'])['gross_amount'].mean().reset_index()
-        aov_by_tier_city.columns = ['Tier', 'City', 'AOV']
+        @kpis.node
+        def aov_by_tier_city(delivered_cube):
+            tier_city_totals = rollup(delivered_cube, ['restaurant_tier', 'city'], ['gross_amount', 'gross_amount_count'])
+            return average(tier_city_totals, 'gross_amount').unstack('city')
         
-        fig_aov = px.bar(
-            aov_by_tier_city,
-            x='Tier',
-            y='AOV',
-            color='City',
-            barmode='group',
+        fig_aov = cached_figure('fig_aov', lambda aov_by_tier_city: grouped_bar_chart(
+            aov_by_tier_city.index.astype(str),
+            {str(city): aov_by_tier_city[city].to_numpy() for city in aov_by_tier_city.columns},
+            template,
             title='🏪 AOV by Restaurant Tier & City',
-            template=theme['plotly_template'],
-            color_discrete_sequence=chart_colors
-        )
-        fig_aov.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title=''),
-            yaxis=dict(gridcolor=theme['grid_color'], title='AOV (AED)'),
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
+            colors=chart_colors,
+            x_label='Tier',
+            y_label='AOV',
+            xaxis_title='',
+            yaxis_title='AOV (AED)',
+            legend_title_text='City'
+        ))
         st.plotly_chart(fig_aov, use_container_width=True)
     
     st.markdown("---")
@@ -731,19 +792,22 @@ if dashboard_view == "Executive View":
     # --- PROMO EFFECTIVENESS TABLE ---
     st.markdown(f"<h4 style='color: {theme['text_primary']};'>🏷️ Promo Code Effectiveness</h4>", unsafe_allow_html=True)
     
-    promo_analysis = delivered_orders[delivered_orders['promo_code'].notna()].groupby('promo_code').agg({
-        'order_id': 'count',
-        'gross_amount': 'sum',
-        'discount_amount': 'sum',
-        'net_amount': 'sum'
-    }).reset_index()
-    promo_analysis.columns = ['Promo Code', 'Orders', 'GMV (AED)', 'Discount (AED)', 'Net Revenue (AED)']
-    promo_analysis['Discount Rate (%)'] = (promo_analysis['Discount (AED)'] / promo_analysis['GMV (AED)'] * 100).round(1)
-    promo_analysis['Avg Order Value'] = (promo_analysis['GMV (AED)'] / promo_analysis['Orders']).round(2)
-    promo_analysis = promo_analysis.sort_values('Orders', ascending=False)
+    @kpis.node
+    def promo_analysis(delivered_orders):
+        """Orders, GMV and discount per promo code."""
+        promo_analysis = delivered_orders[delivered_orders['promo_code'].notna()].groupby('promo_code', observed=True).agg({
+            'order_id': 'count',
+            'gross_amount': 'sum',
+            'discount_amount': 'sum',
+            'net_amount': 'sum'
+        }).reset_index()
+        promo_analysis.columns = ['Promo Code', 'Orders', 'GMV (AED)', 'Discount (AED)', 'Net Revenue (AED)']
+        promo_analysis['Discount Rate (%)'] = (promo_analysis['Discount (AED)'] / promo_analysis['GMV (AED)'] * 100).round(1)
+        promo_analysis['Avg Order Value'] = (promo_analysis['GMV (AED)'] / promo_analysis['Orders']).round(2)
+        return promo_analysis.sort_values('Orders', ascending=False)
     
     st.dataframe(
-        promo_analysis,
+        kpis['promo_analysis'],
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -768,21 +832,21 @@ else:  # Manager View
     with kpi_col1:
         st.metric(
             label="✅ On-Time Delivery Rate",
-            value=f"{on_time_rate:.1f}%",
+            value=f"{kpis['on_time_rate']:.1f}%",
             delta="+2.3%"
         )
     
     with kpi_col2:
         st.metric(
             label="⏱️ Avg Delivery Time",
-            value=f"{avg_delivery_time:.1f} mins",
+            value=f"{kpis['avg_delivery_time']:.1f} mins",
             delta="-1.5 mins"
         )
     
     with kpi_col3:
         st.metric(
             label="❌ Cancellation Rate",
-            value=f"{cancellation_rate:.1f}%",
+            value=f"{kpis['cancellation_rate']:.1f}%",
             delta="-0.8%",
             delta_color="inverse"
         )
@@ -790,7 +854,7 @@ else:  # Manager View
     with kpi_col4:
         st.metric(
             label="🌙 Peak Hour Delay Rate",
-            value=f"{peak_delay_rate:.1f}%",
+            value=f"{kpis['peak_delay_rate']:.1f}%",
             delta="-2.1%",
             delta_color="inverse"
         )
@@ -804,67 +868,50 @@ else:  # Manager View
     
     with chart_col1:
         # Line Chart: Daily On-Time Rate Trend
-        daily_performance = delivered_orders.groupby(delivered_orders['order_date'].dt.date).apply(
-            lambda x: (x['delivery_performance'] == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
-        ).reset_index()
-        daily_performance.columns = ['Date', 'On-Time Rate']
+        @kpis.node
+        def daily_performance(delivered_cube):
+            return on_time_percent(rollup(delivered_cube, 'order_date', ['orders', 'on_time']))
         
-        fig_ontime_trend = px.line(
-            daily_performance,
-            x='Date',
-            y='On-Time Rate',
+        fig_ontime_trend = cached_figure('fig_ontime_trend', lambda daily_performance: line_chart(
+            daily_performance.index.date,
+            [dict(y=daily_performance, line=dict(color=theme['success'], width=2))],
+            template,
             title='📈 Daily On-Time Delivery Rate (%)',
-            template=theme['plotly_template']
-        )
-        fig_ontime_trend.update_traces(line_color=theme['success'], line_width=2)
-        fig_ontime_trend.add_hline(y=80, line_dash="dash", line_color=theme['warning'],
-                                    annotation_text="Target: 80%",
-                                    annotation_font_color=theme['text_primary'])
-        fig_ontime_trend.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title=''),
-            yaxis=dict(gridcolor=theme['grid_color'], title='On-Time Rate (%)', range=[0, 100]),
+            x_label='Date',
+            y_label='On-Time Rate',
+            xaxis_title='',
+            yaxis=dict(title='On-Time Rate (%)', range=[0, 100]),
             hovermode='x unified'
-        )
+        ).add_hline(y=80, line_dash="dash", line_color=theme['warning'],
+                    annotation_text="Target: 80%",
+                    annotation_font_color=theme['text_primary']))
         st.plotly_chart(fig_ontime_trend, use_container_width=True)
     
     with chart_col2:
         # Stacked Bar Chart: Delay Breakdown (Prep Time vs Rider Time) by Zone
-        delay_breakdown = delivered_orders.groupby('zone').agg({
-            'prep_time_mins': 'mean',
-            'rider_time_mins': 'mean'
-        }).reset_index()
-        delay_breakdown.columns = ['Zone', 'Avg Prep Time', 'Avg Rider Time']
-        delay_breakdown = delay_breakdown.sort_values('Avg Prep Time', ascending=False).head(10)
+        @kpis.node
+        def delay_breakdown(delivered_cube):
+            """Average prep and rider time of the 10 zones with the slowest prep."""
+            zone_totals = rollup(delivered_cube, 'zone', ['prep_time_mins', 'prep_time_mins_count',
+                                                          'rider_time_mins', 'rider_time_mins_count'])
+            delay_breakdown = pd.DataFrame({
+                'Prep Time': average(zone_totals, 'prep_time_mins'),
+                'Rider Time': average(zone_totals, 'rider_time_mins')
+            })
+            return delay_breakdown.sort_values('Prep Time', ascending=False).head(10)
         
-        fig_delay_stack = go.Figure()
-        fig_delay_stack.add_trace(go.Bar(
-            name='Prep Time',
-            x=delay_breakdown['Zone'],
-            y=delay_breakdown['Avg Prep Time'],
-            marker_color=theme['warning']
-        ))
-        fig_delay_stack.add_trace(go.Bar(
-            name='Rider Time',
-            x=delay_breakdown['Zone'],
-            y=delay_breakdown['Avg Rider Time'],
-            marker_color=theme['accent_secondary']
-        ))
-        fig_delay_stack.update_layout(
-            barmode='stack',
+        fig_delay_stack = cached_figure('fig_delay_stack', lambda delay_breakdown: grouped_bar_chart(
+            delay_breakdown.index.astype(str),
+            {name: delay_breakdown[name].to_numpy() for name in delay_breakdown.columns},
+            template,
             title='🕐 Delay Breakdown by Zone (Prep vs Rider Time)',
-            template=theme['plotly_template'],
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title=''),
-            yaxis=dict(gridcolor=theme['grid_color'], title='Time (minutes)'),
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
+            colors=[theme['warning'], theme['accent_secondary']],
+            barmode='stack',
+            x_label='Zone',
+            y_label='Minutes',
+            xaxis_title='',
+            yaxis_title='Time (minutes)'
+        ))
         st.plotly_chart(fig_delay_stack, use_container_width=True)
     
     # Row 2: Pareto Chart and Heatmap
@@ -872,70 +919,43 @@ else:  # Manager View
     
     with chart_col3:
         # Pareto Chart: Cancellation Reasons
-        cancel_reasons = cancelled_orders['cancellation_reason'].value_counts().reset_index()
-        cancel_reasons.columns = ['Reason', 'Count']
-        cancel_reasons['Cumulative %'] = (cancel_reasons['Count'].cumsum() / cancel_reasons['Count'].sum() * 100)
-        
-        fig_pareto = make_subplots(specs=[[{"secondary_y": True}]])
-        
-        fig_pareto.add_trace(
-            go.Bar(name='Count', x=cancel_reasons['Reason'], y=cancel_reasons['Count'],
-                   marker_color=theme['danger']),
-            secondary_y=False
-        )
-        
-        fig_pareto.add_trace(
-            go.Scatter(name='Cumulative %', x=cancel_reasons['Reason'], y=cancel_reasons['Cumulative %'],
-                       mode='lines+markers', marker_color=theme['accent'], line=dict(width=2)),
-            secondary_y=True
-        )
+        @kpis.node
+        def cancel_reasons(cancelled_orders):
+            cancel_reasons = cancelled_orders['cancellation_reason'].value_counts()
+            return cancel_reasons[cancel_reasons > 0]
         
-        fig_pareto.update_layout(
+        fig_pareto = cached_figure('fig_pareto', lambda cancel_reasons: pareto_chart(
+            cancel_reasons.index.astype(str),
+            cancel_reasons.to_numpy(),
+            template,
             title='📊 Cancellation Reasons (Pareto)',
-            template=theme['plotly_template'],
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color']),
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
-        fig_pareto.update_yaxes(title_text="Count", secondary_y=False, gridcolor=theme['grid_color'])
-        fig_pareto.update_yaxes(title_text="Cumulative %", secondary_y=True, gridcolor=theme['grid_color'])
+            bar_color=theme['danger'],
+            line_color=theme['accent']
+        ))
         
         st.plotly_chart(fig_pareto, use_container_width=True)
     
     with chart_col4:
         # Heatmap: Performance by Hour of Day
-        hourly_performance = delivered_orders.groupby('order_hour').apply(
-            lambda x: (x['delivery_performance'] == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
-        ).reset_index()
-        hourly_performance.columns = ['Hour', 'On-Time Rate']
+        @kpis.node
+        def hourly_performance(delivered_cube):
+            return on_time_percent(rollup(delivered_cube, 'order_hour', ['orders', 'on_time']))
         
-        # Create a simple bar chart styled as heatmap alternative
-        fig_hourly = px.bar(
-            hourly_performance,
-            x='Hour',
-            y='On-Time Rate',
+        # Create a simple bar chart styled as heatmap alternative, highlighting peak hours
+        fig_hourly = cached_figure('fig_hourly', lambda hourly_performance: bar_chart(
+            hourly_performance.index.to_numpy(),
+            hourly_performance.to_numpy(),
+            template,
             title='🕐 On-Time Rate by Hour of Day',
-            template=theme['plotly_template'],
-            color='On-Time Rate',
-            color_continuous_scale=['#ff5252', '#ffab00', '#00c853']
-        )
-        fig_hourly.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            xaxis=dict(gridcolor=theme['grid_color'], title='Hour', tickmode='linear', dtick=2),
-            yaxis=dict(gridcolor=theme['grid_color'], title='On-Time Rate (%)', range=[0, 100]),
-            coloraxis_showscale=False
-        )
-        # Highlight peak hours
-        fig_hourly.add_vrect(x0=11.5, x1=14.5, fillcolor=theme['warning'], opacity=0.15, line_width=0,
-                             annotation_text="Lunch", annotation_position="top")
-        fig_hourly.add_vrect(x0=18.5, x1=22.5, fillcolor=theme['danger'], opacity=0.15, line_width=0,
-                             annotation_text="Peak", annotation_position="top")
+            x_label='Hour',
+            y_label='On-Time Rate',
+            colorscale=['#ff5252', '#ffab00', '#00c853'],
+            xaxis=dict(title='Hour', tickmode='linear', dtick=2),
+            yaxis=dict(title='On-Time Rate (%)', range=[0, 100])
+        ).add_vrect(x0=11.5, x1=14.5, fillcolor=theme['warning'], opacity=0.15, line_width=0,
+                    annotation_text="Lunch", annotation_position="top"
+        ).add_vrect(x0=18.5, x1=22.5, fillcolor=theme['danger'], opacity=0.15, line_width=0,
+                    annotation_text="Peak", annotation_position="top"))
         st.plotly_chart(fig_hourly, use_container_width=True)
     
     st.markdown("---")
@@ -943,28 +963,34 @@ else:  # Manager View
     # --- TOP 10 PROBLEM AREAS TABLE (Sortable) ---
     st.markdown(f"<h4 style='color: {theme['text_primary']};'>🚨 Top 10 Problem Areas</h4>", unsafe_allow_html=True)
     
-    problem_areas = delivered_orders.groupby('zone').agg({
-        'order_id': 'count',
-        'delivery_performance': lambda x: (x != 'On Time').sum(),
-        'actual_delivery_time_mins': 'mean',
-        'delay_reason': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'N/A'
-    }).reset_index()
-    
-    zone_cancellations = cancelled_orders.groupby('zone').size().reset_index()
-    zone_cancellations.columns = ['zone', 'Cancellations']
-    
-    problem_areas = problem_areas.merge(zone_cancellations, on='zone', how='left')
-    problem_areas['Cancellations'] = problem_areas['Cancellations'].fillna(0).astype(int)
-    
-    problem_areas.columns = ['Zone', 'Total Orders', 'Late Deliveries', 'Avg Delay (mins)', 'Top Delay Reason', 'Cancellations']
-    problem_areas['Late %'] = (problem_areas['Late Deliveries'] / problem_areas['Total Orders'] * 100).round(1)
-    problem_areas['Avg Delay (mins)'] = problem_areas['Avg Delay (mins)'].round(1)
-    problem_areas = problem_areas.sort_values('Late Deliveries', ascending=False).head(10)
-    
-    problem_areas_display = problem_areas[['Zone', 'Late Deliveries', 'Late %', 'Avg Delay (mins)', 'Top Delay Reason', 'Cancellations']]
+    @kpis.node
+    def problem_areas(delivered_cube, delivered_orders, cancelled_cube):
+        """The 10 zones with the most late deliveries."""
+        zone_totals = rollup(delivered_cube, 'zone', ['orders', 'on_time', 'actual_delivery_time_mins',
+                                                      'actual_delivery_time_mins_count'])
+        problem_areas = pd.DataFrame({
+            'order_id': zone_totals['orders'],
+            'delivery_performance': zone_totals['orders'] - zone_totals['on_time'],
+            'actual_delivery_time_mins': average(zone_totals, 'actual_delivery_time_mins'),
+            # The most common delay reason is not additive, so it comes from rows
+            'delay_reason': group_mode(delivered_orders, 'zone', 'delay_reason')
+        }).reset_index()
+        
+        zone_cancellations = rollup(cancelled_cube, 'zone', ['orders']).reset_index()
+        zone_cancellations.columns = ['zone', 'Cancellations']
+        
+        problem_areas = problem_areas.merge(zone_cancellations, on='zone', how='left')
+        problem_areas['Cancellations'] = problem_areas['Cancellations'].fillna(0).astype(int)
+        
+        problem_areas.columns = ['Zone', 'Total Orders', 'Late Deliveries', 'Avg Delay (mins)', 'Top Delay Reason', 'Cancellations']
+        problem_areas['Late %'] = (problem_areas['Late Deliveries'] / problem_areas['Total Orders'] * 100).round(1)
+        problem_areas['Avg Delay (mins)'] = problem_areas['Avg Delay (mins)'].round(1)
+        problem_areas = problem_areas.sort_values('Late Deliveries', ascending=False).head(10)
+        
+        return problem_areas[['Zone', 'Late Deliveries', 'Late %', 'Avg Delay (mins)', 'Top Delay Reason', 'Cancellations']]
     
     st.dataframe(
-        problem_areas_display,
+        kpis['problem_areas'],
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -980,38 +1006,50 @@ else:  # Manager View
     # --- DRILL-DOWN BY ZONE ---
     st.markdown(f"<h4 style='color: {theme['text_primary']};'>🔍 Zone Drill-Down Analysis</h4>", unsafe_allow_html=True)
     
+    @kpis.node
+    def drill_zones(filtered_cube):
+        return sorted(filtered_cube['zone'].dropna().unique().tolist())
+    
     drill_zone = st.selectbox(
         "Select a Zone to Drill Down",
-        options=sorted(filtered_orders['zone'].dropna().unique().tolist()),
+        options=kpis['drill_zones'],
         index=0
     )
     
-    zone_data = filtered_orders[filtered_orders['zone'] == drill_zone]
-    zone_delivered = zone_data[zone_data['order_status'] == 'Delivered']
-    zone_cancelled = zone_data[zone_data['order_status'] == 'Cancelled']
+    def zone_drill_down(filtered_orders, delivered_cube):
+        """On-time rate, delivery time and the slowest restaurants and riders of `drill_zone`."""
+        zone_data = filtered_orders[filtered_orders['zone'] == drill_zone]
+        zone_delivered = zone_data[zone_data['order_status'] == 'Delivered']
+        
+        zone_totals = rollup(delivered_cube[delivered_cube['zone'] == drill_zone])
+        zone_on_time = on_time_percent(zone_totals) if zone_totals['orders'] > 0 else 0
+        zone_avg_time = average(zone_totals, 'actual_delivery_time_mins') if zone_totals['orders'] > 0 else 0
+        
+        rest_perf = zone_delivered.groupby('restaurant_name')['prep_time_mins'].mean().reset_index()
+        rest_perf.columns = ['Restaurant', 'Avg Prep Time']
+        rest_perf = rest_perf.sort_values('Avg Prep Time', ascending=False).head(5)
+        
+        rider_names = take(riders['rider_name'], zone_delivered['rider_key'])
+        rider_perf = zone_delivered['rider_time_mins'].groupby(rider_names).mean().reset_index()
+        rider_perf.columns = ['Rider', 'Avg Delivery Time']
+        rider_perf = rider_perf.sort_values('Avg Delivery Time', ascending=False).head(5)
+        return zone_on_time, zone_avg_time, rest_perf, rider_perf
+    
+    zone_on_time, zone_avg_time, rest_perf, rider_perf = cached('drill_down', zone_drill_down, drill_zone)
     
     drill_col1, drill_col2, drill_col3 = st.columns(3)
     
     with drill_col1:
         st.markdown(f"**📊 Zone Performance: {drill_zone}**")
-        zone_on_time = (zone_delivered['delivery_performance'] == 'On Time').sum() / len(zone_delivered) * 100 if len(zone_delivered) > 0 else 0
-        zone_avg_time = zone_delivered['actual_delivery_time_mins'].mean() if len(zone_delivered) > 0 else 0
         st.metric("On-Time Rate", f"{zone_on_time:.1f}%")
         st.metric("Avg Delivery Time", f"{zone_avg_time:.1f} mins")
     
     with drill_col2:
         st.markdown(f"**🏪 Restaurant Performance**")
-        rest_perf = zone_delivered.groupby('restaurant_name')['prep_time_mins'].mean().reset_index()
-        rest_perf.columns = ['Restaurant', 'Avg Prep Time']
-        rest_perf = rest_perf.sort_values('Avg Prep Time', ascending=False).head(5)
         st.dataframe(rest_perf, use_container_width=True, hide_index=True)
     
     with drill_col3:
         st.markdown(f"**🏍️ Rider Performance**")
-        rider_perf = zone_delivered.merge(riders[['rider_id', 'rider_name']], on='rider_id', how='left')
-        rider_perf = rider_perf.groupby('rider_name')['rider_time_mins'].mean().reset_index()
-        rider_perf.columns = ['Rider', 'Avg Delivery Time']
-        rider_perf = rider_perf.sort_values('Avg Delivery Time', ascending=False).head(5)
         st.dataframe(rider_perf, use_container_width=True, hide_index=True)
     
     st.markdown("---")
@@ -1044,15 +1082,15 @@ else:  # Manager View
         )
     
     # Calculate projections
-    current_avg_total_time = avg_delivery_time
+    current_avg_total_time = kpis['avg_delivery_time']
     projected_avg_time = max(current_avg_total_time - prep_reduction, 15)  # Min 15 mins
     
     # Assume on-time improves proportionally with reduced prep time
     time_improvement_ratio = prep_reduction / current_avg_total_time if current_avg_total_time > 0 else 0
-    projected_on_time = min(on_time_rate + (time_improvement_ratio * 100 * 0.5), 100)  # Cap at 100%
+    projected_on_time = min(kpis['on_time_rate'] + (time_improvement_ratio * 100 * 0.5), 100)  # Cap at 100%
     
     # Current late orders
-    current_late_orders = total_delivered - len(on_time_orders)
+    current_late_orders = kpis['total_delivered'] - kpis['total_on_time']
     projected_late_orders = int(current_late_orders * (1 - time_improvement_ratio * 0.5))
     
     # Complaints (1 complaint per 5 late orders)
@@ -1061,12 +1099,12 @@ else:  # Manager View
     complaint_reduction = current_complaints - projected_complaints
     
     # GMV recovery from reduced cancellations
-    current_cancelled_gmv = cancelled_orders['gross_amount'].sum() if len(cancelled_orders) > 0 else 0
-    avg_cancelled_order_value = cancelled_orders['gross_amount'].mean() if len(cancelled_orders) > 0 else 0
-    orders_recovered = int(total_cancelled * (cancel_reduction / 100))
+    current_cancelled_gmv = kpis['cancelled_gmv']
+    avg_cancelled_order_value = kpis['avg_cancelled_order_value']
+    orders_recovered = int(kpis['total_cancelled'] * (cancel_reduction / 100))
     gmv_recovery = orders_recovered * avg_cancelled_order_value
     
-    new_cancellation_rate = cancellation_rate * (1 - cancel_reduction / 100)
+    new_cancellation_rate = kpis['cancellation_rate'] * (1 - cancel_reduction / 100)
     
     # Display projections
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1078,7 +1116,7 @@ else:  # Manager View
             <div class='what-if-card'>
                 <h5 style='color: {theme["accent"]}; margin: 0;'>📈 Projected On-Time Rate</h5>
                 <p style='font-size: 1.8rem; font-weight: bold; margin: 10px 0; color: {theme["success"]};'>{projected_on_time:.1f}%</p>
-                <p style='color: {theme["text_secondary"]}; font-size: 0.9rem;'>Current: {on_time_rate:.1f}%</p>
+                <p style='color: {theme["text_secondary"]}; font-size: 0.9rem;'>Current: {kpis['on_time_rate']:.1f}%</p>
             </div>
         """, unsafe_allow_html=True)
     
@@ -1117,25 +1155,22 @@ else:  # Manager View
     
     st.markdown(f"<h4 style='color: {theme['text_primary']};'>🏍️ Rider Performance Tiers</h4>", unsafe_allow_html=True)
     
-    # Calculate rider stats
-    rider_stats = delivered_orders.groupby('rider_id').agg({
-        'order_id': 'count',
-        'actual_delivery_time_mins': 'mean',
-        'delivery_performance': lambda x: (x == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
-    }).reset_index()
-    rider_stats.columns = ['rider_id', 'deliveries', 'avg_time', 'on_time_rate']
-    
-    # Classify riders
-    rider_stats['tier'] = rider_stats.apply(
-        lambda x: classify_rider_tier(x['avg_time'], x['on_time_rate']), axis=1
-    )
-    
-    # Merge with rider names
-    rider_stats = rider_stats.merge(riders[['rider_id', 'rider_name', 'city', 'vehicle_type']], on='rider_id', how='left')
+    @kpis.node
+    def rider_tiers(delivered_orders):
+        """Classified rider stats with names, cities and vehicles, and the tier distribution."""
+        rider_stats = rider_performance(delivered_orders, by=['rider_id', 'rider_key'])
+        
+        # Look up rider names, cities and vehicles by surrogate key
+        for column in ['rider_name', 'city', 'vehicle_type']:
+            rider_stats[column] = take(riders[column], rider_stats['rider_key'])
+        
+        # Tier distribution
+        tier_dist = rider_stats['tier'].value_counts().reset_index()
+        tier_dist.columns = ['Tier', 'Count']
+        return rider_stats, tier_dist
     
-    # Tier distribution
-    tier_dist = rider_stats['tier'].value_counts().reset_index()
-    tier_dist.columns = ['Tier', 'Count']
+    # Calculate and classify rider stats
+    rider_stats, tier_dist = kpis['rider_tiers']
     
     tier_col1, tier_col2 = st.columns([1, 2])
     
@@ -1147,22 +1182,13 @@ else:  # Manager View
             'At Risk': theme['danger']
         }
         
-        fig_tier = px.pie(
-            tier_dist,
-            values='Count',
-            names='Tier',
+        fig_tier = cached_figure('fig_tier', lambda: pie_chart(
+            tier_dist['Tier'],
+            tier_dist['Count'],
+            template,
             title='Rider Tier Distribution',
-            template=theme['plotly_template'],
-            color='Tier',
-            color_discrete_map=tier_colors
-        )
-        fig_tier.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color=theme['text_primary'],
-            title_font_color=theme['text_primary'],
-            legend=dict(font=dict(color=theme['text_primary']))
-        )
+            colors=tier_dist['Tier'].map(tier_colors)
+        ))
         st.plotly_chart(fig_tier, use_container_width=True)
     
     with tier_col2:
@@ -1173,16 +1199,20 @@ else:  # Manager View
             index=0
         )
         
-        if selected_tier != 'All':
-            display_riders = rider_stats[rider_stats['tier'] == selected_tier]
-        else:
-            display_riders = rider_stats
+        def top_riders():
+            """The 15 riders of `selected_tier` with the best on-time rate."""
+            if selected_tier != 'All':
+                display_riders = rider_stats[rider_stats['tier'] == selected_tier]
+            else:
+                display_riders = rider_stats
+            
+            display_riders_table = display_riders[['rider_name', 'city', 'vehicle_type', 'deliveries', 'avg_time', 'on_time_rate', 'tier']]
+            display_riders_table.columns = ['Rider Name', 'City', 'Vehicle', 'Deliveries', 'Avg Time (mins)', 'On-Time %', 'Tier']
+            display_riders_table['Avg Time (mins)'] = display_riders_table['Avg Time (mins)'].round(1)
+            display_riders_table['On-Time %'] = display_riders_table['On-Time %'].round(1)
+            return display_riders_table.sort_values('On-Time %', ascending=False).head(15)
         
-        display_riders_table = display_riders[['rider_name', 'city', 'vehicle_type', 'deliveries', 'avg_time', 'on_time_rate', 'tier']]
-        display_riders_table.columns = ['Rider Name', 'City', 'Vehicle', 'Deliveries', 'Avg Time (mins)', 'On-Time %', 'Tier']
-        display_riders_table['Avg Time (mins)'] = display_riders_table['Avg Time (mins)'].round(1)
-        display_riders_table['On-Time %'] = display_riders_table['On-Time %'].round(1)
-        display_riders_table = display_riders_table.sort_values('On-Time %', ascending=False).head(15)
+        display_riders_table = cached('top_riders', top_riders, selected_tier)
         
         st.dataframe(
             display_riders_table,
@@ -0,0 +1,90 @@
+# =============================================================================
+# BitesUAE - Benchmark: delivery_performance classification
+# Row-by-row categorize_delivery (the old .apply) vs classify_delivery
+#
+# Usage:
+#   python benchmarks/bench_delivery_performance.py --rows 1000000
+# =============================================================================
+
+import argparse
+import importlib.util
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# The cleaner is a script with a numeric prefix, so load it by path
+CLEANER_PATH = Path(__file__).resolve().parents[1] / 'scripts' / '02_clean_data.py'
+spec = importlib.util.spec_from_file_location('clean_data', CLEANER_PATH)
+clean_data = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(clean_data)
+
+# Reference: the row-by-row classification the cleaner used before
+def categorize_delivery(row):
+    if pd.isna(row['delivered_time']):
+        return 'Not Delivered'
+    elif pd.isna(row['estimated_delivery_time']):
+        return 'Unknown'
+    elif row['delivered_time'] <= row['estimated_delivery_time']:
+        return 'On Time'
+    else:
+        delay_mins = (row['delivered_time'] - row['estimated_delivery_time']).total_seconds() / 60
+        if delay_mins <= 15:
+            return 'Late (<15 min)'
+        else:
+            return 'Late (>15 min)'
+
+def legacy_columns(delivery_events):
+    """delivery_performance and delay_minutes as the cleaner computed them before."""
+    performance = delivery_events.apply(categorize_delivery, axis=1)
+    delay_minutes = np.where(
+        delivery_events['delivered_time'] > delivery_events['estimated_delivery_time'],
+        (delivery_events['delivered_time'] - delivery_events['estimated_delivery_time']).dt.total_seconds() / 60,
+        0
+    ).round(2)
+    return performance, delay_minutes
+
+def make_events(rows, seed):
+    """Synthetic delivered/estimated timestamps on whole minutes, so the
+    on-time and 15-minute boundaries are hit exactly."""
+    rng = np.random.default_rng(seed)
+    placed = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 90 * 24 * 60, rows), unit='min')
+    estimated = pd.Series(placed + pd.to_timedelta(rng.integers(30, 51, rows), unit='min'))
+    delivered = pd.Series(placed + pd.to_timedelta(rng.integers(15, 91, rows), unit='min'))
+    delivered[rng.random(rows) < 0.10] = pd.NaT  # Cancelled / in progress
+    estimated[rng.random(rows) < 0.02] = pd.NaT  # Missing estimate
+    return pd.DataFrame({'delivered_time': delivered, 'estimated_delivery_time': estimated})
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark delivery_performance classification.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Events for the vectorized run")
+    parser.add_argument('--legacy-rows', type=int, default=100_000,
+                        help="Events for the row-by-row run (it is slow)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    events = make_events(args.rows, args.seed)
+    sample = events.head(args.legacy_rows)
+
+    (old_performance, old_delay), old_time = timed(legacy_columns, sample)
+    (new_performance, new_delay), new_time = timed(
+        clean_data.classify_delivery, events['delivered_time'], events['estimated_delivery_time']
+    )
+
+    # Output must match the row-by-row version exactly
+    n = len(sample)
+    assert (np.asarray(new_performance[:n], dtype=object) == old_performance.to_numpy(dtype=object)).all()
+    assert np.array_equal(new_delay[:n], old_delay)
+
+    print(f"Row-by-row apply:  {n:>10,} events in {old_time:7.3f}s ({n / old_time:>13,.0f} events/s)")
+    print(f"classify_delivery: {len(events):>10,} events in {new_time:7.3f}s ({len(events) / new_time:>13,.0f} events/s)")
+    print(f"Speed-up: {(len(events) / new_time) / (n / old_time):,.0f}x, identical output on {n:,} events")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# =============================================================================
+# BitesUAE - Benchmark: sidebar filters
+# Chained boolean-mask filters (the old APPLY FILTERS block) vs FilterIndex
+#
+# Usage:
+#   python benchmarks/bench_filters.py --rows 10000000
+# =============================================================================
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bitesuae.filters import FILTER_COLUMNS, FilterIndex, sort_by_date
+
+LABELS = {
+    'city': ['Dubai', 'Abu Dhabi', 'Sharjah', 'Ajman'],
+    'zone': [f'Zone {i}' for i in range(30)],
+    'cuisine_type': ['Indian', 'Asian', 'Western', 'Emirati', 'Healthy'],
+    'restaurant_tier': ['QSR', 'Casual Dining', 'Premium', 'Fine Dining'],
+    'time_of_day': ['Lunch (12-2 PM)', 'Peak (7-10 PM)', 'Off-Peak'],
+}
+FIRST_DAY = date(2024, 1, 1)
+DAYS = 270
+
+# Reference: the filters as app.py applied them before
+def legacy_filter(orders_full, start_date, end_date, selections):
+    filtered_orders = orders_full.copy()
+    filtered_orders = filtered_orders[
+        (filtered_orders['order_date'].dt.date >= start_date) &
+        (filtered_orders['order_date'].dt.date <= end_date)
+    ]
+    for column, labels in selections.items():
+        if labels:
+            filtered_orders = filtered_orders[filtered_orders[column].isin(labels)]
+    return filtered_orders
+
+def make_orders(rows, seed):
+    """Synthetic ORDERS_FULL filter columns with a few missing dates."""
+    rng = np.random.default_rng(seed)
+    order_date = pd.Series(pd.Timestamp(FIRST_DAY) + pd.to_timedelta(rng.integers(0, DAYS, rows), unit='D'))
+    order_date[rng.random(rows) < 0.001] = pd.NaT
+    orders = pd.DataFrame({'order_date': order_date})
+    for column, labels in LABELS.items():
+        orders[column] = pd.Categorical.from_codes(rng.integers(0, len(labels), rows), labels)
+    return orders
+
+def random_filters(rng):
+    """A sidebar state: a date range and a few labels (or none) per column."""
+    start = FIRST_DAY + timedelta(days=int(rng.integers(-5, DAYS)))
+    end = start + timedelta(days=int(rng.integers(0, DAYS)))
+    selections = {column: list(rng.choice(labels, rng.integers(0, len(labels)), replace=False))
+                  for column, labels in LABELS.items()}
+    return start, end, selections
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sidebar filter engine.")
+    parser.add_argument('--rows', type=int, default=10_000_000, help="Orders in the fact table")
+    parser.add_argument('--states', type=int, default=20, help="Random filter states to time")
+    parser.add_argument('--check-states', type=int, default=3,
+                        help="States also run through the chained masks to check output (they are slow)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    orders, build_time = timed(lambda: sort_by_date(make_orders(args.rows, args.seed)))
+    index, index_time = timed(FilterIndex, orders, FILTER_COLUMNS)
+    print(f"Fact table: {len(orders):,} rows; sorted in {build_time:.2f}s, indexed in {index_time:.2f}s")
+
+    rng = np.random.default_rng(args.seed)
+    states = [random_filters(rng) for _ in range(args.states)]
+    select_times = [timed(index.select, start, end, **selections)[1] for start, end, selections in states]
+
+    for start, end, selections in states[:args.check_states]:
+        old, old_time = timed(legacy_filter, orders, start, end, selections)
+        new, apply_time = timed(index.apply, orders, start, end, **selections)
+        # Output must match the chained masks exactly
+        assert new.index.equals(old.index)
+        print(f"   {len(old):>12,} rows: chained masks {old_time * 1000:9.1f} ms, "
+              f"FilterIndex.apply {apply_time * 1000:7.1f} ms")
+
+    print(f"FilterIndex.select over {len(states)} states: median {np.median(select_times) * 1000:.2f} ms, "
+          f"max {max(select_times) * 1000:.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# =============================================================================
+# BitesUAE - Benchmark: incremental cleaning
+# A full clean of the raw tables vs an incremental run appending the newest
+# orders and the late events of stored orders to an existing store
+#
+# Usage:
+#   python benchmarks/bench_incremental.py --split 0.8 --late 0.05
+#   python benchmarks/bench_incremental.py --input data/raw   # generator Parquet output
+# =============================================================================
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from bitesuae.cube import build_cube, rollup
+from bitesuae.facts import EVENT_COLUMNS, ORDER_COLUMNS, RESTAURANT_COLUMNS, build_orders_full
+from bitesuae.metrics import average, on_time_percent
+from bitesuae.schema import store_types
+from bitesuae.store import FACT_TABLE, TABLES, read_state, read_table
+
+GROSS_CAP = 1500  # outlier threshold of scripts/02_clean_data.py
+
+def run(script, *args):
+    """Run a pipeline script; return its wall time."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT / 'scripts' / script), *map(str, args)],
+                   check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def first_batch(raw_dir, batch_dir, split, late, seed):
+    """Write the raw orders up to the `split` quantile of order_datetime, holding
+    back a `late` share of their events; returns the held-back order IDs."""
+    rng = np.random.default_rng(seed)
+    orders = pd.read_parquet(raw_dir / 'ORDERS.parquet')
+    cutoff = orders['order_datetime'].quantile(split)
+    batch_ids = orders.loc[orders['order_datetime'] <= cutoff, 'order_id']
+
+    events = pd.read_parquet(raw_dir / 'DELIVERY_EVENTS.parquet')
+    events = events[events['order_id'].isin(batch_ids)]
+    held_back = events['order_id'].drop_duplicates().sample(frac=late, random_state=rng)
+
+    batch_dir.mkdir(parents=True)
+    for table in TABLES:
+        df = pd.read_parquet(raw_dir / f'{table}.parquet')
+        if 'order_id' in df.columns:
+            df = df[df['order_id'].isin(batch_ids)]
+        if table == 'DELIVERY_EVENTS':
+            df = df[~df['order_id'].isin(held_back)]
+        df.to_parquet(batch_dir / f'{table}.parquet', index=False)
+    return held_back
+
+def delivery_kpis(store_dir):
+    """The dashboard's headline delivery KPIs from a store's ORDERS_FULL."""
+    cube = build_cube(read_table(FACT_TABLE, store_dir))
+    totals = rollup(cube[cube['order_status'] == 'Delivered'])
+    return {'on_time_rate': on_time_percent(totals), 'avg_delivery_mins': average(totals, 'actual_delivery_time_mins')}
+
+def rebuilt_orders_full(store_dir):
+    """ORDERS_FULL built from scratch from a store's cleaned tables."""
+    facts = build_orders_full(read_table('ORDERS', store_dir, ORDER_COLUMNS),
+                              read_table('RESTAURANTS', store_dir, RESTAURANT_COLUMNS),
+                              read_table('RIDERS', store_dir, ['rider_id']),
+                              read_table('DELIVERY_EVENTS', store_dir, EVENT_COLUMNS))
+    return store_types(facts, FACT_TABLE)
+
+def by_order(facts):
+    return facts.sort_values('order_id', ignore_index=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark incremental cleaning against a full clean.")
+    parser.add_argument('--input', type=Path, help="Generator Parquet output (default: generate 1x data)")
+    parser.add_argument('--split', type=float, default=0.8, help="Share of orders in the first batch")
+    parser.add_argument('--late', type=float, default=0.05, help="Share of first-batch events held back")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as work:
+        work = Path(work)
+        raw_dir = args.input
+        if raw_dir is None:
+            raw_dir = work / 'raw'
+            run('01_generate_data.py', '--seed', args.seed, '--format', 'parquet', '--output-dir', raw_dir)
+        held_back = first_batch(raw_dir, work / 'batch', args.split, args.late, args.seed)
+
+        full_time = run('02_clean_data.py', '--input', raw_dir, '--output-dir', work / 'full', '--seed', args.seed)
+        run('02_clean_data.py', '--input', work / 'batch', '--output-dir', work / 'inc', '--seed', args.seed)
+        store_dir = work / 'inc' / 'store'
+        before = delivery_kpis(store_dir)
+        inc_time = run('02_clean_data.py', '--input', raw_dir, '--output-dir', work / 'inc',
+                       '--seed', args.seed, '--incremental')
+        after = delivery_kpis(store_dir)
+
+        # Appended and refreshed fact rows must match a rebuild from the stored tables
+        facts, rebuilt = by_order(read_table(FACT_TABLE, store_dir)), by_order(rebuilt_orders_full(store_dir))
+        assert facts['order_id'].is_unique and len(facts) == len(rebuilt)
+        for column in rebuilt.columns:
+            assert facts[column].astype(object).equals(rebuilt[column].astype(object)), column
+
+        # Late events of stored orders reach the dashboard
+        late_rows = facts[facts['order_id'].isin(held_back)]
+        assert late_rows['delivery_performance'].notna().all()
+        assert after != before
+
+        # Outliers of both batches are capped to the fill kept in the store's state
+        raw_orders = pd.read_parquet(raw_dir / 'ORDERS.parquet').drop_duplicates('order_id')
+        outliers = facts['order_id'].isin(raw_orders.loc[raw_orders['gross_amount'] > GROSS_CAP, 'order_id'])
+        full_facts = by_order(read_table(FACT_TABLE, work / 'full' / 'store'))
+        assert full_facts['order_id'].equals(facts['order_id'])
+        assert (facts.loc[outliers, 'gross_amount'] == np.float32(read_state(store_dir)['gross_fill'])).all()
+        assert full_facts.loc[~outliers, 'gross_amount'].equals(facts.loc[~outliers, 'gross_amount'])
+        assert full_facts['discount_amount'].equals(facts['discount_amount'])
+
+    print(f"Full clean:           {full_time:7.2f}s")
+    print(f"Incremental run:      {inc_time:7.2f}s ({1 - args.split:.0%} new orders, "
+          f"{len(held_back):,} late events of stored orders)")
+    print(f"On-time rate:         {before['on_time_rate']:.2f}% -> {after['on_time_rate']:.2f}% after the late events")
+    print(f"Avg delivery time:    {before['avg_delivery_mins']:.2f} -> {after['avg_delivery_mins']:.2f} mins")
+
+if __name__ == '__main__':
+    main()
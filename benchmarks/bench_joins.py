@@ -0,0 +1,116 @@
+# =============================================================================
+# BitesUAE - Benchmark: ORDERS_FULL joins
+# Hash joins on string IDs (the old pandas merges) vs surrogate-key gathers
+# in bitesuae/schema.py, for the restaurant and delivery event columns
+#
+# Usage:
+#   python benchmarks/bench_joins.py --rows 1000000
+# =============================================================================
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bitesuae.facts import EVENT_COLUMNS, ORDER_COLUMNS, RESTAURANT_COLUMNS
+from bitesuae.schema import surrogate_keys, take
+
+CUISINES = ['Indian', 'Asian', 'Western', 'Emirati', 'Healthy']
+PERFORMANCE = ['On Time', 'Late (<15 min)', 'Late (>15 min)']
+
+# Reference: the joins as they were written before
+def merge_joins(orders, restaurants, delivery_events):
+    return (
+        orders[ORDER_COLUMNS]
+        .merge(restaurants[RESTAURANT_COLUMNS], on='restaurant_id', how='left')
+        .merge(delivery_events[EVENT_COLUMNS], on='order_id', how='left')
+    )
+
+def gather_joins(orders, restaurants, delivery_events):
+    facts = orders[ORDER_COLUMNS].reset_index(drop=True)
+    restaurant_key = surrogate_keys(facts['restaurant_id'], restaurants['restaurant_id'])
+    event_key = surrogate_keys(facts['order_id'], delivery_events['order_id'])
+    for column in RESTAURANT_COLUMNS[1:]:
+        facts[column] = take(restaurants[column], restaurant_key)
+    for column in EVENT_COLUMNS[1:]:
+        facts[column] = take(delivery_events[column], event_key)
+    return facts
+
+def make_tables(rows, seed):
+    """Synthetic cleaned ORDERS, RESTAURANTS and DELIVERY_EVENTS in shuffled ID order."""
+    rng = np.random.default_rng(seed)
+    n_restaurants = max(rows // 50, 1)
+    order_ids = pd.Series([f'ORD_{i:08d}' for i in range(1, rows + 1)], dtype='str')
+    placed = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 270 * 86400, rows), unit='s')
+
+    restaurants = pd.DataFrame({
+        'restaurant_id': pd.Series([f'REST_{i:05d}' for i in rng.permutation(n_restaurants) + 1], dtype='str'),
+        'city': pd.Categorical.from_codes(rng.integers(0, 4, n_restaurants), ['Abu Dhabi', 'Ajman', 'Dubai', 'Sharjah']),
+        'zone': pd.Categorical.from_codes(rng.integers(0, 30, n_restaurants), [f'Zone {i:02d}' for i in range(30)]),
+        'cuisine_type': pd.Categorical.from_codes(rng.integers(0, 5, n_restaurants), CUISINES),
+        'restaurant_tier': pd.Categorical.from_codes(rng.integers(0, 4, n_restaurants),
+                                                     ['Casual Dining', 'Fine Dining', 'Premium', 'QSR']),
+        'restaurant_name': pd.Series([f'Restaurant {i}' for i in range(n_restaurants)], dtype='str'),
+        'rating': rng.uniform(3, 5, n_restaurants).round(1),
+        'avg_prep_time_mins': rng.integers(10, 40, n_restaurants),
+    })
+    orders = pd.DataFrame({
+        'order_id': order_ids,
+        'customer_id': pd.Series([f'CUST_{i:06d}' for i in rng.integers(1, rows // 3 + 2, rows)], dtype='str'),
+        'restaurant_id': restaurants['restaurant_id'].to_numpy()[rng.integers(0, n_restaurants, rows)],
+        'order_datetime': placed,
+        'order_date': placed.normalize(),
+        'order_status': pd.Categorical.from_codes(rng.choice(2, rows, p=[0.9, 0.1]), ['Delivered', 'Cancelled']),
+        'gross_amount': rng.gamma(4, 25, rows).round(2),
+        'discount_amount': 0.0,
+        'net_amount': 0.0,
+        'promo_code': pd.Categorical([None] * rows, categories=['SAVE10']),
+        'cancellation_reason': pd.Categorical([None] * rows, categories=['Changed Mind']),
+    })
+    events = rng.permutation(rows)
+    minutes = lambda low, high: pd.to_timedelta(rng.integers(low, high, rows), unit='m')
+    delivery_events = pd.DataFrame({
+        'order_id': order_ids.to_numpy()[events],
+        'rider_id': pd.Series([f'RDR_{i:05d}' for i in rng.integers(1, rows // 200 + 2, rows)], dtype='str'),
+        'actual_delivery_time_mins': rng.normal(38, 10, rows).round(1),
+        'order_placed_time': placed[events],
+        'restaurant_confirmed_time': placed[events] + minutes(1, 5),
+        'food_ready_time': placed[events] + minutes(10, 30),
+        'rider_picked_up_time': placed[events] + minutes(30, 35),
+        'delivered_time': placed[events] + minutes(35, 70),
+        'estimated_delivery_time': placed[events] + minutes(30, 50),
+        'delay_reason': pd.Categorical([None] * rows, categories=['High Traffic']),
+        'delivery_performance': pd.Categorical.from_codes(rng.choice(3, rows, p=[0.7, 0.2, 0.1]), PERFORMANCE),
+    })
+    return orders, restaurants, delivery_events
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ORDERS_FULL joins.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Orders to join")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    tables = make_tables(args.rows, args.seed)
+    old, old_time = timed(merge_joins, *tables)
+    new, new_time = timed(gather_joins, *tables)
+
+    # Output must match the merges exactly
+    assert list(old.columns) == list(new.columns)
+    for column in old.columns:
+        assert old[column].astype(object).equals(new[column].astype(object)), column
+
+    print(f"String-ID merges:      {args.rows:>10,} orders in {old_time:7.3f}s")
+    print(f"Surrogate-key gathers: {args.rows:>10,} orders in {new_time:7.3f}s")
+    print(f"Speed-up: {old_time / new_time:,.1f}x, identical joined columns")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# =============================================================================
+# BitesUAE - Benchmark: Manager view metrics
+# Per-group Python lambdas (the old groupby().apply / agg code) vs the
+# native groupby kernels in bitesuae/metrics.py
+#
+# Usage:
+#   python benchmarks/bench_manager_metrics.py --rows 1000000
+# =============================================================================
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bitesuae.metrics import group_mode, on_time_flag, rider_performance
+
+PERFORMANCE = ['On Time', 'Late (<15 min)', 'Late (>15 min)']
+DELAY_REASONS = ['Restaurant Prep Delay', 'High Traffic', 'Rider Delayed at Pickup', 'Wrong Address', 'Weather']
+
+# Reference: the Manager view metrics as app.py computed them before
+def classify_rider_tier(avg_time, on_time_rate):
+    if avg_time < 25 and on_time_rate > 90:
+        return 'Star Rider'
+    elif avg_time < 35 and on_time_rate > 75:
+        return 'Good Rider'
+    elif avg_time > 45 or on_time_rate < 60:
+        return 'At Risk'
+    else:
+        return 'Needs Improvement'
+
+def legacy_metrics(delivered_orders):
+    daily = delivered_orders.groupby(delivered_orders['order_date'].dt.date).apply(
+        lambda x: (x['delivery_performance'] == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
+    )
+    hourly = delivered_orders.groupby('order_hour').apply(
+        lambda x: (x['delivery_performance'] == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
+    )
+    problem_areas = delivered_orders.groupby('zone', observed=True).agg({
+        'order_id': 'count',
+        'delivery_performance': lambda x: (x != 'On Time').sum(),
+        'actual_delivery_time_mins': 'mean',
+        'delay_reason': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'N/A'
+    })
+    rider_stats = delivered_orders.groupby('rider_id').agg({
+        'order_id': 'count',
+        'actual_delivery_time_mins': 'mean',
+        'delivery_performance': lambda x: (x == 'On Time').sum() / len(x) * 100 if len(x) > 0 else 0
+    }).reset_index()
+    rider_stats.columns = ['rider_id', 'deliveries', 'avg_time', 'on_time_rate']
+    rider_stats['tier'] = rider_stats.apply(
+        lambda x: classify_rider_tier(x['avg_time'], x['on_time_rate']), axis=1
+    )
+    return daily, hourly, problem_areas, rider_stats
+
+def native_metrics(delivered_orders):
+    by_date = delivered_orders.groupby('order_date')['is_on_time'].mean() * 100
+    by_date.index = by_date.index.date
+    hourly = delivered_orders.groupby('order_hour')['is_on_time'].mean() * 100
+    zones = delivered_orders.groupby('zone', observed=True)
+    problem_areas = pd.DataFrame({
+        'order_id': zones['order_id'].count(),
+        'delivery_performance': zones['is_on_time'].count() - zones['is_on_time'].sum(),
+        'actual_delivery_time_mins': zones['actual_delivery_time_mins'].mean(),
+        'delay_reason': group_mode(delivered_orders, 'zone', 'delay_reason')
+    })
+    return by_date, hourly, problem_areas, rider_performance(delivered_orders)
+
+def make_orders(rows, seed):
+    """Synthetic delivered ORDERS_FULL rows with the Manager view's columns."""
+    rng = np.random.default_rng(seed)
+    performance = pd.Categorical.from_codes(rng.choice(3, rows, p=[0.7, 0.2, 0.1]), PERFORMANCE)
+    delay_reason = pd.Series(pd.Categorical.from_codes(rng.integers(0, len(DELAY_REASONS), rows),
+                                                       sorted(DELAY_REASONS)))
+    delay_reason[performance == 'On Time'] = np.nan
+    orders = pd.DataFrame({
+        'order_id': [f'ORD_{i:08d}' for i in range(rows)],
+        'order_date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 270, rows), unit='D'),
+        'order_hour': rng.integers(0, 24, rows),
+        'zone': pd.Categorical.from_codes(rng.integers(0, 30, rows), [f'Zone {i:02d}' for i in range(30)]),
+        'rider_id': [f'RDR_{i:05d}' for i in rng.integers(0, max(rows // 200, 1), rows)],
+        'actual_delivery_time_mins': rng.normal(38, 10, rows).round(1),
+        'delivery_performance': performance,
+        'delay_reason': delay_reason,
+    })
+    orders['is_on_time'] = on_time_flag(orders['delivery_performance'])
+    return orders
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Manager view metrics.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Delivered orders")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    orders = make_orders(args.rows, args.seed)
+    old, old_time = timed(legacy_metrics, orders)
+    new, new_time = timed(native_metrics, orders)
+
+    # Output must match the lambdas exactly
+    for name, before, after in zip(['daily', 'hourly'], old[:2], new[:2]):
+        assert np.allclose(before.to_numpy(), after.to_numpy(), rtol=0, atol=1e-9), name
+    old_areas, new_areas = old[2], new[2]
+    assert (old_areas.index == new_areas.index).all()
+    assert (old_areas['order_id'] == new_areas['order_id']).all()
+    assert (old_areas['delivery_performance'] == new_areas['delivery_performance']).all()
+    assert np.allclose(old_areas['actual_delivery_time_mins'], new_areas['actual_delivery_time_mins'])
+    assert (old_areas['delay_reason'].astype(str) == new_areas['delay_reason'].astype(str)).all()
+    assert old[3]['rider_id'].equals(new[3]['rider_id'])
+    assert np.allclose(old[3]['on_time_rate'], new[3]['on_time_rate'])
+    assert (old[3]['tier'].astype(str) == new[3]['tier'].astype(str)).all()
+
+    print(f"Per-group lambdas: {len(orders):>10,} orders in {old_time:7.3f}s")
+    print(f"Native kernels:    {len(orders):>10,} orders in {new_time:7.3f}s")
+    print(f"Speed-up: {old_time / new_time:,.1f}x, identical daily/hourly rates, problem areas and rider tiers")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+# =============================================================================
+# BitesUAE - Shared modules for the data pipeline scripts and the dashboard
+# =============================================================================
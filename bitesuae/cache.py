@@ -0,0 +1,107 @@
+# =============================================================================
+# BitesUAE - Aggregate & Figure Cache
+# Dashboard aggregates and figures memoised by filter state, shared by every
+# session. Entries are evicted least-recently-used first once their estimated
+# size passes a memory cap, so revisiting a filter combination is a lookup
+# while the cache stays bounded however many combinations are explored.
+# =============================================================================
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+def _normalise(value):
+    """Hashable form of a filter value that ignores selection order and duplicates."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _normalise(item)) for key, item in value.items()))
+    labels = sorted({str(label) for label in value})
+    return tuple(labels) if labels else None
+
+
+def filter_key(*values, **selections):
+    """Hash of a filter state, e.g. filter_key(start, end, city=['Dubai'], zone=None).
+
+    Selections are compared as sets and an empty selection equals None, so
+    any two filter states selecting the same rows hash the same.
+    """
+    state = (tuple(_normalise(value) for value in values), _normalise(selections))
+    return hashlib.blake2b(repr(state).encode(), digest_size=16).hexdigest()
+
+
+def size_of(value):
+    """Estimated resident size of a cached value in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, 'to_plotly_json'):
+        return size_of(value.to_plotly_json())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(size_of(key) + size_of(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(size_of(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache holding at most `max_mb` of values.
+
+    Values are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, max_mb):
+        self.max_bytes = int(max_mb * 1e6)
+        self.entries = OrderedDict()  # key -> (value, size)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get_or_compute(self, key, compute):
+        """Return the value cached under `key`, calling compute() to fill it on a miss."""
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+            self.misses += 1
+        # Computed outside the lock, so a slow entry never blocks other sessions
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        """Cache `value` under `key`, evicting the least recently used entries over the cap."""
+        size = size_of(value)
+        with self._lock:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
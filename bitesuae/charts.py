@@ -0,0 +1,137 @@
+# =============================================================================
+# BitesUAE - Chart Builders
+# Plotly figures built straight from pre-aggregated arrays. Theme styling
+# (transparent backgrounds, text and grid colours) lives in one cached
+# template per dashboard theme instead of per-figure update_layout calls,
+# and long time series are thinned with LTTB so a figure's payload stays
+# bounded however wide the date range is.
+# =============================================================================
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Most points a line trace sends to the browser
+MAX_POINTS = 500
+
+TRANSPARENT = 'rgba(0,0,0,0)'
+
+
+@lru_cache(maxsize=None)
+def _template(base, text_color, grid_color):
+    template = go.layout.Template(pio.templates[base])
+    template.layout.update(
+        plot_bgcolor=TRANSPARENT,
+        paper_bgcolor=TRANSPARENT,
+        font_color=text_color,
+        title_font_color=text_color,
+        legend_font_color=text_color,
+        xaxis_gridcolor=grid_color,
+        yaxis_gridcolor=grid_color
+    )
+    return template
+
+
+def theme_template(theme):
+    """Plotly template for a THEMES entry, built once per theme."""
+    return _template(theme['plotly_template'], theme['text_primary'], theme['grid_color'])
+
+
+def lttb(x, y, threshold=MAX_POINTS):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps of a series.
+
+    The first and last points are always kept; every bucket in between
+    keeps the point forming the largest triangle with the point kept
+    before it and the average of the next bucket. Missing y values count
+    as zero when choosing points.
+    """
+    n = len(y)
+    if n <= threshold or threshold < 3:
+        return np.arange(n)
+    x, y = np.asarray(x, dtype=float), np.nan_to_num(np.asarray(y, dtype=float))
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        following = slice(end, edges[bucket + 2] if bucket + 2 < len(edges) else n)
+        next_x, next_y = x[following].mean(), y[following].mean()
+        prev_x, prev_y = x[kept[bucket]], y[kept[bucket]]
+        areas = np.abs((prev_x - next_x) * (y[start:end] - prev_y) - (prev_x - x[start:end]) * (next_y - prev_y))
+        kept[bucket + 1] = start + int(areas.argmax())
+    return kept
+
+
+def _time_axis(x):
+    """Numeric x positions for LTTB, for dates as well as numbers."""
+    x = np.asarray(x)
+    if x.dtype == object:
+        x = x.astype('datetime64[D]')
+    return x.astype('datetime64[s]').astype(float) if np.issubdtype(x.dtype, np.datetime64) else x
+
+
+def line_chart(x, lines, template, title, x_label='x', y_label='y', **layout):
+    """Line chart of one or more series sharing `x`, thinned with LTTB.
+
+    `lines` are dicts of go.Scatter properties with a `y` array each; the
+    points kept are chosen on the first series and used for all of them.
+    """
+    kept = lttb(_time_axis(x), lines[0]['y'])
+    figure = go.Figure(layout=dict(template=template, title=title, **layout))
+    for line in lines:
+        trace = {'mode': 'lines', 'name': '', 'showlegend': False,
+                 'hovertemplate': f'{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>', **line}
+        trace['x'], trace['y'] = np.asarray(x)[kept], np.asarray(line['y'])[kept]
+        figure.add_trace(go.Scatter(**trace))
+    return figure
+
+
+def bar_chart(x, y, template, title, x_label='x', y_label='y', colorscale=None, orientation='v', **layout):
+    """Single-series bar chart; `colorscale` colours bars by value."""
+    values = x if orientation == 'h' else y
+    marker = {'color': values, 'colorscale': colorscale} if colorscale else {}
+    figure = go.Figure(layout=dict(template=template, title=title, **layout))
+    figure.add_trace(go.Bar(
+        x=x, y=y, orientation=orientation, marker=marker, name='', showlegend=False,
+        hovertemplate=f'{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>'
+    ))
+    return figure
+
+
+def grouped_bar_chart(x, groups, template, title, colors, barmode='group', x_label='x', y_label='y', **layout):
+    """Bar chart with one trace per `groups` entry ({name: y}), grouped or stacked."""
+    figure = go.Figure(layout=dict(template=template, title=title, barmode=barmode, **layout))
+    for (name, y), color in zip(groups.items(), colors):
+        figure.add_trace(go.Bar(
+            x=x, y=y, name=name, marker_color=color, legendgroup=name, offsetgroup=name if barmode == 'group' else None,
+            hovertemplate=f'{name}<br>{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>'
+        ))
+    return figure
+
+
+def pie_chart(labels, values, template, title, colors, hole=0, **layout):
+    """Pie (or donut, with `hole`) chart of values per label."""
+    figure = go.Figure(layout=dict(template=template, title=title, **layout))
+    figure.add_trace(go.Pie(
+        labels=labels, values=values, marker_colors=colors, hole=hole, name='',
+        hovertemplate='%{label}<br>%{value}<extra></extra>'
+    ))
+    return figure
+
+
+def pareto_chart(labels, counts, template, title, bar_color, line_color, **layout):
+    """Counts in descending order with their cumulative percentage on a second axis."""
+    counts = np.asarray(counts)
+    cumulative = counts.cumsum() / counts.sum() * 100
+    figure = go.Figure(layout=dict(
+        template=template, title=title,
+        yaxis=dict(title_text='Count'),
+        yaxis2=dict(title_text='Cumulative %', overlaying='y', side='right'),
+        **layout
+    ))
+    figure.add_trace(go.Bar(name='Count', x=labels, y=counts, marker_color=bar_color))
+    figure.add_trace(go.Scatter(name='Cumulative %', x=labels, y=cumulative, yaxis='y2',
+                                mode='lines+markers', marker_color=line_color, line=dict(width=2)))
+    return figure
@@ -0,0 +1,60 @@
+# =============================================================================
+# BitesUAE - KPI Cube
+# ORDERS_FULL pre-aggregated over date x hour x city x zone x cuisine x
+# tier x status, with additive measures only (sums and counts). Dashboard
+# KPIs and breakdowns roll cells up instead of scanning orders; averages and
+# rates are ratios of rolled-up sums (bitesuae/metrics.py). Metrics that are not additive, like
+# repeat-customer rate or the most common delay reason, still scan rows.
+# =============================================================================
+
+from bitesuae.facts import time_of_day
+from bitesuae.filters import sort_by_date
+
+CUBE_DIMENSIONS = [
+    'order_date', 'order_hour', 'city', 'zone', 'cuisine_type', 'restaurant_tier', 'order_status'
+]
+
+# Columns summed into each cell; those in AVERAGED_MEASURES also get a
+# <measure>_count of non-missing values so their means can be rolled up
+SUMMED_MEASURES = [
+    'gross_amount', 'net_amount', 'discount_amount',
+    'actual_delivery_time_mins', 'prep_time_mins', 'rider_time_mins'
+]
+AVERAGED_MEASURES = ['gross_amount', 'actual_delivery_time_mins', 'prep_time_mins', 'rider_time_mins']
+
+
+def build_cube(facts):
+    """Aggregate ORDERS_FULL into one row per non-empty cell, sorted by date."""
+    aggregations = {'orders': ('order_id', 'size'), 'on_time': ('is_on_time', 'sum')}
+    for measure in SUMMED_MEASURES:
+        aggregations[measure] = (measure, 'sum')
+    for measure in AVERAGED_MEASURES:
+        aggregations[f'{measure}_count'] = (measure, 'count')
+
+    cube = (
+        facts.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, sort=False)
+        .agg(**aggregations)
+        .reset_index()
+    )
+    # Cells hold a few float32 amounts each; roll them up in float64
+    cube[SUMMED_MEASURES] = cube[SUMMED_MEASURES].astype('float64')
+    # Derived from the hour, so it filters the cube without adding cells
+    cube['time_of_day'] = time_of_day(cube['order_hour'])
+    return sort_by_date(cube)
+
+
+def measures(cube):
+    """Names of the cube's measure columns."""
+    return [column for column in cube.columns if column not in CUBE_DIMENSIONS + ['time_of_day']]
+
+
+def rollup(cube, by=None, values=None):
+    """Sum measures over all cells (a Series) or per `by` group (a DataFrame).
+
+    `values` limits the roll-up to the named measures; by default all are summed.
+    """
+    values = measures(cube) if values is None else values
+    if by is None:
+        return cube[values].sum()
+    return cube.groupby(by, observed=True)[values].sum()
+
@@ -0,0 +1,82 @@
+# =============================================================================
+# BitesUAE - Analytical Fact Table
+# ORDERS_FULL is one row per order joined with its restaurant and delivery
+# event, plus the columns the dashboard derives and surrogate keys into
+# RESTAURANTS and RIDERS. scripts/02_clean_data.py publishes it to the
+# store so app.py only filters.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+from bitesuae.filters import sort_by_date
+from bitesuae.metrics import on_time_flag
+from bitesuae.schema import store_types, surrogate_keys, take
+from bitesuae.store import FACT_TABLE
+
+ORDER_COLUMNS = [
+    'order_id', 'customer_id', 'restaurant_id', 'order_datetime', 'order_date',
+    'order_status', 'gross_amount', 'discount_amount', 'net_amount',
+    'promo_code', 'cancellation_reason'
+]
+
+RESTAURANT_COLUMNS = [
+    'restaurant_id', 'city', 'zone', 'cuisine_type', 'restaurant_tier',
+    'restaurant_name', 'rating', 'avg_prep_time_mins'
+]
+
+EVENT_COLUMNS = [
+    'order_id', 'rider_id', 'actual_delivery_time_mins', 'delivered_time',
+    'estimated_delivery_time', 'delay_reason', 'delivery_performance',
+    'restaurant_confirmed_time', 'food_ready_time', 'rider_picked_up_time',
+    'order_placed_time'
+]
+
+# (label, first hour, last hour); other hours are Off-Peak
+TIME_OF_DAY = [
+    ('Lunch (12-2 PM)', 12, 14),
+    ('Peak (7-10 PM)', 19, 22),
+]
+OFF_PEAK = 'Off-Peak'
+
+
+def time_of_day(hours):
+    """Categorize order hours into times of day."""
+    hours = np.asarray(hours)
+    labels = [label for label, _, _ in TIME_OF_DAY] + [OFF_PEAK]
+    codes = np.select([(hours >= first) & (hours <= last) for _, first, last in TIME_OF_DAY],
+                      list(range(len(TIME_OF_DAY))), default=len(TIME_OF_DAY))
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def minutes_between(start, end):
+    """Minutes from one timestamp column to another."""
+    return (pd.to_datetime(end) - pd.to_datetime(start)).dt.total_seconds() / 60
+
+
+def build_orders_full(orders, restaurants, riders, delivery_events):
+    """Join orders with their restaurant and delivery event and add the derived columns.
+
+    Each join is a gather by surrogate key (bitesuae/schema.py), so it is
+    one array pass per column instead of a hash join on string IDs. The
+    restaurant_key and rider_key columns point at RESTAURANTS and RIDERS rows.
+    """
+    facts = orders[ORDER_COLUMNS].reset_index(drop=True)
+    restaurant_key = surrogate_keys(facts['restaurant_id'], restaurants['restaurant_id'])
+    event_key = surrogate_keys(facts['order_id'], delivery_events['order_id'])
+    for column in RESTAURANT_COLUMNS[1:]:
+        facts[column] = take(restaurants[column], restaurant_key)
+    for column in EVENT_COLUMNS[1:]:
+        facts[column] = take(delivery_events[column], event_key)
+    facts = store_types(facts, FACT_TABLE)
+
+    facts['order_hour'] = facts['order_datetime'].dt.hour
+    facts['time_of_day'] = time_of_day(facts['order_hour'])
+    facts['order_week'] = facts['order_datetime'].dt.to_period('W').astype(str).astype('category')
+    facts['prep_time_mins'] = minutes_between(facts['restaurant_confirmed_time'], facts['food_ready_time'])
+    facts['rider_time_mins'] = minutes_between(facts['rider_picked_up_time'], facts['delivered_time'])
+    facts['is_on_time'] = on_time_flag(facts['delivery_performance'])
+    facts['restaurant_key'] = restaurant_key
+    facts['rider_key'] = surrogate_keys(facts['rider_id'], riders['rider_id'])
+    # Date order lets the dashboard's FilterIndex binary-search date ranges
+    return sort_by_date(facts)
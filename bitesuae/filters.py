@@ -0,0 +1,90 @@
+# =============================================================================
+# BitesUAE - Sidebar Filter Engine
+# Precomputed row bitmaps over ORDERS_FULL: one packed bitmap per label of
+# each filter column, and the table sorted by order_date so a date range is
+# a binary search. A filter state is answered by OR-ing and AND-ing bitmaps
+# inside the date range, without touching the other columns.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+
+# Label columns the sidebar filters on
+FILTER_COLUMNS = ['city', 'zone', 'cuisine_type', 'restaurant_tier', 'time_of_day']
+
+DATE_COLUMN = 'order_date'
+
+
+def sort_by_date(facts, column=DATE_COLUMN):
+    """Return the fact table ordered by date (missing dates last), without copying if it already is."""
+    dates = facts[column]
+    valid = dates.notna().to_numpy()
+    if valid[:valid.sum()].all() and dates[valid].is_monotonic_increasing:
+        return facts
+    return facts.sort_values(column, kind='stable', na_position='last', ignore_index=True)
+
+
+class FilterIndex:
+    """Row bitmaps for FILTER_COLUMNS and a sorted date index over one fact table."""
+
+    def __init__(self, facts, columns=FILTER_COLUMNS, date_column=DATE_COLUMN):
+        self.size = len(facts)
+        self.dates = facts[date_column].to_numpy(dtype='datetime64[ns]')
+        # Missing dates sort last and never match a date range
+        self.dated = int((~np.isnat(self.dates)).sum())
+        dated = self.dates[:self.dated]
+        if np.isnat(dated).any() or np.any(dated[1:] < dated[:-1]):
+            raise ValueError(f"facts must be sorted by {date_column}; use sort_by_date()")
+
+        # {column: {label: packed bitmap of the rows holding that label}}
+        self.bitmaps = {}
+        for column in columns:
+            labels = pd.Categorical(facts[column])
+            self.bitmaps[column] = {
+                label: np.packbits(labels.codes == code)
+                for code, label in enumerate(labels.categories)
+            }
+
+    def date_bounds(self, start=None, end=None):
+        """Row range [lo, hi) of dates from `start` to `end`, both inclusive days.
+
+        With neither bound every row is in range, including undated ones.
+        """
+        if start is None and end is None:
+            return 0, self.size
+        dates = self.dates[:self.dated]
+        lo = 0 if start is None else dates.searchsorted(np.datetime64(start, 'D'))
+        hi = self.dated if end is None else dates.searchsorted(np.datetime64(end, 'D') + 1)
+        return int(lo), int(max(hi, lo))
+
+    def select(self, start=None, end=None, **selections):
+        """Return the selected rows as (lo, hi, keep).
+
+        Rows lo:hi fall in the date range; `keep` is a boolean mask over
+        them, or None when only the date filter applies. `selections` map a
+        filter column to the labels to keep; None or an empty list leaves
+        that column unfiltered, as in the sidebar.
+        """
+        lo, hi = self.date_bounds(start, end)
+        first, last = lo // 8, -(-hi // 8)
+
+        mask = None
+        for column, labels in selections.items():
+            if not labels:
+                continue
+            bitmaps = self.bitmaps[column]
+            bits = np.zeros(last - first, dtype=np.uint8)
+            for label in labels:
+                if label in bitmaps:
+                    bits |= bitmaps[label][first:last]
+            mask = bits if mask is None else mask & bits
+
+        if mask is None:
+            return lo, hi, None
+        return lo, hi, np.unpackbits(mask, count=hi - first * 8)[lo - first * 8:].view(bool)
+
+    def apply(self, facts, start=None, end=None, **selections):
+        """Return the rows of `facts` matching the filters; a date-only filter is a view."""
+        lo, hi, keep = self.select(start, end, **selections)
+        rows = facts.iloc[lo:hi]
+        return rows if keep is None else rows[keep]
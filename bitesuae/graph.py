@@ -0,0 +1,76 @@
+# =============================================================================
+# BitesUAE - Lazy Metric Graph
+# Dashboard KPIs and the intermediates behind them as named nodes. A node is
+# a function whose parameter names are the nodes it depends on; it runs the
+# first time its value is read, after those dependencies, so a view only
+# computes the metrics it renders. Node values can also be kept in an
+# LRUCache (bitesuae/cache.py) under a filter-state key across reruns.
+# =============================================================================
+
+import inspect
+
+
+class MetricGraph:
+    """Lazily evaluated, dependency-tracked metric nodes for one filter state.
+
+    `inputs` are plain values that nodes may depend on. With a `cache`,
+    values of nodes registered with cache=True are stored under
+    (key, name) and reused by later graphs with the same key; the others,
+    such as filtered row frames, are recomputed when a run needs them.
+    """
+
+    def __init__(self, cache=None, key=None, **inputs):
+        self.cache = cache
+        self.key = key
+        self.functions = {}
+        self.cached = set()
+        self.values = dict(inputs)
+        self._evaluating = []
+
+    def node(self, function=None, *, cache=True):
+        """Register `function` as the node of its name; usable as @graph.node or @graph.node(cache=False)."""
+        def register(function):
+            name = function.__name__
+            if name in self.functions or name in self.values:
+                raise ValueError(f"node '{name}' is already defined")
+            self.functions[name] = function
+            if cache:
+                self.cached.add(name)
+            return function
+        return register if function is None else register(function)
+
+    def dependencies(self, function):
+        """Names of the nodes a function depends on: its parameters."""
+        return list(inspect.signature(function).parameters)
+
+    def call(self, function):
+        """Call `function` with the values of the nodes its parameters name."""
+        return function(*(self[name] for name in self.dependencies(function)))
+
+    def __contains__(self, name):
+        return name in self.functions or name in self.values
+
+    def __getitem__(self, name):
+        if name in self.values:
+            return self.values[name]
+        if name not in self.functions:
+            raise KeyError(f"unknown metric node '{name}'")
+        if name in self._evaluating:
+            cycle = ' -> '.join(self._evaluating[self._evaluating.index(name):] + [name])
+            raise ValueError(f"metric nodes depend on each other: {cycle}")
+
+        self._evaluating.append(name)
+        try:
+            compute = lambda: self.call(self.functions[name])
+            if self.cache is not None and name in self.cached:
+                value = self.cache.get_or_compute((self.key, name), compute)
+            else:
+                value = compute()
+        finally:
+            self._evaluating.pop()
+        self.values[name] = value
+        return value
+
+    def evaluated(self):
+        """Nodes whose values this graph has computed or fetched so far."""
+        return [name for name in self.values if name in self.functions]
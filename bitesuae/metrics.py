@@ -0,0 +1,68 @@
+# =============================================================================
+# BitesUAE - Delivery Metrics
+# Shared definitions for the on-time flag, rates and means built from
+# rolled-up sums, the most common value per group and rider tiers. All of
+# them run on native groupby kernels or numpy, never per-group lambdas.
+# =============================================================================
+
+import numpy as np
+
+ON_TIME = 'On Time'
+
+RIDER_TIERS = ['Star Rider', 'Good Rider', 'At Risk', 'Needs Improvement']
+
+
+def on_time_flag(delivery_performance):
+    """Boolean is_on_time column from delivery_performance."""
+    return delivery_performance == ON_TIME
+
+
+def average(totals, measure):
+    """Mean of a measure from rolled-up totals, skipping missing values like Series.mean()."""
+    return totals[measure] / totals[f'{measure}_count']
+
+
+def on_time_percent(totals):
+    """Percentage of orders delivered on time from rolled-up `orders` and `on_time` totals."""
+    return totals['on_time'] / totals['orders'] * 100
+
+
+def group_mode(df, by, column, default='N/A'):
+    """Most common `column` value per `by` group, like Series.mode().iloc[0] per group.
+
+    Ties go to the value that sorts first, as with Series.mode(). Groups
+    whose values are all missing get `default`.
+    """
+    counts = df.groupby([by, column], observed=True).size()
+    counts = counts[counts > 0].reset_index(name='count')
+    # A stable sort keeps each group's values in sorted order among equal counts
+    top = counts.sort_values('count', ascending=False, kind='stable').drop_duplicates(by)
+    modes = top.set_index(by)[column].astype(object)
+    groups = df.groupby(by, observed=True).size().index
+    return modes.reindex(groups).fillna(default)
+
+
+def rider_tiers(avg_time, on_time_rate):
+    """Classify riders into RIDER_TIERS from their average time and on-time %."""
+    avg_time, on_time_rate = np.asarray(avg_time, dtype=float), np.asarray(on_time_rate, dtype=float)
+    conditions = [
+        (avg_time < 25) & (on_time_rate > 90),
+        (avg_time < 35) & (on_time_rate > 75),
+        (avg_time > 45) | (on_time_rate < 60),
+    ]
+    return np.select(conditions, RIDER_TIERS[:3], default=RIDER_TIERS[3])
+
+
+def rider_performance(delivered_orders, by='rider_id'):
+    """Deliveries, average time and on-time % per rider, with their tier.
+
+    `by` may add columns that are fixed per rider, like its surrogate key.
+    """
+    stats = delivered_orders.groupby(by).agg(
+        deliveries=('order_id', 'count'),
+        avg_time=('actual_delivery_time_mins', 'mean'),
+        on_time_rate=('is_on_time', 'mean')
+    ).reset_index()
+    stats['on_time_rate'] *= 100
+    stats['tier'] = rider_tiers(stats['avg_time'], stats['on_time_rate'])
+    return stats
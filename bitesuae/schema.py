@@ -0,0 +1,174 @@
+# =============================================================================
+# BitesUAE - Column Schema
+# The kind of every column of the cleaned tables and ORDERS_FULL, and the
+# compact dtype each kind gets. scripts/02_clean_data.py writes the store
+# with store_types(); app.py loads it with compact(), which also turns the
+# PREFIX_00042 ID strings into integer keys.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Column kind -> dtype; nullable integer/boolean dtypes are used when a column has gaps
+KIND_DTYPES = {
+    'id': 'str',  # compact() turns IDs into integer keys
+    'key': 'int32',
+    'text': 'str',
+    'label': 'category',
+    'datetime': 'datetime64',
+    'float': 'float32',
+    'count': 'int32',
+    'hour': 'int8',
+    'flag': 'bool',
+}
+NULLABLE_DTYPES = {'int32': 'Int32', 'int8': 'Int8', 'bool': 'boolean'}
+
+# In-memory dtype of ID keys, the numeric part of each ID; the PREFIX_ of every
+# ID column is fixed, so the key and its column name give back the ID
+ID_KEY_DTYPE = 'int32'
+
+# Surrogate keys are dimension row positions assigned at clean time;
+# MISSING_KEY marks a fact row with no dimension row
+MISSING_KEY = -1
+
+TIMELINE_COLUMNS = [
+    'order_placed_time', 'restaurant_confirmed_time', 'food_ready_time',
+    'rider_picked_up_time', 'delivered_time', 'estimated_delivery_time'
+]
+
+SCHEMA = {
+    'CUSTOMERS': {
+        'customer_id': 'id', 'customer_name': 'text', 'city': 'label', 'area': 'label',
+        'signup_date': 'datetime', 'signup_source': 'label', 'customer_tier': 'label',
+        'tenure_days': 'count',
+    },
+    'RESTAURANTS': {
+        'restaurant_id': 'id', 'restaurant_name': 'text', 'city': 'label', 'zone': 'label',
+        'cuisine_type': 'label', 'restaurant_tier': 'label', 'avg_prep_time_mins': 'count',
+        'rating': 'float',
+    },
+    'RIDERS': {
+        'rider_id': 'id', 'rider_name': 'text', 'city': 'label', 'zone': 'label',
+        'vehicle_type': 'label', 'rider_status': 'label', 'join_date': 'datetime',
+        'tenure_days': 'count',
+    },
+    'ORDERS': {
+        'order_id': 'id', 'customer_id': 'id', 'restaurant_id': 'id', 'order_datetime': 'datetime',
+        'order_status': 'label', 'gross_amount': 'float', 'discount_amount': 'float',
+        'net_amount': 'float', 'delivery_fee': 'float', 'promo_code': 'label',
+        'payment_method': 'label', 'cancellation_reason': 'label', 'order_date': 'datetime',
+        'order_hour': 'hour', 'order_day_of_week': 'label', 'order_month': 'label',
+        'order_week': 'label', 'is_weekend': 'flag', 'is_peak_hour': 'flag',
+    },
+    'ORDER_ITEMS': {
+        'item_id': 'id', 'order_id': 'id', 'item_name': 'label', 'quantity': 'count',
+        'unit_price': 'float', 'item_total': 'float',
+    },
+    'DELIVERY_EVENTS': {
+        'event_id': 'id', 'order_id': 'id', 'rider_id': 'id',
+        **{column: 'datetime' for column in TIMELINE_COLUMNS},
+        'actual_delivery_time_mins': 'float', 'delay_reason': 'label',
+        'delivery_performance': 'label', 'delay_minutes': 'float',
+    },
+    'ORDERS_FULL': {
+        'order_id': 'id', 'customer_id': 'id', 'restaurant_id': 'id', 'order_datetime': 'datetime',
+        'order_date': 'datetime', 'order_status': 'label', 'gross_amount': 'float',
+        'discount_amount': 'float', 'net_amount': 'float', 'promo_code': 'label',
+        'cancellation_reason': 'label', 'city': 'label', 'zone': 'label', 'cuisine_type': 'label',
+        'restaurant_tier': 'label', 'restaurant_name': 'label', 'rating': 'float',
+        'avg_prep_time_mins': 'count', 'rider_id': 'id', 'actual_delivery_time_mins': 'float',
+        **{column: 'datetime' for column in TIMELINE_COLUMNS},
+        'delay_reason': 'label', 'delivery_performance': 'label', 'order_hour': 'hour',
+        'time_of_day': 'label', 'order_week': 'label', 'prep_time_mins': 'float',
+        'rider_time_mins': 'float', 'is_on_time': 'flag', 'restaurant_key': 'key', 'rider_key': 'key',
+    },
+}
+
+
+def columns_of(table, kind):
+    """A table's columns of one kind, in schema order."""
+    return [column for column, column_kind in SCHEMA.get(table, {}).items() if column_kind == kind]
+
+
+def id_key(ids):
+    """Numeric part of PREFIX_00042 IDs, so IDs compare across zero-padded widths.
+
+    Returns integers, or floats with NaN when some IDs are missing or malformed.
+    """
+    ids = pa.array(pd.Series(ids, dtype='str'))
+    first, last = (pc.min_max(pc.find_substring(ids, '_'))[end].as_py() for end in ('min', 'max'))
+    if first is not None and first == last and first >= 0:
+        # One prefix length for the whole column, as generated IDs have
+        digits = pc.utf8_slice_codeunits(ids, start=first + 1)
+    else:
+        digits = pc.replace_substring_regex(ids, pattern='^[^_]*_', replacement='')
+    try:
+        return pc.cast(digits, pa.int64()).to_numpy(zero_copy_only=False)
+    except pa.ArrowInvalid:
+        return pd.to_numeric(pd.Series(digits, dtype='str'), errors='coerce').to_numpy()
+
+
+def id_keys(ids):
+    """Integer keys for an ID column; nullable when some IDs are missing."""
+    keys = id_key(ids)
+    dtype = NULLABLE_DTYPES[ID_KEY_DTYPE] if np.isnan(keys).any() else ID_KEY_DTYPE
+    return pd.array(keys, dtype=dtype)
+
+
+def surrogate_keys(ids, dimension_ids):
+    """Row position in the dimension table of each ID, or MISSING_KEY.
+
+    IDs are matched on their numeric part through a lookup array, so
+    assigning keys is two array passes with no hashing.
+    """
+    dimension, numbers = id_key(dimension_ids), id_key(ids)
+    known = np.flatnonzero(~np.isnan(dimension)) if dimension.dtype.kind == 'f' else np.arange(len(dimension))
+    rows = np.full(int(dimension[known].max()) + 1 if len(known) else 0, MISSING_KEY, dtype=KIND_DTYPES['key'])
+    rows[dimension[known].astype(np.int64)] = known
+
+    keys = np.full(len(numbers), MISSING_KEY, dtype=KIND_DTYPES['key'])
+    found = (numbers >= 0) & (numbers < len(rows))
+    keys[found] = rows[numbers[found].astype(np.int64)]
+    return keys
+
+
+def take(values, keys):
+    """Gather dimension values by surrogate key, `dim_array[keys]`; MISSING_KEY gives a missing value."""
+    return pd.Series(values).array.take(np.asarray(keys), allow_fill=True)
+
+
+def cast_column(values, kind):
+    """Cast one column to its kind's dtype."""
+    if kind == 'datetime':
+        return pd.to_datetime(values, errors='coerce')
+    if kind == 'label' and isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    dtype = KIND_DTYPES[kind]
+    if dtype in NULLABLE_DTYPES and values.isna().any():
+        dtype = NULLABLE_DTYPES[dtype]
+    return values.astype(dtype)
+
+
+def store_types(df, table):
+    """Cast a table's columns to their compact store dtypes; IDs stay strings."""
+    df = df.copy()
+    for column, kind in SCHEMA.get(table, {}).items():
+        if column in df.columns and kind != 'id':
+            df[column] = cast_column(df[column], kind)
+    return df
+
+
+def compact(df, table):
+    """Cast a loaded table to its in-memory dtypes, with IDs as integer keys."""
+    df = store_types(df, table)
+    for column in columns_of(table, 'id'):
+        if column in df.columns:
+            df[column] = id_keys(df[column])
+    return df
+
+
+def memory_mb(df):
+    """Resident size of a DataFrame in MB, counting string contents."""
+    return df.memory_usage(deep=True).sum() / 1e6
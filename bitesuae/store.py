@@ -0,0 +1,159 @@
+# =============================================================================
+# BitesUAE - Columnar Data Store
+# One directory of Parquet part files per cleaned table, written by
+# scripts/02_clean_data.py and read by app.py with column projection and
+# memory mapping. Column dtypes come from bitesuae/schema.py. Incremental
+# cleaning runs append new parts, replace refreshed fact rows in place and keep a
+# per-table key index of the stored IDs up to date.
+# =============================================================================
+
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from bitesuae.schema import store_types
+
+TABLES = ['CUSTOMERS', 'RESTAURANTS', 'RIDERS', 'ORDERS', 'ORDER_ITEMS', 'DELIVERY_EVENTS']
+
+# Denormalised table built from the cleaned tables for the dashboard (bitesuae/facts.py)
+FACT_TABLE = 'ORDERS_FULL'
+
+# Locations searched by the dashboard, in order (mirrors the Excel fallback)
+STORE_DIRS = [Path('data') / 'store', Path('store')]
+
+# Incremental-cleaning watermark, kept next to the tables
+STATE_FILE = '_state.json'
+
+# Key index of each table, one flag per stored ID number, kept next to the state file
+KEY_INDEX_DIR = '_keys'
+
+
+def table_path(store_dir, table):
+    """Return the directory holding a table's Parquet parts."""
+    return Path(store_dir) / table
+
+
+def find_store():
+    """Return the first store directory holding every table, or None."""
+    for store_dir in STORE_DIRS:
+        if all(table_path(store_dir, table).exists() for table in TABLES + [FACT_TABLE]):
+            return store_dir
+    return None
+
+
+def part_paths(store_dir, table):
+    """Return a table's Parquet parts in append order."""
+    return sorted(table_path(store_dir, table).glob('part-*.parquet'))
+
+
+def store_version(store_dir):
+    """Fingerprint of every part file; changes whenever a table is rewritten or appended to."""
+    return tuple(
+        (part.name, table, part.stat().st_mtime_ns, part.stat().st_size)
+        for table in TABLES + [FACT_TABLE]
+        for part in part_paths(store_dir, table)
+    )
+
+
+def write_table(df, table, store_dir):
+    """Replace a table in the store with a single typed Parquet part."""
+    path = table_path(store_dir, table)
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+    part = path / 'part-00000.parquet'
+    store_types(df, table).to_parquet(part, engine='pyarrow', index=False)
+    return part
+
+
+def append_table(df, table, store_dir):
+    """Append rows to a table as a new part with the table's existing schema."""
+    parts = part_paths(store_dir, table)
+    if not parts:
+        return write_table(df, table, store_dir)
+    
+    # Cast to the first part's schema so an all-null batch keeps the column types
+    schema = pq.read_schema(parts[0])
+    arrow_table = pa.Table.from_pandas(store_types(df, table), schema=schema, preserve_index=False)
+    part = table_path(store_dir, table) / f'part-{len(parts):05d}.parquet'
+    pq.write_table(arrow_table, part)
+    return part
+
+
+def delete_rows(table, store_dir, column, values):
+    """Remove the rows whose `column` is in `values`, rewriting only the parts that hold them.
+
+    Returns the number of rows removed. Parts are read by `column` alone,
+    and rewritten parts keep their names, so append order is unchanged.
+    """
+    values = pa.array(pd.Series(values, dtype='str').unique())
+    removed = 0
+    for part in part_paths(store_dir, table):
+        hit = pc.is_in(pq.read_table(part, columns=[column])[column], value_set=values)
+        count = pc.sum(hit).as_py() or 0
+        if not count:
+            continue
+        kept = pq.read_table(part).filter(pc.invert(pc.fill_null(hit, False)))
+        staged = part.with_name(part.name + '.tmp')
+        pq.write_table(kept, staged)
+        staged.replace(part)
+        removed += count
+    return removed
+
+
+def write_store(tables, store_dir):
+    """Write a {table_name: DataFrame} mapping to the store."""
+    return [write_table(df, table, store_dir) for table, df in tables.items()]
+
+
+def read_table(table, store_dir, columns=None, filters=None):
+    """Read a table from the store, loading only the requested columns.
+
+    `filters` are pyarrow row filters; parts whose statistics rule them out
+    are skipped without being read.
+    """
+    return pd.read_parquet(
+        table_path(store_dir, table),
+        engine='pyarrow',
+        columns=columns,
+        filters=filters,
+        memory_map=True
+    )
+
+
+def read_state(store_dir):
+    """Return the store's incremental-cleaning state, or None for a fresh store."""
+    path = Path(store_dir) / STATE_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def write_state(state, store_dir):
+    """Persist the store's incremental-cleaning state."""
+    path = Path(store_dir) / STATE_FILE
+    path.write_text(json.dumps(state, indent=2))
+    return path
+
+
+def read_key_flags(store_dir, table):
+    """Return a table's key index (one flag per ID number), or None when the store has none."""
+    path = Path(store_dir) / KEY_INDEX_DIR / f'{table}.npz'
+    if not path.exists():
+        return None
+    with np.load(path) as index:
+        return np.unpackbits(index['bits'], count=int(index['size'])).astype(bool)
+
+
+def write_key_flags(flags, table, store_dir):
+    """Persist a table's key index as packed bits."""
+    path = Path(store_dir) / KEY_INDEX_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    np.savez(path / f'{table}.npz', bits=np.packbits(flags), size=len(flags))
+    return path / f'{table}.npz'
@@ -1,33 +1,34 @@
 # =============================================================================
 # BitesUAE - Synthetic Data Generator (FIXED VERSION)
 # Project C: UAE Food Delivery CX & Operations Dashboard
-# Run this in Google Colab to generate Dataset.xlsx
+#
+# Usage:
+#   python scripts/01_generate_data.py                       # 1x -> BitesUAE_Dataset.xlsx
+#   python scripts/01_generate_data.py --scale 100 --format parquet --output-dir data/raw
+#
+# Tables are generated and written in fixed-size chunks, so memory stays flat
+# regardless of the scale factor.
 # =============================================================================
 
-# Step 1: Install required packages (run this cell first)
-!pip install pandas numpy faker openpyxl --quiet
-
 # =============================================================================
-# Step 2: Import Libraries
+# Step 1: Import Libraries
 # =============================================================================
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from faker import Faker
-import random
+from faker.providers.person.en_US import Provider as EnglishNames
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set seeds for reproducibility
-np.random.seed(42)
-random.seed(42)
-fake = Faker()
-Faker.seed(42)
-
-print("✅ Libraries imported successfully!")
+DEFAULT_SEED = 42
 
 # =============================================================================
-# Step 3: Define Constants and Configurations
+# Step 2: Define Constants and Configurations
 # =============================================================================
 
 # Date ranges
@@ -37,7 +38,7 @@ ORDER_END_DATE = TODAY
 CUSTOMER_SIGNUP_START = TODAY - timedelta(days=540)  # 18 months
 JOIN_DATE_START = TODAY - timedelta(days=730)  # 2 years
 
-# Row counts
+# Row counts (at 1x scale)
 NUM_CUSTOMERS = 10000
 NUM_RESTAURANTS = 500
 NUM_RIDERS = 300
@@ -102,12 +103,29 @@ DELAY_REASONS = [
 ]
 DELAY_REASON_WEIGHTS = [0.35, 0.25, 0.20, 0.10, 0.10]
 
+# Delivery timing: peak hours have a higher delay probability
+PEAK_HOURS = [12, 13, 19, 20, 21]
+DELIVERY_STATUSES = ['on_time', 'late_minor', 'late_major']
+PEAK_DELIVERY_WEIGHTS = [0.58, 0.25, 0.17]      # On-time 58%, Late<15 25%, Late>15 17%
+OFF_PEAK_DELIVERY_WEIGHTS = [0.78, 0.15, 0.07]  # On-time 78%, Late<15 15%, Late>15 7%
+
 # Customer tiers and signup sources
 CUSTOMER_TIERS = ['New', 'Regular', 'Loyal', 'VIP']
 CUSTOMER_TIER_WEIGHTS = [0.35, 0.35, 0.20, 0.10]
 SIGNUP_SOURCES = ['Organic', 'Social Media', 'Referral', 'Paid Ads']
 SIGNUP_SOURCE_WEIGHTS = [0.30, 0.25, 0.25, 0.20]
 
+# Order items: items per order (avg ~2) and sample menu items by cuisine type
+ITEM_COUNTS = [1, 2, 3, 4]
+ITEM_COUNT_WEIGHTS = [0.15, 0.65, 0.15, 0.05]
+MENU_ITEMS = {
+    'Indian': ['Butter Chicken', 'Biryani', 'Naan', 'Samosa', 'Dal Makhani', 'Paneer Tikka', 'Mango Lassi', 'Gulab Jamun'],
+    'Asian': ['Pad Thai', 'Sushi Roll', 'Dim Sum', 'Ramen', 'Fried Rice', 'Spring Rolls', 'Tom Yum Soup', 'Teriyaki Chicken'],
+    'Western': ['Burger', 'Pizza', 'Pasta', 'Steak', 'Fish & Chips', 'Caesar Salad', 'Fries', 'Cheesecake'],
+    'Emirati': ['Machboos', 'Harees', 'Luqaimat', 'Balaleet', 'Thareed', 'Madrooba', 'Karak Tea', 'Umm Ali'],
+    'Healthy': ['Quinoa Bowl', 'Acai Bowl', 'Grilled Salmon', 'Green Smoothie', 'Avocado Toast', 'Greek Salad', 'Protein Shake', 'Veggie Wrap']
+}
+
 # Vehicle types for riders
 VEHICLE_TYPES = ['Bike', 'Motorcycle', 'Car']
 VEHICLE_WEIGHTS = [0.50, 0.40, 0.10]
@@ -120,120 +138,282 @@ RIDER_STATUS_WEIGHTS = [0.85, 0.10, 0.05]
 PROMO_CODES = ['SAVE10', 'WELCOME20', 'BITES15', 'FREESHIP', 'VIP25', 'WEEKEND10', None]
 PROMO_WEIGHTS = [0.08, 0.05, 0.07, 0.10, 0.03, 0.07, 0.60]  # 60% no promo
 
-print("✅ Constants defined!")
+# Name vocabularies for customers and riders
+# Faker's en_US lists carry US census frequency weights; the curated lists are drawn uniformly
+ENGLISH_NAMES = {
+    'male': EnglishNames.first_names_male,
+    'female': EnglishNames.first_names_female,
+    'last': EnglishNames.last_names
+}
+EMIRATI_NAMES = {
+    'male': ['Mohammed', 'Ahmed', 'Khalid', 'Saeed', 'Rashid', 'Hamdan', 'Sultan', 'Omar',
+             'Abdullah', 'Hamad', 'Saif', 'Majid', 'Obaid', 'Mansour', 'Khalifa'],
+    'female': ['Fatima', 'Mariam', 'Aisha', 'Shamma', 'Hessa', 'Maitha', 'Noura', 'Latifa',
+               'Moza', 'Alya', 'Sheikha', 'Amna', 'Reem', 'Hind', 'Meera'],
+    'last': ['Al Mansoori', 'Al Nuaimi', 'Al Shamsi', 'Al Mazrouei', 'Al Ketbi', 'Al Dhaheri',
+             'Al Suwaidi', 'Al Falasi', 'Al Marri', 'Al Hammadi', 'Al Muhairi', 'Al Zaabi',
+             'Al Kaabi', 'Al Qubaisi', 'Al Mheiri']
+}
+ARAB_NAMES = {
+    'male': ['Mahmoud', 'Youssef', 'Karim', 'Tarek', 'Rami', 'Hassan', 'Ali', 'Bilal',
+             'Fadi', 'Nabil', 'Sami', 'Ziad'],
+    'female': ['Layla', 'Nour', 'Rania', 'Dina', 'Hala', 'Yasmin', 'Lina', 'Salma',
+               'Rana', 'Mona'],
+    'last': ['Haddad', 'Khoury', 'Nasser', 'Saleh', 'Hamdan', 'Abdallah', 'Farouk',
+             'Ibrahim', 'Khalil', 'Youssef', 'Sabbagh', 'Darwish']
+}
+SOUTH_ASIAN_NAMES = {
+    'male': ['Mohammed', 'Rahul', 'Arjun', 'Imran', 'Ravi', 'Suresh', 'Anil', 'Faisal',
+             'Vijay', 'Rajesh', 'Abdul', 'Asif', 'Sanjay', 'Vikram', 'Ajay', 'Naveen'],
+    'female': ['Priya', 'Anjali', 'Ayesha', 'Fatima', 'Divya', 'Sana', 'Neha', 'Pooja',
+               'Zainab', 'Lakshmi', 'Meera', 'Shreya'],
+    'last': ['Khan', 'Sharma', 'Patel', 'Nair', 'Menon', 'Kumar', 'Hussain', 'Ahmed',
+             'Singh', 'Reddy', 'Pillai', 'Shaikh', 'Iyer', 'Qureshi', 'Das', 'Malik']
+}
+FILIPINO_NAMES = {
+    'male': ['Jose', 'Mark', 'John Paul', 'Christian', 'Rommel', 'Jerome', 'Ronald',
+             'Michael', 'Joel', 'Ariel'],
+    'female': ['Maria', 'Grace', 'Joy', 'Kristine', 'Mary Ann', 'Jennifer', 'Rosalie',
+               'Angelica', 'Lovely', 'Cherry'],
+    'last': ['Santos', 'Reyes', 'Cruz', 'Bautista', 'Garcia', 'Mendoza', 'Dela Cruz',
+             'Villanueva', 'Ramos', 'Aquino', 'Castillo', 'Flores']
+}
+
+# Name styles: (population share, vocabulary) per community
+NAME_STYLES = {
+    'western': [(1.0, ENGLISH_NAMES)],
+    'uae': [
+        (0.15, EMIRATI_NAMES),
+        (0.20, ARAB_NAMES),
+        (0.45, SOUTH_ASIAN_NAMES),
+        (0.10, FILIPINO_NAMES),
+        (0.10, ENGLISH_NAMES)
+    ]
+}
+DEFAULT_NAME_STYLE = 'western'
+
+# Output tables, in generation order, plus the manifest of injected issues
+TABLES = ['CUSTOMERS', 'RESTAURANTS', 'RIDERS', 'ORDERS', 'ORDER_ITEMS', 'DELIVERY_EVENTS']
+MANIFEST_TABLE = 'QUALITY_MANIFEST'
+OUTPUT_TABLES = TABLES + [MANIFEST_TABLE]
+
+# Scale and chunking limits
+MIN_SCALE = 1
+MAX_SCALE = 1000
+DEFAULT_CHUNK_SIZE = 100_000
+MAX_XLSX_SCALE = 10  # Excel sheets cap at ~1M rows and are written in one go
+ITEMS_PER_ORDER_BOUND = 2.5  # Sizes ITM_ IDs; orders average ~2.1 items
 
 # =============================================================================
-# Step 4: Helper Functions
+# Step 3: Helper Functions
 # =============================================================================
 
-def get_random_city():
-    """Return a random city based on distribution."""
-    return np.random.choice(CITIES, p=CITY_WEIGHTS)
-
-def get_random_zone(city):
-    """Return a random zone for a given city."""
-    return random.choice(CITY_ZONES[city])
-
-def get_random_datetime(start_date, end_date):
-    """Generate random datetime between two dates."""
-    delta = end_date - start_date
-    random_days = random.randint(0, delta.days)
-    random_seconds = random.randint(0, 86399)
-    return datetime.combine(start_date + timedelta(days=random_days), 
-                           datetime.min.time()) + timedelta(seconds=random_seconds)
-
-def get_order_datetime(base_date):
-    """Generate order datetime with peak hour distribution."""
-    # Define hour probabilities for 24 hours (0-23)
-    # Peak hours: 12-13 (Lunch 25%), 19-21 (Dinner 45%), others (30%)
-    hour_probs = [
-        0.01,  # 0 AM
-        0.01,  # 1 AM
-        0.01,  # 2 AM
-        0.01,  # 3 AM
-        0.01,  # 4 AM
-        0.01,  # 5 AM
-        0.01,  # 6 AM
-        0.02,  # 7 AM
-        0.02,  # 8 AM
-        0.02,  # 9 AM
-        0.02,  # 10 AM
-        0.03,  # 11 AM
-        0.125, # 12 PM - Lunch Peak
-        0.125, # 1 PM - Lunch Peak
-        0.02,  # 2 PM
-        0.02,  # 3 PM
-        0.02,  # 4 PM
-        0.03,  # 5 PM
-        0.05,  # 6 PM
-        0.15,  # 7 PM - Dinner Peak
-        0.15,  # 8 PM - Dinner Peak
-        0.15,  # 9 PM - Dinner Peak
-        0.03,  # 10 PM
-        0.02   # 11 PM
-    ]
-    
-    # Normalize to sum to 1
-    hour_probs = np.array(hour_probs)
-    hour_probs = hour_probs / hour_probs.sum()
-    
-    hour = np.random.choice(range(24), p=hour_probs)
-    minute = random.randint(0, 59)
-    second = random.randint(0, 59)
-    
-    return datetime.combine(base_date, datetime.min.time().replace(hour=hour, minute=minute, second=second))
+# Hour-of-day weights for order timestamps
+# Peak hours: 12-13 (Lunch 25%), 19-21 (Dinner 45%), others (30%)
+HOUR_WEIGHTS = np.array([
+    0.01,  # 0 AM
+    0.01,  # 1 AM
+    0.01,  # 2 AM
+    0.01,  # 3 AM
+    0.01,  # 4 AM
+    0.01,  # 5 AM
+    0.01,  # 6 AM
+    0.02,  # 7 AM
+    0.02,  # 8 AM
+    0.02,  # 9 AM
+    0.02,  # 10 AM
+    0.03,  # 11 AM
+    0.125, # 12 PM - Lunch Peak
+    0.125, # 1 PM - Lunch Peak
+    0.02,  # 2 PM
+    0.02,  # 3 PM
+    0.02,  # 4 PM
+    0.03,  # 5 PM
+    0.05,  # 6 PM
+    0.15,  # 7 PM - Dinner Peak
+    0.15,  # 8 PM - Dinner Peak
+    0.15,  # 9 PM - Dinner Peak
+    0.03,  # 10 PM
+    0.02   # 11 PM
+])
+HOUR_WEIGHTS = HOUR_WEIGHTS / HOUR_WEIGHTS.sum()  # Normalize to sum to 1
+
+# Zones padded into a (city x zone) table so a whole column can be drawn at once
+ZONE_TABLE = np.array(
+    [zones + [''] * (max(map(len, CITY_ZONES.values())) - len(zones)) for zones in CITY_ZONES.values()],
+    dtype=object
+)
+ZONE_COUNTS = np.array([len(zones) for zones in CITY_ZONES.values()])
 
-def is_peak_hour(dt):
-    """Check if datetime is during peak hours."""
-    hour = dt.hour
-    return hour in [12, 13, 19, 20, 21]
+# Menu as a (cuisine x dish) table; every cuisine lists the same number of dishes
+MENU_TABLE = np.array(list(MENU_ITEMS.values()), dtype=object)
 
-def get_delivery_status(is_peak):
-    """Get delivery timing status with higher delay probability during peak."""
-    if is_peak:
-        # Peak: On-time 58%, Late<15 25%, Late>15 17%
-        return np.random.choice(['on_time', 'late_minor', 'late_major'], 
-                                p=[0.58, 0.25, 0.17])
+# Full-name pools, built once per process on first use: {(style, male_only): (names, groups)}
+NAME_POOLS = {}
+
+def name_weights(names):
+    """Return (names, normalized weights) for a weighted dict or a uniform list."""
+    if isinstance(names, dict):
+        weights = np.array(list(names.values()), dtype=float)
+        names = list(names)
     else:
-        # Off-peak: On-time 78%, Late<15 15%, Late>15 7%
-        return np.random.choice(['on_time', 'late_minor', 'late_major'], 
-                                p=[0.78, 0.15, 0.07])
+        weights = np.ones(len(names))
+    return np.array(names, dtype=np.dtypes.StringDType()), weights / weights.sum()
 
-print("✅ Helper functions defined!")
+def name_pool(style, male_only=False):
+    """Every 'First Last' name of a style, plus how to draw from it.
+
+    Each community contributes its first-name x last-name product to one
+    flat pool, so a name is just an index: offset + first * n_last + last.
+    Groups are (share, offset, first_weights, last_weights).
+    """
+    key = (style, male_only)
+    if key not in NAME_POOLS:
+        names, groups, offset = [], [], 0
+        for share, vocabulary in NAME_STYLES[style]:
+            first, first_weights = name_weights(vocabulary['male'])
+            if not male_only:
+                female, female_weights = name_weights(vocabulary['female'])
+                first = np.concatenate([first, female])
+                first_weights = np.concatenate([first_weights, female_weights]) / 2
+            last, last_weights = name_weights(vocabulary['last'])
+            
+            names.append(np.strings.add(np.strings.add(first[:, None], ' '), last[None, :]).ravel())
+            groups.append((share, offset, first_weights, last_weights))
+            offset += len(first) * len(last)
+        NAME_POOLS[key] = (np.concatenate(names).astype(object), groups)
+    return NAME_POOLS[key]
+
+def get_random_names(rng, size, style=DEFAULT_NAME_STYLE, male_only=False):
+    """Draw a column of `size` full names from a style's name pool."""
+    names, groups = name_pool(style, male_only)
+    shares = np.array([group[0] for group in groups])
+    group_idx = rng.choice(len(groups), size=size, p=shares / shares.sum())
+    
+    idx = np.empty(size, dtype=np.int64)
+    for g, (_, offset, first_weights, last_weights) in enumerate(groups):
+        rows = np.flatnonzero(group_idx == g)
+        first = rng.choice(len(first_weights), size=len(rows), p=first_weights)
+        last = rng.choice(len(last_weights), size=len(rows), p=last_weights)
+        idx[rows] = offset + first * len(last_weights) + last
+    return names[idx]
+
+def weighted_choice(rng, values, weights, size):
+    """Draw a column of `size` values according to `weights`."""
+    idx = rng.choice(len(values), size=size, p=weights)
+    return np.asarray(values, dtype=object)[idx]
+
+def id_width(base_width, total):
+    """Digits needed so every ID up to `total` shares one zero-padded width."""
+    return max(base_width, len(str(int(total))))
+
+def format_ids(prefix, numbers, width):
+    """Format integer IDs such as 1 -> CUST_00001."""
+    # Zero-padded digits are written straight into a fixed-width byte buffer,
+    # which is several times faster than formatting one string per row
+    numbers = np.array(numbers, dtype=np.int64)
+    width = max(width, len(str(numbers.max()))) if len(numbers) else width
+    chars = np.empty((len(numbers), len(prefix) + width), dtype=np.uint8)
+    chars[:, :len(prefix)] = np.frombuffer(prefix.encode(), dtype=np.uint8)
+    for pos in range(width - 1, -1, -1):
+        chars[:, len(prefix) + pos] = numbers % 10 + ord('0')
+        numbers //= 10
+    return chars.view(f'S{len(prefix) + width}').ravel().astype(str).astype(object)
+
+def make_ids(prefix, start, size, width):
+    """Build sequential IDs such as CUST_00001 for rows start+1 .. start+size."""
+    return format_ids(prefix, np.arange(start + 1, start + size + 1), width)
+
+def get_random_cities(rng, size):
+    """Return city indices (into CITIES) based on distribution."""
+    return rng.choice(len(CITIES), size=size, p=CITY_WEIGHTS)
+
+def get_random_zones(rng, city_idx):
+    """Return a random zone for each city index."""
+    zone_idx = (rng.random(len(city_idx)) * ZONE_COUNTS[city_idx]).astype(np.int64)
+    return ZONE_TABLE[city_idx, zone_idx]
+
+def get_random_dates(rng, start_date, end_date, size):
+    """Generate random dates between two dates (inclusive)."""
+    days = rng.integers(0, (end_date - start_date).days + 1, size=size)
+    return np.datetime64(start_date, 'D') + days
+
+def get_order_datetimes(rng, start_date, num_days, size):
+    """Generate order datetimes with peak hour distribution."""
+    days = rng.integers(0, num_days + 1, size=size)
+    hours = rng.choice(24, size=size, p=HOUR_WEIGHTS)
+    minutes = rng.integers(0, 60, size=size)
+    seconds = rng.integers(0, 60, size=size)
+    offsets = ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+    return np.datetime64(start_date, 's') + offsets
+
+def promo_discount_rate(promo_code):
+    """Discount rate implied by a promo code (NaN = random 5-15%)."""
+    if not promo_code:
+        return 0.0
+    if 'FREESHIP' in promo_code:
+        return 0.0  # Free shipping handled separately
+    for marker, rate in [('25', 0.25), ('20', 0.20), ('15', 0.15), ('10', 0.10)]:
+        if marker in promo_code:
+            return rate
+    return np.nan
+
+def is_peak_hour(order_datetimes):
+    """Check which datetimes fall in peak hours."""
+    hours = order_datetimes.astype('datetime64[h]').astype(np.int64) % 24
+    return np.isin(hours, PEAK_HOURS)
+
+def get_delivery_statuses(rng, is_peak):
+    """Get delivery timing statuses with higher delay probability during peak."""
+    # One uniform draw per row, bucketed by the peak or off-peak cumulative weights
+    cum_weights = np.where(
+        is_peak[:, None],
+        np.cumsum(PEAK_DELIVERY_WEIGHTS),
+        np.cumsum(OFF_PEAK_DELIVERY_WEIGHTS)
+    )
+    status_idx = (rng.random(len(is_peak))[:, None] >= cum_weights[:, :-1]).sum(axis=1)
+    return np.asarray(DELIVERY_STATUSES, dtype=object)[status_idx]
+
+def shard_rng(seed, table, shard, stream=0):
+    """Seed every RNG for one shard of one table and return its Generator.
+
+    Each (seed, table, shard) triple gets an independent stream, so a shard's
+    rows do not depend on which shards were generated before it. `stream`
+    separates generation (0) from quality-issue injection (1).
+    """
+    return np.random.default_rng([seed, TABLES.index(table), shard, stream])
+
+def chunk_bounds(total, chunk_size):
+    """Yield (shard, start, size) covering `total` rows in fixed-size chunks."""
+    for shard, start in enumerate(range(0, total, chunk_size)):
+        yield shard, start, min(chunk_size, total - start)
 
 # =============================================================================
-# Step 5: Generate CUSTOMERS Table
+# Step 4: Generate CUSTOMERS Table
 # =============================================================================
 
-def generate_customers():
-    """Generate CUSTOMERS table with 10,000 rows."""
-    print("Generating CUSTOMERS table...")
-    
-    customers = []
-    for i in range(NUM_CUSTOMERS):
-        city = get_random_city()
-        customers.append({
-            'customer_id': f'CUST_{i+1:05d}',
-            'customer_name': fake.name(),
-            'city': city,
-            'area': get_random_zone(city),
-            'signup_date': get_random_datetime(CUSTOMER_SIGNUP_START, TODAY).date(),
-            'signup_source': np.random.choice(SIGNUP_SOURCES, p=SIGNUP_SOURCE_WEIGHTS),
-            'customer_tier': np.random.choice(CUSTOMER_TIERS, p=CUSTOMER_TIER_WEIGHTS)
-        })
-    
-    df = pd.DataFrame(customers)
-    print(f"  ✅ Generated {len(df)} customers")
+def generate_customers(rng, n=NUM_CUSTOMERS, start=0, width=5, name_style=DEFAULT_NAME_STYLE):
+    """Generate a chunk of the CUSTOMERS table (10,000 rows at 1x)."""
+    city_idx = get_random_cities(rng, n)
+    
+    df = pd.DataFrame({
+        'customer_id': make_ids('CUST_', start, n, width),
+        'customer_name': get_random_names(rng, n, name_style),
+        'city': np.asarray(CITIES, dtype=object)[city_idx],
+        'area': get_random_zones(rng, city_idx),
+        'signup_date': get_random_dates(rng, CUSTOMER_SIGNUP_START, TODAY, n),
+        'signup_source': weighted_choice(rng, SIGNUP_SOURCES, SIGNUP_SOURCE_WEIGHTS, n),
+        'customer_tier': weighted_choice(rng, CUSTOMER_TIERS, CUSTOMER_TIER_WEIGHTS, n)
+    })
     return df
 
 # =============================================================================
-# Step 6: Generate RESTAURANTS Table
+# Step 5: Generate RESTAURANTS Table
 # =============================================================================
 
-def generate_restaurants():
-    """Generate RESTAURANTS table with 500 rows."""
-    print("Generating RESTAURANTS table...")
-    
+def generate_restaurants(rng, n=NUM_RESTAURANTS, width=3):
+    """Generate the RESTAURANTS table (500 rows at 1x)."""
+
     # Restaurant name prefixes and suffixes for UAE context
     prefixes = ['Al', 'The', 'Royal', 'Golden', 'Silver', 'Grand', 'Little', 'Big', 'New', 'Old']
     name_parts = ['Spice', 'Flame', 'Garden', 'Kitchen', 'House', 'Palace', 'Corner', 'Cafe', 'Bistro', 'Grill']
@@ -241,539 +421,654 @@ def generate_restaurants():
     
     tier_list = list(RESTAURANT_TIERS.keys())
     tier_weights = [RESTAURANT_TIERS[t]['weight'] for t in tier_list]
+    prep_min = np.array([RESTAURANT_TIERS[t]['prep_min'] for t in tier_list])
+    prep_max = np.array([RESTAURANT_TIERS[t]['prep_max'] for t in tier_list])
     
-    restaurants = []
-    for i in range(NUM_RESTAURANTS):
-        city = get_random_city()
-        tier = np.random.choice(tier_list, p=tier_weights)
-        tier_config = RESTAURANT_TIERS[tier]
-        
-        # Generate restaurant name
-        name = f"{random.choice(prefixes)} {random.choice(name_parts)} {random.choice(suffixes)}".strip()
-        
-        restaurants.append({
-            'restaurant_id': f'REST_{i+1:03d}',
-            'restaurant_name': name,
-            'city': city,
-            'zone': get_random_zone(city),
-            'cuisine_type': np.random.choice(CUISINES, p=CUISINE_WEIGHTS),
-            'restaurant_tier': tier,
-            'avg_prep_time_mins': random.randint(tier_config['prep_min'], tier_config['prep_max']),
-            'rating': round(random.uniform(3.0, 5.0), 1)
-        })
-    
-    df = pd.DataFrame(restaurants)
-    print(f"  ✅ Generated {len(df)} restaurants")
+    city_idx = get_random_cities(rng, n)
+    tier_idx = rng.choice(len(tier_list), size=n, p=tier_weights)
+    
+    # Generate restaurant names
+    names = (
+        pd.Series(weighted_choice(rng, prefixes, None, n)) + ' ' +
+        pd.Series(weighted_choice(rng, name_parts, None, n)) + ' ' +
+        pd.Series(weighted_choice(rng, suffixes, None, n))
+    ).str.strip()
+    
+    df = pd.DataFrame({
+        'restaurant_id': make_ids('REST_', 0, n, width),
+        'restaurant_name': names.to_numpy(dtype=object),
+        'city': np.asarray(CITIES, dtype=object)[city_idx],
+        'zone': get_random_zones(rng, city_idx),
+        'cuisine_type': weighted_choice(rng, CUISINES, CUISINE_WEIGHTS, n),
+        'restaurant_tier': np.asarray(tier_list, dtype=object)[tier_idx],
+        'avg_prep_time_mins': rng.integers(prep_min[tier_idx], prep_max[tier_idx] + 1),
+        'rating': rng.uniform(3.0, 5.0, size=n).round(1)
+    })
     return df
 
 # =============================================================================
-# Step 7: Generate RIDERS Table
+# Step 6: Generate RIDERS Table
 # =============================================================================
 
-def generate_riders():
-    """Generate RIDERS table with 300 rows."""
-    print("Generating RIDERS table...")
-    
-    riders = []
-    for i in range(NUM_RIDERS):
-        city = get_random_city()
-        riders.append({
-            'rider_id': f'RDR_{i+1:03d}',
-            'rider_name': fake.name_male(),  # Most riders are male in UAE
-            'city': city,
-            'zone': get_random_zone(city),
-            'vehicle_type': np.random.choice(VEHICLE_TYPES, p=VEHICLE_WEIGHTS),
-            'rider_status': np.random.choice(RIDER_STATUSES, p=RIDER_STATUS_WEIGHTS),
-            'join_date': get_random_datetime(JOIN_DATE_START, TODAY).date()
-        })
-    
-    df = pd.DataFrame(riders)
-    print(f"  ✅ Generated {len(df)} riders")
+def generate_riders(rng, n=NUM_RIDERS, width=3, name_style=DEFAULT_NAME_STYLE):
+    """Generate the RIDERS table (300 rows at 1x)."""
+    city_idx = get_random_cities(rng, n)
+    
+    df = pd.DataFrame({
+        'rider_id': make_ids('RDR_', 0, n, width),
+        'rider_name': get_random_names(rng, n, name_style, male_only=True),  # Most riders are male in UAE
+        'city': np.asarray(CITIES, dtype=object)[city_idx],
+        'zone': get_random_zones(rng, city_idx),
+        'vehicle_type': weighted_choice(rng, VEHICLE_TYPES, VEHICLE_WEIGHTS, n),
+        'rider_status': weighted_choice(rng, RIDER_STATUSES, RIDER_STATUS_WEIGHTS, n),
+        'join_date': get_random_dates(rng, JOIN_DATE_START, TODAY, n)
+    })
     return df
 
 # =============================================================================
-# Step 8: Generate ORDERS Table
+# Step 7: Generate ORDERS Table
 # =============================================================================
 
-def generate_orders(customers_df, restaurants_df):
-    """Generate ORDERS table with 25,000 rows."""
-    print("Generating ORDERS table...")
+def generate_orders(rng, num_customers, restaurants_df, n=NUM_ORDERS, start=0,
+                    width=5, customer_width=5):
+    """Generate a chunk of the ORDERS table (25,000 rows at 1x)."""
+    restaurant_ids = restaurants_df['restaurant_id'].to_numpy(dtype=object)
     
-    customer_ids = customers_df['customer_id'].tolist()
-    restaurant_ids = restaurants_df['restaurant_id'].tolist()
+    # Tier-based AOV bounds per restaurant
+    tiers = restaurants_df['restaurant_tier'].to_numpy()
+    aov_min = np.array([RESTAURANT_TIERS[t]['aov_min'] for t in tiers], dtype=float)
+    aov_max = np.array([RESTAURANT_TIERS[t]['aov_max'] for t in tiers], dtype=float)
     
-    # Create restaurant lookup for tier-based AOV
-    restaurant_tier_lookup = restaurants_df.set_index('restaurant_id')['restaurant_tier'].to_dict()
+    restaurant_idx = rng.integers(0, len(restaurant_ids), size=n)
     
-    orders = []
-    for i in range(NUM_ORDERS):
-        restaurant_id = random.choice(restaurant_ids)
-        tier = restaurant_tier_lookup[restaurant_id]
-        tier_config = RESTAURANT_TIERS[tier]
-        
-        # Generate order datetime with peak distribution
-        order_date = ORDER_START_DATE + timedelta(days=random.randint(0, 90))
-        order_datetime = get_order_datetime(order_date)
-        
-        # Order status
-        status = np.random.choice(ORDER_STATUSES, p=ORDER_STATUS_WEIGHTS)
-        
-        # Gross amount based on restaurant tier
-        gross_amount = round(random.uniform(tier_config['aov_min'], tier_config['aov_max']), 2)
-        
-        # Promo code
-        promo_code = np.random.choice(PROMO_CODES, p=PROMO_WEIGHTS)
-        
-        # Discount based on promo
-        if promo_code:
-            if 'FREESHIP' in str(promo_code):
-                discount_amount = 0  # Free shipping handled separately
-            elif '25' in str(promo_code):
-                discount_amount = round(gross_amount * 0.25, 2)
-            elif '20' in str(promo_code):
-                discount_amount = round(gross_amount * 0.20, 2)
-            elif '15' in str(promo_code):
-                discount_amount = round(gross_amount * 0.15, 2)
-            elif '10' in str(promo_code):
-                discount_amount = round(gross_amount * 0.10, 2)
-            else:
-                discount_amount = round(gross_amount * random.uniform(0.05, 0.15), 2)
-        else:
-            discount_amount = 0
-        
-        net_amount = round(gross_amount - discount_amount, 2)
-        
-        # Delivery fee (0 for FREESHIP promo, else 5-15)
-        if promo_code == 'FREESHIP':
-            delivery_fee = 0
-        else:
-            delivery_fee = round(random.uniform(5, 15), 2)
-        
-        # Cancellation reason (only for cancelled orders)
-        cancellation_reason = None
-        if status == 'Cancelled':
-            cancellation_reason = np.random.choice(CANCELLATION_REASONS, p=CANCELLATION_WEIGHTS)
-        
-        orders.append({
-            'order_id': f'ORD_{i+1:05d}',
-            'customer_id': random.choice(customer_ids),
-            'restaurant_id': restaurant_id,
-            'order_datetime': order_datetime,
-            'order_status': status,
-            'gross_amount': gross_amount,
-            'discount_amount': discount_amount,
-            'net_amount': net_amount,
-            'delivery_fee': delivery_fee,
-            'promo_code': promo_code,
-            'payment_method': np.random.choice(PAYMENT_METHODS, p=PAYMENT_WEIGHTS),
-            'cancellation_reason': cancellation_reason
-        })
-        
-        # Progress indicator
-        if (i + 1) % 5000 == 0:
-            print(f"    Progress: {i+1}/{NUM_ORDERS} orders generated...")
+    # Order datetime with peak distribution
+    order_datetime = get_order_datetimes(rng, ORDER_START_DATE, 90, n)
+    
+    # Order status
+    status = weighted_choice(rng, ORDER_STATUSES, ORDER_STATUS_WEIGHTS, n)
+    
+    # Gross amount based on restaurant tier
+    gross_amount = rng.uniform(aov_min[restaurant_idx], aov_max[restaurant_idx]).round(2)
+    
+    # Promo code and the discount rate it implies
+    promo_idx = rng.choice(len(PROMO_CODES), size=n, p=PROMO_WEIGHTS)
+    promo_code = np.asarray(PROMO_CODES, dtype=object)[promo_idx]
+    promo_rates = np.array([promo_discount_rate(code) for code in PROMO_CODES])
+    rate = promo_rates[promo_idx]
+    rate = np.where(np.isnan(rate), rng.uniform(0.05, 0.15, size=n), rate)
+    discount_amount = (gross_amount * rate).round(2)
     
-    df = pd.DataFrame(orders)
-    print(f"  ✅ Generated {len(df)} orders")
+    net_amount = (gross_amount - discount_amount).round(2)
+    
+    # Delivery fee (0 for FREESHIP promo, else 5-15)
+    delivery_fee = np.where(promo_code == 'FREESHIP', 0.0, rng.uniform(5, 15, size=n).round(2))
+    
+    # Cancellation reason (only for cancelled orders)
+    cancellation_reason = np.where(
+        status == 'Cancelled',
+        weighted_choice(rng, CANCELLATION_REASONS, CANCELLATION_WEIGHTS, n),
+        None
+    )
+    
+    df = pd.DataFrame({
+        'order_id': make_ids('ORD_', start, n, width),
+        'customer_id': format_ids('CUST_', rng.integers(1, num_customers + 1, size=n), customer_width),
+        'restaurant_id': restaurant_ids[restaurant_idx],
+        'order_datetime': order_datetime,
+        'order_status': status,
+        'gross_amount': gross_amount,
+        'discount_amount': discount_amount,
+        'net_amount': net_amount,
+        'delivery_fee': delivery_fee,
+        'promo_code': promo_code,
+        'payment_method': weighted_choice(rng, PAYMENT_METHODS, PAYMENT_WEIGHTS, n),
+        'cancellation_reason': cancellation_reason
+    })
     return df
 
 # =============================================================================
-# Step 9: Generate ORDER_ITEMS Table
+# Step 8: Generate ORDER_ITEMS Table
 # =============================================================================
 
-def generate_order_items(orders_df):
-    """Generate ORDER_ITEMS table with ~50,000 rows (~2 per order)."""
-    print("Generating ORDER_ITEMS table...")
-    
-    # Sample menu items by cuisine type
-    MENU_ITEMS = {
-        'Indian': ['Butter Chicken', 'Biryani', 'Naan', 'Samosa', 'Dal Makhani', 'Paneer Tikka', 'Mango Lassi', 'Gulab Jamun'],
-        'Asian': ['Pad Thai', 'Sushi Roll', 'Dim Sum', 'Ramen', 'Fried Rice', 'Spring Rolls', 'Tom Yum Soup', 'Teriyaki Chicken'],
-        'Western': ['Burger', 'Pizza', 'Pasta', 'Steak', 'Fish & Chips', 'Caesar Salad', 'Fries', 'Cheesecake'],
-        'Emirati': ['Machboos', 'Harees', 'Luqaimat', 'Balaleet', 'Thareed', 'Madrooba', 'Karak Tea', 'Umm Ali'],
-        'Healthy': ['Quinoa Bowl', 'Acai Bowl', 'Grilled Salmon', 'Green Smoothie', 'Avocado Toast', 'Greek Salad', 'Protein Shake', 'Veggie Wrap']
-    }
+def generate_order_items(rng, orders_df, start=0, width=5):
+    """Generate ORDER_ITEMS for a chunk of orders (~2 per order)."""
+    n = len(orders_df)
     
-    order_items = []
-    item_counter = 0
+    # Each order has 1-4 items (avg ~2)
+    num_items = rng.choice(ITEM_COUNTS, size=n, p=ITEM_COUNT_WEIGHTS)
+    order_idx = np.repeat(np.arange(n), num_items)
+    offsets = np.cumsum(num_items) - num_items
+    total_items = len(order_idx)
     
-    for idx, order in orders_df.iterrows():
-        # Each order has 1-4 items (avg ~2)
-        num_items = np.random.choice([1, 2, 2, 2, 3, 3, 4], p=[0.15, 0.30, 0.20, 0.15, 0.10, 0.05, 0.05])
-        
-        # Distribute gross_amount across items
-        gross_amount = order['gross_amount']
-        item_totals = np.random.dirichlet(np.ones(num_items)) * gross_amount
-        
-        for j in range(num_items):
-            item_counter += 1
-            quantity = random.randint(1, 3)
-            item_total = round(item_totals[j], 2)
-            unit_price = round(item_total / quantity, 2)
-            
-            # Recalculate to ensure consistency
-            item_total = round(unit_price * quantity, 2)
-            
-            # Random menu item
-            cuisine = random.choice(list(MENU_ITEMS.keys()))
-            item_name = random.choice(MENU_ITEMS[cuisine])
-            
-            order_items.append({
-                'item_id': f'ITM_{item_counter:05d}',
-                'order_id': order['order_id'],
-                'item_name': item_name,
-                'quantity': quantity,
-                'unit_price': unit_price,
-                'item_total': item_total
-            })
-        
-        # Progress indicator
-        if (idx + 1) % 5000 == 0:
-            print(f"    Progress: {idx+1}/{len(orders_df)} orders processed...")
+    # Distribute gross_amount across items: a flat Dirichlet split is a
+    # per-order normalised set of Exp(1) draws
+    weights = rng.standard_exponential(total_items)
+    shares = weights / np.add.reduceat(weights, offsets)[order_idx]
+    gross_amount = orders_df['gross_amount'].to_numpy(dtype=float)
+    item_totals = (shares * gross_amount[order_idx]).round(2)
     
-    df = pd.DataFrame(order_items)
-    print(f"  ✅ Generated {len(df)} order items")
+    quantity = rng.integers(1, 4, size=total_items)
+    unit_price = (item_totals / quantity).round(2)
+    
+    # Recalculate to ensure consistency
+    item_total = (unit_price * quantity).round(2)
+    
+    # Random menu item (random cuisine, then a random dish from it)
+    cuisine_idx = rng.integers(0, MENU_TABLE.shape[0], size=total_items)
+    dish_idx = rng.integers(0, MENU_TABLE.shape[1], size=total_items)
+    
+    df = pd.DataFrame({
+        'item_id': make_ids('ITM_', start, total_items, width),
+        'order_id': orders_df['order_id'].to_numpy(dtype=object)[order_idx],
+        'item_name': MENU_TABLE[cuisine_idx, dish_idx],
+        'quantity': quantity,
+        'unit_price': unit_price,
+        'item_total': item_total
+    })
     return df
 
 # =============================================================================
-# Step 10: Generate DELIVERY_EVENTS Table
+# Step 9: Generate DELIVERY_EVENTS Table
 # =============================================================================
 
-def generate_delivery_events(orders_df, riders_df, restaurants_df):
-    """Generate DELIVERY_EVENTS table with 25,000 rows (1:1 with orders)."""
-    print("Generating DELIVERY_EVENTS table...")
+def generate_delivery_events(rng, orders_df, riders_df, restaurants_df, start=0, width=5):
+    """Generate DELIVERY_EVENTS for a chunk of orders (1:1 with orders)."""
+    n = len(orders_df)
+    rider_ids = riders_df['rider_id'].to_numpy(dtype=object)
     
-    rider_ids = riders_df['rider_id'].tolist()
-    restaurant_prep_lookup = restaurants_df.set_index('restaurant_id')['avg_prep_time_mins'].to_dict()
+    def minutes(values):
+        return np.asarray(values).astype('timedelta64[m]')
     
-    events = []
-    for idx, order in orders_df.iterrows():
-        order_id = order['order_id']
-        order_datetime = order['order_datetime']
-        order_status = order['order_status']
-        restaurant_id = order['restaurant_id']
-        
-        # Get restaurant's avg prep time
-        avg_prep = restaurant_prep_lookup.get(restaurant_id, 20)
-        
-        # Order placed time = order_datetime
-        order_placed_time = order_datetime
-        
-        # Restaurant confirmed (1-3 mins after order)
-        restaurant_confirmed_time = order_placed_time + timedelta(minutes=random.randint(1, 3))
-        
-        # Actual prep time (varies around avg)
-        actual_prep_mins = max(5, avg_prep + random.randint(-5, 10))
-        food_ready_time = restaurant_confirmed_time + timedelta(minutes=actual_prep_mins)
-        
-        # Rider pickup (2-8 mins after food ready)
-        rider_picked_up_time = food_ready_time + timedelta(minutes=random.randint(2, 8))
-        
-        # Determine if peak hour and delivery status
-        is_peak = is_peak_hour(order_datetime)
-        delivery_status = get_delivery_status(is_peak)
-        
-        # Estimated delivery time (typically 30-45 mins from order)
-        estimated_mins = random.randint(30, 45)
-        estimated_delivery_time = order_placed_time + timedelta(minutes=estimated_mins)
-        
-        # Initialize variables
-        delivered_time = None
-        actual_delivery_time_mins = None
-        delay_reason = None
-        
-        # Actual delivery time based on status
-        if order_status == 'Cancelled':
-            delivered_time = None
-            actual_delivery_time_mins = None
-            delay_reason = None
-        elif order_status == 'In Progress':
-            delivered_time = None
-            actual_delivery_time_mins = None
-            delay_reason = None
-        else:  # Delivered
-            # Rider travel time (10-25 mins)
-            base_travel_time = random.randint(10, 25)
-            
-            if delivery_status == 'on_time':
-                # Ensure delivered before estimated
-                delivered_time = rider_picked_up_time + timedelta(minutes=base_travel_time)
-                # Adjust if would be late
-                if delivered_time > estimated_delivery_time:
-                    delivered_time = estimated_delivery_time - timedelta(minutes=random.randint(1, 5))
-                delay_reason = None
-                
-            elif delivery_status == 'late_minor':
-                # 1-15 mins late
-                delay_mins = random.randint(1, 14)
-                delivered_time = estimated_delivery_time + timedelta(minutes=delay_mins)
-                delay_reason = np.random.choice(DELAY_REASONS, p=DELAY_REASON_WEIGHTS)
-                
-            else:  # late_major
-                # 15-45 mins late
-                delay_mins = random.randint(15, 45)
-                delivered_time = estimated_delivery_time + timedelta(minutes=delay_mins)
-                delay_reason = np.random.choice(DELAY_REASONS, p=DELAY_REASON_WEIGHTS)
-            
-            # Calculate actual delivery time in mins
-            if delivered_time:
-                actual_delivery_time_mins = round((delivered_time - order_placed_time).total_seconds() / 60, 2)
-        
-        events.append({
-            'event_id': f'EVT_{idx+1:05d}',
-            'order_id': order_id,
-            'rider_id': random.choice(rider_ids),
-            'order_placed_time': order_placed_time,
-            'restaurant_confirmed_time': restaurant_confirmed_time,
-            'food_ready_time': food_ready_time,
-            'rider_picked_up_time': rider_picked_up_time,
-            'delivered_time': delivered_time,
-            'estimated_delivery_time': estimated_delivery_time,
-            'actual_delivery_time_mins': actual_delivery_time_mins,
-            'delay_reason': delay_reason
-        })
-        
-        # Progress indicator
-        if (idx + 1) % 5000 == 0:
-            print(f"    Progress: {idx+1}/{len(orders_df)} events generated...")
+    # Get each restaurant's avg prep time
+    avg_prep = (
+        orders_df['restaurant_id']
+        .map(restaurants_df.set_index('restaurant_id')['avg_prep_time_mins'])
+        .fillna(20)
+        .to_numpy(dtype=np.int64)
+    )
+    
+    # Order placed time = order_datetime
+    order_placed_time = orders_df['order_datetime'].to_numpy(dtype='datetime64[s]')
+    
+    # Restaurant confirmed (1-3 mins after order)
+    restaurant_confirmed_time = order_placed_time + minutes(rng.integers(1, 4, size=n))
+    
+    # Actual prep time (varies around avg)
+    actual_prep_mins = np.maximum(5, avg_prep + rng.integers(-5, 11, size=n))
+    food_ready_time = restaurant_confirmed_time + minutes(actual_prep_mins)
+    
+    # Rider pickup (2-8 mins after food ready)
+    rider_picked_up_time = food_ready_time + minutes(rng.integers(2, 9, size=n))
     
-    df = pd.DataFrame(events)
-    print(f"  ✅ Generated {len(df)} delivery events")
+    # Determine if peak hour and delivery status
+    delivery_status = get_delivery_statuses(rng, is_peak_hour(order_placed_time))
+    
+    # Estimated delivery time (typically 30-45 mins from order), never less
+    # than the shortest rider trip (10 mins) after pickup, so slow kitchens
+    # get a later estimate instead of a delivery before pickup
+    estimated_delivery_time = np.maximum(
+        order_placed_time + minutes(rng.integers(30, 46, size=n)),
+        rider_picked_up_time + minutes(10)
+    )
+    
+    # Actual delivery time based on status
+    # On time: rider travel time (10-25 mins), pulled 1-5 mins before the
+    # estimate if it would otherwise be late (still at least 5 mins after pickup)
+    on_time_delivered = rider_picked_up_time + minutes(rng.integers(10, 26, size=n))
+    on_time_delivered = np.where(
+        on_time_delivered > estimated_delivery_time,
+        estimated_delivery_time - minutes(rng.integers(1, 6, size=n)),
+        on_time_delivered
+    )
+    # Late minor: 1-14 mins late; late major: 15-45 mins late
+    late_minor_delay = rng.integers(1, 15, size=n)
+    late_major_delay = rng.integers(15, 46, size=n)
+    delay_mins = np.where(delivery_status == 'late_minor', late_minor_delay, late_major_delay)
+    
+    delivered_time = np.where(
+        delivery_status == 'on_time',
+        on_time_delivered,
+        estimated_delivery_time + minutes(delay_mins)
+    )
+    reasons = weighted_choice(rng, DELAY_REASONS, DELAY_REASON_WEIGHTS, n)
+    delay_reason = np.where(delivery_status == 'on_time', None, reasons)
+    
+    # Cancelled and in-progress orders have no delivery
+    is_delivered = orders_df['order_status'].to_numpy() == 'Delivered'
+    delivered_time = np.where(is_delivered, delivered_time, np.datetime64('NaT'))
+    delay_reason = np.where(is_delivered, delay_reason, None)
+    
+    # Calculate actual delivery time in mins
+    actual_delivery_time_mins = ((delivered_time - order_placed_time) / np.timedelta64(1, 'm')).round(2)
+    
+    df = pd.DataFrame({
+        'event_id': make_ids('EVT_', start, n, width),
+        'order_id': orders_df['order_id'].to_numpy(dtype=object),
+        'rider_id': rider_ids[rng.integers(0, len(rider_ids), size=n)],
+        'order_placed_time': order_placed_time,
+        'restaurant_confirmed_time': restaurant_confirmed_time,
+        'food_ready_time': food_ready_time,
+        'rider_picked_up_time': rider_picked_up_time,
+        'delivered_time': delivered_time,
+        'estimated_delivery_time': estimated_delivery_time,
+        'actual_delivery_time_mins': actual_delivery_time_mins,
+        'delay_reason': delay_reason
+    })
     return df
 
 # =============================================================================
-# Step 11: Inject Data Quality Issues
+# Step 10: Inject Data Quality Issues
 # =============================================================================
 
-def inject_data_quality_issues(customers, restaurants, riders, orders, order_items, delivery_events):
-    """Inject all required data quality issues."""
-    print("\n🔧 Injecting data quality issues...")
-    
-    # Make copies to avoid modifying original during iteration
-    customers = customers.copy()
-    restaurants = restaurants.copy()
-    riders = riders.copy()
-    orders = orders.copy()
-    order_items = order_items.copy()
-    delivery_events = delivery_events.copy()
-    
-    # ----- 1. MISSING VALUES -----
-    print("  Adding missing values...")
-    
-    # Orders: ~100 missing discount_amount
-    missing_discount_idx = random.sample(range(len(orders)), 100)
-    orders.loc[missing_discount_idx, 'discount_amount'] = np.nan
-    print(f"    - Orders: {len(missing_discount_idx)} missing discount_amount")
-    
-    # Delivery Events: ~50 missing delay_reason for late orders (additional to normal)
-    late_orders_idx = delivery_events[delivery_events['delay_reason'].notna()].index.tolist()
-    if len(late_orders_idx) >= 50:
-        missing_delay_idx = random.sample(late_orders_idx, 50)
-        delivery_events.loc[missing_delay_idx, 'delay_reason'] = np.nan
-        print(f"    - Delivery Events: 50 missing delay_reason (for late orders)")
-    
-    # Riders: ~15 missing zone
-    missing_zone_idx = random.sample(range(len(riders)), 15)
-    riders.loc[missing_zone_idx, 'zone'] = np.nan
-    print(f"    - Riders: {len(missing_zone_idx)} missing zone")
-    
-    # ----- 2. DUPLICATES -----
-    print("  Adding duplicates...")
-    
-    # Orders: 100 duplicate order_id
-    dup_orders = orders.sample(n=100)
-    orders = pd.concat([orders, dup_orders], ignore_index=True)
-    print(f"    - Orders: Added 100 duplicate rows")
-    
-    # Delivery Events: 80 duplicate event_id
-    dup_events = delivery_events.sample(n=80)
-    delivery_events = pd.concat([delivery_events, dup_events], ignore_index=True)
-    print(f"    - Delivery Events: Added 80 duplicate rows")
-    
-    # Customers: 50 duplicate customer_id
-    dup_customers = customers.sample(n=50)
-    customers = pd.concat([customers, dup_customers], ignore_index=True)
-    print(f"    - Customers: Added 50 duplicate rows")
-    
-    # ----- 3. INCONSISTENT LABELS -----
-    print("  Adding inconsistent labels...")
-    
-    # City variations
-    city_variations = {
-        'Dubai': ['DUBAI', 'dubai', 'DXB'],
-        'Abu Dhabi': ['ABU DHABI', 'abu dhabi', 'AUH'],
-        'Sharjah': ['SHARJAH', 'sharjah', 'SHJ'],
-        'Ajman': ['AJMAN', 'ajman', 'AJM']
-    }
-    
-    for df in [customers, restaurants, riders]:
-        inconsistent_idx = random.sample(range(len(df)), min(int(len(df) * 0.10), len(df)))
-        for idx in inconsistent_idx:
-            original = df.loc[idx, 'city']
-            if pd.notna(original) and original in city_variations:
-                df.loc[idx, 'city'] = random.choice(city_variations[original])
-    print(f"    - Applied city variations (10% of rows)")
-    
-    # Cuisine variations
-    cuisine_variations = {
-        'Indian': ['indian', 'INDIAN', 'South Indian'],
-        'Asian': ['asian', 'ASIAN', 'Pan-Asian'],
-        'Western': ['western', 'WESTERN', 'Continental'],
-        'Emirati': ['emirati', 'EMIRATI', 'Khaleeji'],
-        'Healthy': ['healthy', 'HEALTHY', 'Health Food']
-    }
+CITY_VARIATIONS = {
+    'Dubai': ['DUBAI', 'dubai', 'DXB'],
+    'Abu Dhabi': ['ABU DHABI', 'abu dhabi', 'AUH'],
+    'Sharjah': ['SHARJAH', 'sharjah', 'SHJ'],
+    'Ajman': ['AJMAN', 'ajman', 'AJM']
+}
+
+CUISINE_VARIATIONS = {
+    'Indian': ['indian', 'INDIAN', 'South Indian'],
+    'Asian': ['asian', 'ASIAN', 'Pan-Asian'],
+    'Western': ['western', 'WESTERN', 'Continental'],
+    'Emirati': ['emirati', 'EMIRATI', 'Khaleeji'],
+    'Healthy': ['healthy', 'HEALTHY', 'Health Food']
+}
+
+STATUS_VARIATIONS = {
+    'Delivered': ['delivered', 'DELIVERED', 'Complete'],
+    'Cancelled': ['cancelled', 'CANCELLED', 'Canceled'],
+    'In Progress': ['in progress', 'IN PROGRESS', 'Processing']
+}
+
+MANIFEST_COLUMNS = ['table', 'row_id', 'issue', 'column']
+
+ID_COLUMNS = {
+    'CUSTOMERS': 'customer_id',
+    'RESTAURANTS': 'restaurant_id',
+    'RIDERS': 'rider_id',
+    'ORDERS': 'order_id',
+    'ORDER_ITEMS': 'item_id',
+    'DELIVERY_EVENTS': 'event_id'
+}
+
+# Issues injected into each table, applied in order. `rate` is the share of the
+# chunk's rows to corrupt (the 1x spec counts divided by the 1x row count);
+# `eligible` limits candidates to rows where that column is not null.
+QUALITY_ISSUES = {
+    'CUSTOMERS': [
+        {'issue': 'duplicate_row', 'kind': 'duplicate', 'rate': 50 / NUM_CUSTOMERS},
+        {'issue': 'city_variation', 'kind': 'relabel', 'column': 'city', 'rate': 0.10,
+         'variations': CITY_VARIATIONS},
+    ],
+    'RESTAURANTS': [
+        {'issue': 'city_variation', 'kind': 'relabel', 'column': 'city', 'rate': 0.10,
+         'variations': CITY_VARIATIONS},
+        {'issue': 'cuisine_variation', 'kind': 'relabel', 'column': 'cuisine_type', 'rate': 0.12,
+         'variations': CUISINE_VARIATIONS},
+        {'issue': 'prep_time_outlier', 'kind': 'random_int', 'column': 'avg_prep_time_mins',
+         'rate': 20 / NUM_RESTAURANTS, 'low': 61, 'high': 90},
+    ],
+    'RIDERS': [
+        {'issue': 'missing_zone', 'kind': 'missing', 'column': 'zone', 'rate': 15 / NUM_RIDERS},
+        {'issue': 'city_variation', 'kind': 'relabel', 'column': 'city', 'rate': 0.10,
+         'variations': CITY_VARIATIONS},
+    ],
+    'ORDERS': [
+        {'issue': 'missing_discount', 'kind': 'missing', 'column': 'discount_amount',
+         'rate': 100 / NUM_ORDERS},
+        {'issue': 'duplicate_row', 'kind': 'duplicate', 'rate': 100 / NUM_ORDERS},
+        {'issue': 'status_variation', 'kind': 'relabel', 'column': 'order_status', 'rate': 0.08,
+         'variations': STATUS_VARIATIONS},
+        {'issue': 'gross_amount_outlier', 'kind': 'random_float', 'column': 'gross_amount',
+         'rate': 50 / NUM_ORDERS, 'low': 1500, 'high': 3000},
+        {'issue': 'discount_over_gross', 'kind': 'multiple_of', 'column': 'discount_amount',
+         'source': 'gross_amount', 'rate': 10 / NUM_ORDERS, 'low': 1.1, 'high': 1.5,
+         'eligible': 'discount_amount'},
+    ],
+    'ORDER_ITEMS': [],
+    'DELIVERY_EVENTS': [
+        {'issue': 'missing_delay_reason', 'kind': 'missing', 'column': 'delay_reason',
+         'rate': 50 / NUM_DELIVERY_EVENTS, 'eligible': 'delay_reason'},
+        {'issue': 'duplicate_row', 'kind': 'duplicate', 'rate': 80 / NUM_DELIVERY_EVENTS},
+        {'issue': 'delivery_time_outlier', 'kind': 'random_float', 'column': 'actual_delivery_time_mins',
+         'rate': 40 / NUM_DELIVERY_EVENTS, 'low': 121, 'high': 180,
+         'eligible': 'actual_delivery_time_mins'},
+        {'issue': 'delivered_before_placed', 'kind': 'minutes_before', 'column': 'delivered_time',
+         'source': 'order_placed_time', 'rate': 20 / NUM_DELIVERY_EVENTS, 'low': 30, 'high': 60,
+         'eligible': 'delivered_time'},
+        {'issue': 'negative_delivery_time', 'kind': 'random_int', 'column': 'actual_delivery_time_mins',
+         'rate': 15 / NUM_DELIVERY_EVENTS, 'low': -60, 'high': -1,
+         'eligible': 'actual_delivery_time_mins'},
+    ],
+}
+
+def pick_rows(rng, df, spec):
+    """Positions of the rows an issue corrupts."""
+    if 'eligible' in spec:
+        candidates = np.flatnonzero(df[spec['eligible']].notna().to_numpy())
+    else:
+        candidates = np.arange(len(df))
+    count = min(int(round(spec['rate'] * len(df))), len(candidates))
+    return rng.choice(candidates, size=count, replace=False)
+
+def corrupted_values(rng, df, rows, spec):
+    """New values for the picked rows of spec['column']."""
+    kind, size = spec['kind'], len(rows)
+    if kind == 'missing':
+        return np.full(size, np.nan, dtype=object)
+    if kind == 'relabel':
+        # Map each label to one of its variants; labels without variants stay as they are
+        original = df[spec['column']].to_numpy(dtype=object)[rows]
+        labels = pd.Index(list(spec['variations']))
+        variant_table = np.array(list(spec['variations'].values()), dtype=object)
+        label_idx = labels.get_indexer(original)
+        known = label_idx >= 0
+        variant_idx = rng.integers(0, variant_table.shape[1], size=size)
+        values = original.copy()
+        values[known] = variant_table[label_idx[known], variant_idx[known]]
+        return values
+    if kind == 'random_int':
+        return rng.integers(spec['low'], spec['high'] + 1, size=size)
+    if kind == 'random_float':
+        return rng.uniform(spec['low'], spec['high'], size=size).round(2)
+    if kind == 'multiple_of':
+        source = df[spec['source']].to_numpy(dtype=float)[rows]
+        return (source * rng.uniform(spec['low'], spec['high'], size=size)).round(2)
+    if kind == 'minutes_before':
+        source = df[spec['source']].to_numpy(dtype='datetime64[s]')[rows]
+        minutes = rng.integers(spec['low'], spec['high'] + 1, size=size)
+        return source - minutes.astype('timedelta64[m]')
+    raise ValueError(f"Unknown issue kind: {kind}")
+
+def inject_quality_issues(rng, df, table):
+    """Apply a table's QUALITY_ISSUES to one chunk.
+
+    Returns the corrupted, shuffled chunk and a manifest of the corrupted row IDs.
+    """
+    id_column = ID_COLUMNS[table]
+    manifest = []
     
-    inconsistent_idx = random.sample(range(len(restaurants)), int(len(restaurants) * 0.12))
-    for idx in inconsistent_idx:
-        original = restaurants.loc[idx, 'cuisine_type']
-        if pd.notna(original) and original in cuisine_variations:
-            restaurants.loc[idx, 'cuisine_type'] = random.choice(cuisine_variations[original])
-    print(f"    - Applied cuisine variations (12% of restaurants)")
-    
-    # Status variations
-    status_variations = {
-        'Delivered': ['delivered', 'DELIVERED', 'Complete'],
-        'Cancelled': ['cancelled', 'CANCELLED', 'Canceled'],
-        'In Progress': ['in progress', 'IN PROGRESS', 'Processing']
-    }
+    # Corrupted columns are rebuilt and swapped in, so a shallow copy keeps the
+    # caller's frame intact without copying every column up front
+    df = df.copy(deep=False)
+    for spec in QUALITY_ISSUES[table]:
+        rows = pick_rows(rng, df, spec)
+        manifest.append(pd.DataFrame({
+            'table': table,
+            'row_id': df[id_column].to_numpy(dtype=object)[rows],
+            'issue': spec['issue'],
+            'column': spec.get('column', id_column)
+        }))
+        if spec['kind'] == 'duplicate':
+            df = pd.concat([df, df.iloc[rows]], ignore_index=True)
+        else:
+            column = df[spec['column']].to_numpy(copy=True)
+            if spec['kind'] == 'missing' and column.dtype.kind in 'iu':
+                column = column.astype(float)
+            column[rows] = corrupted_values(rng, df, rows, spec)
+            df[spec['column']] = column
     
-    inconsistent_idx = random.sample(range(len(orders)), int(len(orders) * 0.08))
-    for idx in inconsistent_idx:
-        original = orders.loc[idx, 'order_status']
-        if pd.notna(original) and original in status_variations:
-            orders.loc[idx, 'order_status'] = random.choice(status_variations[original])
-    print(f"    - Applied status variations (8% of orders)")
-    
-    # ----- 4. OUTLIERS -----
-    print("  Adding outliers...")
-    
-    # Orders: 50 gross_amount > AED 1,500
-    outlier_idx = random.sample(range(len(orders)), 50)
-    for idx in outlier_idx:
-        orders.loc[idx, 'gross_amount'] = round(random.uniform(1500, 3000), 2)
-    print(f"    - Orders: 50 gross_amount outliers (>1500 AED)")
-    
-    # Delivery Events: 40 actual_delivery_time_mins > 120
-    valid_delivery_idx = delivery_events[delivery_events['actual_delivery_time_mins'].notna()].index.tolist()
-    if len(valid_delivery_idx) >= 40:
-        outlier_idx = random.sample(valid_delivery_idx, 40)
-        for idx in outlier_idx:
-            delivery_events.loc[idx, 'actual_delivery_time_mins'] = round(random.uniform(121, 180), 2)
-    print(f"    - Delivery Events: 40 delivery time outliers (>120 mins)")
-    
-    # Restaurants: 20 avg_prep_time_mins > 60
-    outlier_idx = random.sample(range(len(restaurants)), 20)
-    for idx in outlier_idx:
-        restaurants.loc[idx, 'avg_prep_time_mins'] = random.randint(61, 90)
-    print(f"    - Restaurants: 20 prep time outliers (>60 mins)")
-    
-    # ----- 5. IMPOSSIBLE VALUES -----
-    print("  Adding impossible values...")
-    
-    # Orders: 20 delivered_time < order_placed_time
-    delivered_idx = delivery_events[delivery_events['delivered_time'].notna()].index.tolist()
-    if len(delivered_idx) >= 20:
-        impossible_idx = random.sample(delivered_idx, 20)
-        for idx in impossible_idx:
-            order_placed = delivery_events.loc[idx, 'order_placed_time']
-            # Make delivered_time 30-60 mins BEFORE order_placed_time
-            delivery_events.loc[idx, 'delivered_time'] = order_placed - timedelta(minutes=random.randint(30, 60))
-    print(f"    - Delivery Events: 20 impossible timestamps (delivered < placed)")
-    
-    # Delivery Events: 15 negative actual_delivery_time_mins
-    if len(valid_delivery_idx) >= 15:
-        negative_idx = random.sample(valid_delivery_idx, 15)
-        for idx in negative_idx:
-            delivery_events.loc[idx, 'actual_delivery_time_mins'] = random.randint(-60, -1)
-    print(f"    - Delivery Events: 15 negative delivery times")
-    
-    # Orders: 10 discount_amount > gross_amount
-    valid_orders_idx = orders[orders['discount_amount'].notna()].index.tolist()
-    if len(valid_orders_idx) >= 10:
-        impossible_discount_idx = random.sample(valid_orders_idx, 10)
-        for idx in impossible_discount_idx:
-            gross = orders.loc[idx, 'gross_amount']
-            orders.loc[idx, 'discount_amount'] = round(gross * random.uniform(1.1, 1.5), 2)
-    print(f"    - Orders: 10 discount > gross amount")
-    
-    # Shuffle all dataframes to mix in the issues
-    customers = customers.sample(frac=1).reset_index(drop=True)
-    restaurants = restaurants.sample(frac=1).reset_index(drop=True)
-    riders = riders.sample(frac=1).reset_index(drop=True)
-    orders = orders.sample(frac=1).reset_index(drop=True)
-    order_items = order_items.sample(frac=1).reset_index(drop=True)
-    delivery_events = delivery_events.sample(frac=1).reset_index(drop=True)
-    
-    print("✅ Data quality issues injected successfully!")
-    
-    return customers, restaurants, riders, orders, order_items, delivery_events
+    manifest = pd.concat(manifest, ignore_index=True) if manifest else pd.DataFrame(columns=MANIFEST_COLUMNS)
+    return shuffle(rng, df), manifest
+
+def shuffle(rng, df):
+    """Shuffle rows to mix in the issues."""
+    return df.sample(frac=1, random_state=rng).reset_index(drop=True)
 
 # =============================================================================
-# Step 12: Main Execution - Generate All Data
+# Step 11: Chunked Output
 # =============================================================================
 
-print("\n" + "="*60)
-print("🚀 STARTING DATA GENERATION")
-print("="*60 + "\n")
-
-# Generate base tables (clean data)
-customers_df = generate_customers()
-restaurants_df = generate_restaurants()
-riders_df = generate_riders()
-orders_df = generate_orders(customers_df, restaurants_df)
-order_items_df = generate_order_items(orders_df)
-delivery_events_df = generate_delivery_events(orders_df, riders_df, restaurants_df)
-
-# Inject data quality issues
-customers_df, restaurants_df, riders_df, orders_df, order_items_df, delivery_events_df = \
-    inject_data_quality_issues(
-        customers_df, restaurants_df, riders_df, 
-        orders_df, order_items_df, delivery_events_df
-    )
-
-print("\n" + "="*60)
-print("📊 FINAL DATA SUMMARY")
-print("="*60)
-print(f"  CUSTOMERS:       {len(customers_df):,} rows")
-print(f"  RESTAURANTS:     {len(restaurants_df):,} rows")
-print(f"  RIDERS:          {len(riders_df):,} rows")
-print(f"  ORDERS:          {len(orders_df):,} rows")
-print(f"  ORDER_ITEMS:     {len(order_items_df):,} rows")
-print(f"  DELIVERY_EVENTS: {len(delivery_events_df):,} rows")
+class TableWriter:
+    """Append generated chunks to one file per table (or one workbook for xlsx)."""
+    
+    def __init__(self, output_dir, fmt):
+        self.output_dir = Path(output_dir)
+        self.fmt = fmt
+        self.rows = {table: 0 for table in OUTPUT_TABLES}
+        self._sheets = {}
+        self._parquet_writers = {}
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def path(self, table=None):
+        """Output file for a table (the shared workbook for xlsx)."""
+        if self.fmt == 'xlsx':
+            return self.output_dir / 'BitesUAE_Dataset.xlsx'
+        return self.output_dir / f'{table}.{self.fmt}'
+    
+    def write(self, table, df):
+        """Append one chunk of a table."""
+        if self.fmt == 'xlsx':
+            # openpyxl cannot append to a sheet, so xlsx chunks are kept until close()
+            self._sheets.setdefault(table, []).append(df)
+        elif self.fmt == 'csv':
+            first = self.rows[table] == 0
+            df.to_csv(self.path(table), mode='w' if first else 'a', header=first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            writer = self._parquet_writers.get(table)
+            if writer is None:
+                chunk = pa.Table.from_pandas(df, preserve_index=False)
+                writer = pq.ParquetWriter(self.path(table), chunk.schema)
+                self._parquet_writers[table] = writer
+            else:
+                chunk = pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False)
+            writer.write_table(chunk)
+        self.rows[table] += len(df)
+    
+    def close(self):
+        """Flush buffered output and return the files written."""
+        if self.fmt == 'xlsx':
+            with pd.ExcelWriter(self.path(), engine='openpyxl') as writer:
+                for table in OUTPUT_TABLES:
+                    pd.concat(self._sheets[table], ignore_index=True).to_excel(writer, sheet_name=table, index=False)
+            self._sheets = {}
+            return [self.path()]
+        for writer in self._parquet_writers.values():
+            writer.close()
+        return [self.path(table) for table in OUTPUT_TABLES]
 
 # =============================================================================
-# Step 13: Export to Excel
+# Step 12: Parallel Shard Generation
 # =============================================================================
 
-print("\n📁 Exporting to Excel file...")
+# Lookup tables shared by every ORDERS shard, set once per worker process
+_DIMENSIONS = {}
 
-# Create Excel writer
-with pd.ExcelWriter('BitesUAE_Dataset.xlsx', engine='openpyxl') as writer:
-    customers_df.to_excel(writer, sheet_name='CUSTOMERS', index=False)
-    restaurants_df.to_excel(writer, sheet_name='RESTAURANTS', index=False)
-    riders_df.to_excel(writer, sheet_name='RIDERS', index=False)
-    orders_df.to_excel(writer, sheet_name='ORDERS', index=False)
-    order_items_df.to_excel(writer, sheet_name='ORDER_ITEMS', index=False)
-    delivery_events_df.to_excel(writer, sheet_name='DELIVERY_EVENTS', index=False)
+def corrupt(seed, table, df, shard):
+    """Inject a table's quality issues into one chunk using its own RNG stream."""
+    return inject_quality_issues(shard_rng(seed, table, shard, stream=1), df, table)
 
-print("✅ Excel file created: BitesUAE_Dataset.xlsx")
+def generate_dimension_table(seed, table, n, width, name_style):
+    """Build RESTAURANTS or RIDERS; returns the clean table and its corrupted copy."""
+    rng = shard_rng(seed, table, 0)
+    if table == 'RESTAURANTS':
+        df = generate_restaurants(rng, n, width)
+    else:
+        df = generate_riders(rng, n, width, name_style)
+    return df, corrupt(seed, table, df, 0)
+
+def generate_customer_shard(seed, shard, start, size, width, name_style):
+    """Build and corrupt one CUSTOMERS chunk."""
+    df = generate_customers(shard_rng(seed, 'CUSTOMERS', shard), size, start, width, name_style)
+    return corrupt(seed, 'CUSTOMERS', df, shard)
+
+def init_order_worker(restaurants_df, riders_df):
+    """Receive the dimension lookups once per worker instead of once per shard."""
+    _DIMENSIONS['RESTAURANTS'] = restaurants_df
+    _DIMENSIONS['RIDERS'] = riders_df
+
+def generate_order_shard(seed, shard, start, size, num_customers, widths):
+    """Build one shard of ORDERS with its ORDER_ITEMS and DELIVERY_EVENTS.
+
+    ORDERS and DELIVERY_EVENTS come back corrupted. ORDER_ITEMS comes back
+    clean and numbered from 1, because sequential item IDs depend on the
+    item counts of earlier shards and are assigned by the parent.
+    """
+    restaurants_df, riders_df = _DIMENSIONS['RESTAURANTS'], _DIMENSIONS['RIDERS']
+    
+    orders_df = generate_orders(shard_rng(seed, 'ORDERS', shard), num_customers, restaurants_df,
+                                size, start, widths['ORD_'], widths['CUST_'])
+    order_items_df = generate_order_items(shard_rng(seed, 'ORDER_ITEMS', shard), orders_df,
+                                          0, widths['ITM_'])
+    delivery_events_df = generate_delivery_events(shard_rng(seed, 'DELIVERY_EVENTS', shard), orders_df,
+                                                  riders_df, restaurants_df, start, widths['ORD_'])
+    return {
+        'ORDERS': corrupt(seed, 'ORDERS', orders_df, shard),
+        'ORDER_ITEMS': order_items_df,
+        'DELIVERY_EVENTS': corrupt(seed, 'DELIVERY_EVENTS', delivery_events_df, shard)
+    }
+
+def run_ordered(tasks, workers, initializer=None, initargs=()):
+    """Yield fn(*args) for each (fn, args) task, in task order.
+
+    Tasks run on up to `workers` processes. At most 2 * workers tasks are in
+    flight, so finished chunks never pile up waiting for the writer. Every
+    shard seeds its own RNGs, so results do not depend on the worker count.
+    """
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for fn, args in tasks:
+            yield fn(*args)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for fn, args in tasks:
+            pending.append(pool.submit(fn, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 # =============================================================================
-# Step 14: Download the file (Google Colab)
+# Step 13: Main Execution - Generate All Data
 # =============================================================================
 
-from google.colab import files
-files.download('BitesUAE_Dataset.xlsx')
-
-print("\n" + "="*60)
-print("🎉 DATA GENERATION COMPLETE!")
-print("="*60)
-print("\nThe file 'BitesUAE_Dataset.xlsx' contains 6 sheets:")
-print("  1. CUSTOMERS       - Customer master data")
-print("  2. RESTAURANTS     - Restaurant master data")
-print("  3. RIDERS          - Rider master data")
-print("  4. ORDERS          - Order transactions")
-print("  5. ORDER_ITEMS     - Order line items")
-print("  6. DELIVERY_EVENTS - Delivery tracking data")
-print("\n⚠️  Data quality issues have been injected as per spec.")
-print("    Run the cleaning pipeline before analysis!")
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Generate the synthetic BitesUAE raw dataset.")
+    parser.add_argument('--scale', type=float, default=1,
+                        help=f"Row-count multiplier, {MIN_SCALE}-{MAX_SCALE} (default: 1 = 25,000 orders)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"Random seed (default: {DEFAULT_SEED})")
+    parser.add_argument('--output-dir', type=Path, default=Path('.'),
+                        help="Directory to write the dataset to (default: current directory)")
+    parser.add_argument('--format', choices=['xlsx', 'csv', 'parquet'], default='xlsx',
+                        help="xlsx writes BitesUAE_Dataset.xlsx; csv/parquet stream one file per table")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows generated and written per chunk (default: {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument('--names', choices=list(NAME_STYLES), default=DEFAULT_NAME_STYLE,
+                        help="Customer/rider name vocabulary; uae mixes the UAE's main communities")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: all cores); output does not depend on it")
+    args = parser.parse_args(argv)
+    
+    if not MIN_SCALE <= args.scale <= MAX_SCALE:
+        parser.error(f"--scale must be between {MIN_SCALE} and {MAX_SCALE}")
+    if args.format == 'xlsx' and args.scale > MAX_XLSX_SCALE:
+        parser.error(f"xlsx output is limited to --scale {MAX_XLSX_SCALE}; use --format csv or parquet")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    num_customers = int(round(NUM_CUSTOMERS * args.scale))
+    num_restaurants = int(round(NUM_RESTAURANTS * args.scale))
+    num_riders = int(round(NUM_RIDERS * args.scale))
+    num_orders = int(round(NUM_ORDERS * args.scale))
+    
+    # One ID width per table so every chunk pads IDs the same way
+    widths = {
+        'CUST_': id_width(5, num_customers),
+        'ORD_': id_width(5, num_orders),
+        'ITM_': id_width(5, num_orders * ITEMS_PER_ORDER_BOUND)
+    }
+    
+    print("\n" + "="*60)
+    print("🚀 STARTING DATA GENERATION")
+    print("="*60)
+    print(f"  Scale: {args.scale:g}x | Seed: {args.seed} | Chunk size: {args.chunk_size:,} | Workers: {args.workers}")
+    print(f"  Names: {args.names}")
+    print(f"  Output: {args.output_dir} ({args.format})\n")
+    
+    writer = TableWriter(args.output_dir, args.format)
+    issue_counts = {}
+    
+    def write_corrupted(table, corrupted):
+        """Write a corrupted chunk together with its manifest."""
+        df, manifest = corrupted
+        writer.write(table, df)
+        writer.write(MANIFEST_TABLE, manifest)
+        for issue, count in manifest['issue'].value_counts().items():
+            issue_counts[(table, issue)] = issue_counts.get((table, issue), 0) + count
+    
+    # Phase 1: RESTAURANTS, RIDERS and CUSTOMERS chunks are independent
+    print("Generating RESTAURANTS, RIDERS and CUSTOMERS tables...")
+    tasks = [
+        (generate_dimension_table, (args.seed, 'RESTAURANTS', num_restaurants, id_width(3, num_restaurants), args.names)),
+        (generate_dimension_table, (args.seed, 'RIDERS', num_riders, id_width(3, num_riders), args.names))
+    ] + [
+        (generate_customer_shard, (args.seed, shard, start, size, widths['CUST_'], args.names))
+        for shard, start, size in chunk_bounds(num_customers, args.chunk_size)
+    ]
+    results = run_ordered(tasks, args.workers)
+    
+    # The clean dimension tables stay in memory as lookups for ORDERS shards
+    restaurants_df, corrupted = next(results)
+    write_corrupted('RESTAURANTS', corrupted)
+    riders_df, corrupted = next(results)
+    write_corrupted('RIDERS', corrupted)
+    for corrupted in results:
+        write_corrupted('CUSTOMERS', corrupted)
+    
+    # Phase 2: ORDERS shards, each with its ORDER_ITEMS and DELIVERY_EVENTS
+    print("Generating ORDERS, ORDER_ITEMS and DELIVERY_EVENTS tables...")
+    tasks = [
+        (generate_order_shard, (args.seed, shard, start, size, num_customers, widths))
+        for shard, start, size in chunk_bounds(num_orders, args.chunk_size)
+    ]
+    results = run_ordered(tasks, args.workers, init_order_worker, (restaurants_df, riders_df))
+    
+    item_offset = 0
+    for (shard, start, size), shard_tables in zip(chunk_bounds(num_orders, args.chunk_size), results):
+        write_corrupted('ORDERS', shard_tables['ORDERS'])
+        
+        order_items_df = shard_tables['ORDER_ITEMS']
+        order_items_df['item_id'] = make_ids('ITM_', item_offset, len(order_items_df), widths['ITM_'])
+        item_offset += len(order_items_df)
+        write_corrupted('ORDER_ITEMS', corrupt(args.seed, 'ORDER_ITEMS', order_items_df, shard))
+        
+        write_corrupted('DELIVERY_EVENTS', shard_tables['DELIVERY_EVENTS'])
+        print(f"    Progress: {start + size:,}/{num_orders:,} orders generated...")
+    
+    files = writer.close()
+    
+    print("\n" + "="*60)
+    print("📊 FINAL DATA SUMMARY")
+    print("="*60)
+    for table in TABLES:
+        print(f"  {table + ':':<17}{writer.rows[table]:,} rows")
+    
+    print("\n🔧 Data quality issues injected:")
+    for (table, issue), count in issue_counts.items():
+        print(f"    - {table}: {count:,} {issue}")
+    
+    print("\n" + "="*60)
+    print("🎉 DATA GENERATION COMPLETE!")
+    print("="*60)
+    print("\nFiles written:")
+    for path in files:
+        print(f"  {path}")
+    print(f"\n⚠️  Data quality issues have been injected as per spec ({MANIFEST_TABLE} lists the affected rows).")
+    print("    Run the cleaning pipeline before analysis!")
+
+if __name__ == '__main__':
+    main()
@@ -1,65 +1,104 @@
 # =============================================================================
 # BitesUAE - Data Cleaning Pipeline
 # Project C: UAE Food Delivery CX & Operations Dashboard
-# Run this in Google Colab after generating the raw dataset
+#
+# Usage:
+#   python scripts/02_clean_data.py                              # BitesUAE_Dataset.xlsx -> cleaned files
+#   python scripts/02_clean_data.py --input data/raw --output-dir data
+#   python scripts/02_clean_data.py --input data/raw --output-dir data --incremental
+#   python scripts/02_clean_data.py --input data/raw --output-dir data --streaming
+#
+# --input is the generator's xlsx workbook or a directory of its CSV/Parquet
+# tables. --incremental cleans only raw rows newer than the store's watermark
+# and not in its key index, and appends them to the Parquet store. --streaming cleans the fact tables
+# chunk by chunk, so memory does not grow with the input size.
 # =============================================================================
 
-# Step 1: Install and Import Libraries
-!pip install pandas numpy openpyxl --quiet
-
+# =============================================================================
+# Step 1: Import Libraries
+# =============================================================================
+import argparse
+import os
+import time
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+import sys
+from pathlib import Path
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 warnings.filterwarnings('ignore')
 
-print("✅ Libraries imported!")
+# Shared modules live in the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bitesuae.facts import EVENT_COLUMNS, ORDER_COLUMNS, RESTAURANT_COLUMNS, build_orders_full
+from bitesuae.schema import columns_of, id_key
+from bitesuae.store import (
+    FACT_TABLE, TABLES, append_table, delete_rows, part_paths, read_key_flags, read_state, read_table,
+    write_key_flags, write_state, write_store, write_table
+)
+
+# Primary key of each table
+ID_COLUMNS = {
+    'CUSTOMERS': 'customer_id',
+    'RESTAURANTS': 'restaurant_id',
+    'RIDERS': 'rider_id',
+    'ORDERS': 'order_id',
+    'ORDER_ITEMS': 'item_id',
+    'DELIVERY_EVENTS': 'event_id'
+}
+
+EXCEL_MAX_ROWS = 1_048_575  # One sheet row is taken by the header
+GROSS_CAP = 1500  # gross_amount above this is an outlier
+DEFAULT_CHUNK_SIZE = 250_000
+DEFAULT_SEED = 42
 
 # =============================================================================
 # Step 2: Load the Raw Dataset
 # =============================================================================
 
-# Upload the file first (or use the one already in Colab)
-from google.colab import files
-print("📁 Please upload 'BitesUAE_Dataset.xlsx'...")
-uploaded = files.upload()
-
-# Load all sheets
-print("\n📊 Loading dataset...")
-xlsx = pd.ExcelFile('BitesUAE_Dataset.xlsx')
+def read_raw_table(input_path, table):
+    """Read one raw table from an xlsx workbook or a CSV/Parquet directory."""
+    input_path = Path(input_path)
+    if input_path.is_dir():
+        if (input_path / f'{table}.parquet').exists():
+            df = pd.read_parquet(input_path / f'{table}.parquet')
+        else:
+            df = pd.read_csv(input_path / f'{table}.csv')
+    else:
+        df = pd.read_excel(input_path, table)
+    return parse_raw_types(df, table)
+
+def parse_raw_types(df, table):
+    """Parse a raw table's timestamps; CSV has no datetime type."""
+    for col in columns_of(table, 'datetime'):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    return df
 
-customers_raw = pd.read_excel(xlsx, 'CUSTOMERS')
-restaurants_raw = pd.read_excel(xlsx, 'RESTAURANTS')
-riders_raw = pd.read_excel(xlsx, 'RIDERS')
-orders_raw = pd.read_excel(xlsx, 'ORDERS')
-order_items_raw = pd.read_excel(xlsx, 'ORDER_ITEMS')
-delivery_events_raw = pd.read_excel(xlsx, 'DELIVERY_EVENTS')
+def load_raw(input_path):
+    """Load all raw tables as {table_name: DataFrame}."""
+    print(f"\n📊 Loading dataset from {input_path}...")
+    raw = {table: read_raw_table(input_path, table) for table in TABLES}
 
-print("✅ Dataset loaded successfully!")
-print(f"\n📋 Raw Data Row Counts:")
-print(f"   CUSTOMERS:       {len(customers_raw):,}")
-print(f"   RESTAURANTS:     {len(restaurants_raw):,}")
-print(f"   RIDERS:          {len(riders_raw):,}")
-print(f"   ORDERS:          {len(orders_raw):,}")
-print(f"   ORDER_ITEMS:     {len(order_items_raw):,}")
-print(f"   DELIVERY_EVENTS: {len(delivery_events_raw):,}")
+    print("✅ Dataset loaded successfully!")
+    print(f"\n📋 Raw Data Row Counts:")
+    for table, df in raw.items():
+        print(f"   {table + ':':<17}{len(df):,}")
+    return raw
 
 # =============================================================================
 # Step 3: Data Quality Assessment (Before Cleaning)
 # =============================================================================
 
-print("\n" + "="*70)
-print("🔍 DATA QUALITY ASSESSMENT - BEFORE CLEANING")
-print("="*70)
-
 def assess_quality(df, name, id_column):
     """Assess data quality issues in a dataframe."""
     print(f"\n📊 {name}:")
-    
+
     # Duplicates
     duplicates = df[id_column].duplicated().sum()
     print(f"   • Duplicate {id_column}: {duplicates}")
-    
+
     # Missing values
     missing = df.isnull().sum()
     missing_cols = missing[missing > 0]
@@ -69,55 +108,76 @@ def assess_quality(df, name, id_column):
             print(f"      - {col}: {count}")
     else:
         print(f"   • Missing values: None")
-    
+
     return duplicates
 
-# Assess each table
-dup_customers = assess_quality(customers_raw, "CUSTOMERS", "customer_id")
-dup_restaurants = assess_quality(restaurants_raw, "RESTAURANTS", "restaurant_id")
-dup_riders = assess_quality(riders_raw, "RIDERS", "rider_id")
-dup_orders = assess_quality(orders_raw, "ORDERS", "order_id")
-dup_items = assess_quality(order_items_raw, "ORDER_ITEMS", "item_id")
-dup_events = assess_quality(delivery_events_raw, "DELIVERY_EVENTS", "event_id")
-
-# Check inconsistent labels
-print(f"\n📊 INCONSISTENT LABELS:")
-print(f"   • Cities in CUSTOMERS: {customers_raw['city'].unique().tolist()}")
-print(f"   • Cuisines in RESTAURANTS: {restaurants_raw['cuisine_type'].unique().tolist()}")
-print(f"   • Order Statuses: {orders_raw['order_status'].unique().tolist()}")
-
-# Check outliers
-print(f"\n📊 POTENTIAL OUTLIERS:")
-print(f"   • Orders with gross_amount > 1500: {len(orders_raw[orders_raw['gross_amount'] > 1500])}")
-print(f"   • Deliveries with time > 120 mins: {len(delivery_events_raw[delivery_events_raw['actual_delivery_time_mins'] > 120])}")
-print(f"   • Restaurants with prep_time > 60: {len(restaurants_raw[restaurants_raw['avg_prep_time_mins'] > 60])}")
-
-# Check impossible values
-print(f"\n📊 IMPOSSIBLE VALUES:")
-# Negative delivery times
-negative_times = delivery_events_raw[delivery_events_raw['actual_delivery_time_mins'] < 0]
-print(f"   • Negative delivery times: {len(negative_times)}")
-
-# Discount > Gross
-invalid_discounts = orders_raw[orders_raw['discount_amount'] > orders_raw['gross_amount']]
-print(f"   • Discount > Gross amount: {len(invalid_discounts)}")
-
-# Delivered before ordered
-delivery_events_raw['order_placed_time'] = pd.to_datetime(delivery_events_raw['order_placed_time'])
-delivery_events_raw['delivered_time'] = pd.to_datetime(delivery_events_raw['delivered_time'])
-impossible_times = delivery_events_raw[
-    delivery_events_raw['delivered_time'].notna() & 
-    (delivery_events_raw['delivered_time'] < delivery_events_raw['order_placed_time'])
-]
-print(f"   • Delivered before ordered: {len(impossible_times)}")
+def assess_raw(raw):
+    """Print the data quality issues found in the raw tables."""
+    print("\n" + "="*70)
+    print("🔍 DATA QUALITY ASSESSMENT - BEFORE CLEANING")
+    print("="*70)
+
+    # Assess each table
+    for table, id_column in ID_COLUMNS.items():
+        assess_quality(raw[table], table, id_column)
+
+    customers_raw = raw['CUSTOMERS']
+    restaurants_raw = raw['RESTAURANTS']
+    orders_raw = raw['ORDERS']
+    delivery_events_raw = raw['DELIVERY_EVENTS']
+
+    # Check inconsistent labels
+    print(f"\n📊 INCONSISTENT LABELS:")
+    print(f"   • Cities in CUSTOMERS: {customers_raw['city'].unique().tolist()}")
+    print(f"   • Cuisines in RESTAURANTS: {restaurants_raw['cuisine_type'].unique().tolist()}")
+    print(f"   • Order Statuses: {orders_raw['order_status'].unique().tolist()}")
+
+    # Check outliers
+    print(f"\n📊 POTENTIAL OUTLIERS:")
+    print(f"   • Orders with gross_amount > {GROSS_CAP}: {len(orders_raw[orders_raw['gross_amount'] > GROSS_CAP])}")
+    print(f"   • Deliveries with time > 120 mins: {len(delivery_events_raw[delivery_events_raw['actual_delivery_time_mins'] > 120])}")
+    print(f"   • Restaurants with prep_time > 60: {len(restaurants_raw[restaurants_raw['avg_prep_time_mins'] > 60])}")
+
+    # Check impossible values
+    print(f"\n📊 IMPOSSIBLE VALUES:")
+    # Negative delivery times
+    negative_times = delivery_events_raw[delivery_events_raw['actual_delivery_time_mins'] < 0]
+    print(f"   • Negative delivery times: {len(negative_times)}")
+
+    # Discount > Gross
+    invalid_discounts = orders_raw[orders_raw['discount_amount'] > orders_raw['gross_amount']]
+    print(f"   • Discount > Gross amount: {len(invalid_discounts)}")
+
+    # Delivered before ordered
+    impossible_times = delivery_events_raw[
+        delivery_events_raw['delivered_time'].notna() &
+        (delivery_events_raw['delivered_time'] < delivery_events_raw['order_placed_time'])
+    ]
+    print(f"   • Delivered before ordered: {len(impossible_times)}")
 
 # =============================================================================
-# Step 4: Create Cleaning Functions
+# Step 4: Cleaning Rule Engine
 # =============================================================================
-
-print("\n" + "="*70)
-print("🧹 STARTING DATA CLEANING")
-print("="*70)
+# Each table is cleaned by a list of declarative rules (CLEANING_RULES),
+# run in order by run_rules. Row filters are combined into one keep-mask,
+# so the raw frame is subset once instead of being copied per pass. Column
+# rules read and write single cached columns, and the cleaned frame is
+# assembled once at the end: a rule costs a vectorized pass over the
+# columns it touches, never a full-table scan or copy.
+#
+# Rule keys: rule (name), kind, column, plus the kind's parameters:
+#   dedupe         keep the first row per `column` value         (row filter)
+#   orphans        keep rows whose `column` is in ctx[reference] (row filter)
+#   standardize    map label variants through `mapping`
+#   cap            values above `upper` become `value` (default: `upper`)
+#   clip           clip into [`lower`, `upper`]
+#   fillna         missing values become `value`
+#   nullify        values where `where(cols)` is True become missing
+#   replace_where  values where `where(cols)` is True become `value(cols)`
+#   derive         `column` = `fn(cols, ctx)`
+#   custom         `fn(cols, ctx)` returns ({column: values}, rows affected), optionally
+#                  followed by {label: rows} reported as `rule.label`
+# `upper` and `value` may be callables of ctx, resolved when the rule runs.
 
 # ---- Standardization Mappings ----
 CITY_MAPPING = {
@@ -148,392 +208,969 @@ TIER_MAPPING = {
     'vip': 'VIP', 'Vip': 'VIP'
 }
 
-def standardize_column(df, column, mapping):
-    """Standardize values in a column using a mapping dictionary."""
-    df[column] = df[column].replace(mapping)
-    return df
+# Rule lists per table, filled in by Steps 6-11
+CLEANING_RULES = {}
 
-def remove_duplicates(df, id_column, name):
-    """Remove duplicate rows based on ID column."""
-    before = len(df)
-    df = df.drop_duplicates(subset=[id_column], keep='first')
-    after = len(df)
-    print(f"   ✓ {name}: Removed {before - after} duplicates")
-    return df
+class TableColumns(dict):
+    """Column cache for one table; a column is subset by the keep-mask on first use."""
 
-# =============================================================================
-# Step 5: Clean CUSTOMERS Table
-# =============================================================================
+    def __init__(self, df, keep):
+        super().__init__()
+        self.df = df
+        self.keep = None if keep.all() else keep
+        self.index = df.index if self.keep is None else df.index[self.keep]
 
-print("\n🧹 Cleaning CUSTOMERS...")
-customers = customers_raw.copy()
+    def __missing__(self, column):
+        values = self.df[column] if self.keep is None else self.df[column][self.keep]
+        self[column] = values
+        return values
 
-# 1. Remove duplicates
-customers = remove_duplicates(customers, 'customer_id', 'CUSTOMERS')
+    def put(self, column, values):
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values, index=self.index)
+        self[column] = values
 
-# 2. Standardize city names
-customers = standardize_column(customers, 'city', CITY_MAPPING)
-print(f"   ✓ Standardized city names")
+def resolve(param, ctx):
+    return param(ctx) if callable(param) else param
 
-# 3. Standardize customer tier (if any variations)
-customers = standardize_column(customers, 'customer_tier', TIER_MAPPING)
-print(f"   ✓ Standardized customer tiers")
+def filter_dedupe(df, spec, ctx):
+    return ~df[spec['column']].duplicated(keep='first').to_numpy()
 
-# 4. Validate signup_date (should not be in future)
-today = pd.Timestamp.now().date()
-future_dates = customers['signup_date'] > pd.Timestamp(today)
-if future_dates.any():
-    customers.loc[future_dates, 'signup_date'] = today
-    print(f"   ✓ Fixed {future_dates.sum()} future signup dates")
+def filter_orphans(df, spec, ctx):
+    # Hash-based isin is fastest on plain object arrays
+    reference = np.asarray(ctx[spec['reference']], dtype=object)
+    return df[spec['column']].astype(object).isin(reference).to_numpy()
 
-print(f"   ✅ CUSTOMERS cleaned: {len(customers)} rows")
+# Standardized label per (mapping, raw value), shared by every table and chunk
+LABEL_CACHE = {}
 
-# =============================================================================
-# Step 6: Clean RESTAURANTS Table
-# =============================================================================
-
-print("\n🧹 Cleaning RESTAURANTS...")
-restaurants = restaurants_raw.copy()
-
-# 1. Remove duplicates
-restaurants = remove_duplicates(restaurants, 'restaurant_id', 'RESTAURANTS')
-
-# 2. Standardize city names
-restaurants = standardize_column(restaurants, 'city', CITY_MAPPING)
-print(f"   ✓ Standardized city names")
-
-# 3. Standardize cuisine types
-restaurants = standardize_column(restaurants, 'cuisine_type', CUISINE_MAPPING)
-print(f"   ✓ Standardized cuisine types")
-
-# 4. Cap outlier prep times at 60 minutes
-outlier_prep = restaurants['avg_prep_time_mins'] > 60
-restaurants.loc[outlier_prep, 'avg_prep_time_mins'] = 60
-print(f"   ✓ Capped {outlier_prep.sum()} outlier prep times to 60 mins")
-
-# 5. Ensure rating is between 1-5
-restaurants['rating'] = restaurants['rating'].clip(1.0, 5.0)
-print(f"   ✓ Validated ratings (1-5 range)")
+def standard_label(mapping, raw):
+    """Case-fold, trim and alias-map one raw label; unknown labels are only trimmed."""
+    key = (id(mapping), raw)
+    if key not in LABEL_CACHE:
+        if not isinstance(raw, str):
+            LABEL_CACHE[key] = raw
+        else:
+            aliases = {alias.strip().casefold(): label for alias, label in mapping.items()}
+            aliases.update({label.casefold(): label for label in mapping.values()})
+            LABEL_CACHE[key] = aliases.get(raw.strip().casefold(), raw.strip())
+    return LABEL_CACHE[key]
+
+def rule_standardize(cols, spec, ctx):
+    """Standardize the column's distinct values, then broadcast them back
+    through categorical codes. The output is a Categorical whose categories
+    start with the mapping's standard labels, so every chunk and store part
+    shares one category order."""
+    values = cols[spec['column']]
+    raw = values.array if isinstance(values.dtype, pd.CategoricalDtype) else pd.Categorical(values)
+    labels = [standard_label(spec['mapping'], label) for label in raw.categories]
+
+    categories = list(dict.fromkeys(spec['mapping'].values()))
+    categories += sorted(set(labels) - set(categories))
+    lookup = np.append(pd.Index(categories).get_indexer(labels), -1)  # -1 keeps missing values
+    codes = lookup[raw.codes]
+
+    changed = np.array([label != original for label, original in zip(labels, raw.categories)], dtype=bool)
+    affected = np.bincount(raw.codes[raw.codes >= 0], minlength=len(labels))[changed].sum()
+    return {spec['column']: pd.Categorical.from_codes(codes, categories=categories)}, affected
+
+def rule_cap(cols, spec, ctx):
+    values = cols[spec['column']]
+    upper = resolve(spec['upper'], ctx)
+    over = values > upper
+    return {spec['column']: values.mask(over, resolve(spec.get('value', upper), ctx))}, over.sum()
+
+def rule_clip(cols, spec, ctx):
+    values = cols[spec['column']]
+    clipped = values.clip(spec.get('lower'), spec.get('upper'))
+    return {spec['column']: clipped}, (values.notna() & (clipped != values)).sum()
+
+def rule_fillna(cols, spec, ctx):
+    values = cols[spec['column']]
+    return {spec['column']: values.fillna(spec['value'])}, values.isna().sum()
+
+def rule_nullify(cols, spec, ctx):
+    values = cols[spec['column']]
+    where = spec['where'](cols)
+    return {spec['column']: values.mask(where)}, (where & values.notna()).sum()
+
+def rule_replace_where(cols, spec, ctx):
+    values = cols[spec['column']]
+    where = spec['where'](cols)
+    return {spec['column']: values.mask(where, spec['value'](cols))}, where.sum()
+
+def rule_derive(cols, spec, ctx):
+    values = spec['fn'](cols, ctx)
+    return {spec['column']: values}, len(values)
+
+def rule_custom(cols, spec, ctx):
+    return spec['fn'](cols, ctx)
+
+FILTER_KINDS = {'dedupe': filter_dedupe, 'orphans': filter_orphans}
+
+COLUMN_KINDS = {
+    'standardize': rule_standardize,
+    'cap': rule_cap,
+    'clip': rule_clip,
+    'fillna': rule_fillna,
+    'nullify': rule_nullify,
+    'replace_where': rule_replace_where,
+    'derive': rule_derive,
+    'custom': rule_custom
+}
 
-print(f"   ✅ RESTAURANTS cleaned: {len(restaurants)} rows")
+def run_rules(df, rules, ctx):
+    """Apply a table's rules; return the cleaned frame and (rule, rows, seconds) per rule.
+
+    Row filters run first and only narrow a shared keep-mask. Column rules
+    then run in list order against the column cache.
+    """
+    report = []
+    keep = np.ones(len(df), dtype=bool)
+    for spec in rules:
+        if spec['kind'] in FILTER_KINDS:
+            start = time.perf_counter()
+            mask = FILTER_KINDS[spec['kind']](df, spec, ctx)
+            report.append((spec['rule'], int((keep & ~mask).sum()), time.perf_counter() - start))
+            keep &= mask
+
+    cols = TableColumns(df, keep)
+    columns = list(df.columns)
+    for spec in rules:
+        if spec['kind'] in COLUMN_KINDS:
+            start = time.perf_counter()
+            updates, affected, *details = COLUMN_KINDS[spec['kind']](cols, spec, ctx)
+            for column, values in updates.items():
+                cols.put(column, values)
+                if column not in columns:
+                    columns.append(column)
+            report.append((spec['rule'], int(affected), time.perf_counter() - start))
+            for label, rows in (details[0] if details else {}).items():
+                report.append((f"{spec['rule']}.{label}", int(rows), 0.0))
+
+    return pd.DataFrame({column: cols[column] for column in columns}), report
+
+def print_report(table, report, rows):
+    """Print rows affected and time taken per rule."""
+    for rule, affected, seconds in report:
+        print(f"   ✓ {rule:<38}{affected:>10,} rows {seconds * 1000:>9.1f} ms")
+    print(f"   ✅ {table} cleaned: {rows:,} rows")
+
+def clean_table(table, df, ctx, verbose=True):
+    """Clean one raw table with its CLEANING_RULES."""
+    cleaned, report = run_rules(df, CLEANING_RULES[table], ctx)
+    if verbose:
+        print(f"\n🧹 Cleaning {table}...")
+        print_report(table, report, len(cleaned))
+    return cleaned, report
 
 # =============================================================================
-# Step 7: Clean RIDERS Table
+# Step 5: Repairs and Calculated Columns Used by the Rules
 # =============================================================================
 
-print("\n🧹 Cleaning RIDERS...")
-riders = riders_raw.copy()
-
-# 1. Remove duplicates
-riders = remove_duplicates(riders, 'rider_id', 'RIDERS')
-
-# 2. Standardize city names
-riders = standardize_column(riders, 'city', CITY_MAPPING)
-print(f"   ✓ Standardized city names")
-
-# 3. Fill missing zones with 'Unknown'
-missing_zones = riders['zone'].isna().sum()
-riders['zone'] = riders['zone'].fillna('Unknown')
-print(f"   ✓ Filled {missing_zones} missing zones with 'Unknown'")
-
-print(f"   ✅ RIDERS cleaned: {len(riders)} rows")
+# Delivery stages in the order they must happen
+TIMELINE = ['order_placed_time', 'restaurant_confirmed_time', 'food_ready_time',
+            'rider_picked_up_time', 'delivered_time']
+
+# Delivery performance categories, in category order
+DELIVERY_PERFORMANCE = ['On Time', 'Late (<15 min)', 'Late (>15 min)', 'Not Delivered', 'Unknown']
+LATE_THRESHOLD_MINS = 15
+
+# Shortest rider trip kept when stages are moved back before delivered_time
+MIN_RIDER_TRIP = np.timedelta64(10, 'm')
+
+DELAY_REASONS = ['Restaurant Prep Delay', 'High Traffic', 'Rider Delayed at Pickup', 'Wrong Address', 'Weather']
+
+def tenure_days(dates, ctx):
+    return (ctx['now'] - dates).dt.days
+
+def cap_gross_outliers(cols, ctx):
+    """gross_amount above GROSS_CAP becomes ctx['gross_fill'] (default: the
+    99th percentile of the remaining amounts)."""
+    gross = cols['gross_amount']
+    outlier = gross > GROSS_CAP
+    gross_fill = ctx.get('gross_fill')
+    if gross_fill is None:
+        gross_fill = gross[~outlier].quantile(0.99)
+    return {'gross_amount': gross.mask(outlier, gross_fill)}, outlier.sum()
+
+def gross_fill_of(orders):
+    """The fill cap_gross_outliers computes for an ORDERS table, from its first occurrences."""
+    gross = orders['gross_amount'][~orders['order_id'].duplicated().to_numpy()]
+    return float(gross[gross <= GROSS_CAP].quantile(0.99))
+
+def repair_timeline(cols, ctx):
+    """Make every event's stage timestamps non-decreasing with array operations.
+
+    delivered_time before order_placed_time is redrawn 35-50 minutes after
+    the order was placed. Otherwise delivered_time, which the customer saw
+    and delivery_performance is classified on, is kept. A stage earlier
+    than the last known stage before it is raised to that stage. Where the
+    stages then run past delivered_time, their offsets from
+    order_placed_time are scaled down until the last one plus MIN_RIDER_TRIP
+    fits before it, so prep_time_mins and rider_time_mins shrink in
+    proportion instead of dropping to zero. Missing stages are skipped.
+    Also returns the stamps changed per stage.
+    """
+    original = {col: cols[col].to_numpy(dtype='datetime64[ns]') for col in TIMELINE}
+    times = dict(original)
+    placed = times['order_placed_time']
+
+    # NaT never compares as earlier or later, so missing stamps are left alone
+    impossible = times['delivered_time'] < placed
+    delivered = times['delivered_time'].copy()
+    delivered[impossible] = placed[impossible] + ctx['rng'].integers(35, 50, impossible.sum()).astype('timedelta64[m]')
+    times['delivered_time'] = delivered
+
+    middle = TIMELINE[1:-1]
+    floor = placed
+    for col in middle:
+        times[col] = np.where(times[col] < floor, floor, times[col])
+        floor = np.where(np.isnat(times[col]), floor, times[col])
+
+    overrun = floor > delivered
+    scale = (delivered - placed)[overrun] / ((floor - placed)[overrun] + MIN_RIDER_TRIP)
+    for col in middle:
+        offsets = ((times[col] - placed)[overrun] * scale).astype('timedelta64[s]')
+        times[col] = times[col].copy()
+        times[col][overrun] = placed[overrun] + offsets
+
+    changed = {col: ~((times[col] == original[col]) | np.isnat(original[col])) for col in TIMELINE[1:]}
+    fixed = np.logical_or.reduce(list(changed.values()))
+    stamps = {col.removesuffix('_time'): early.sum() for col, early in changed.items()}
+    return {col: times[col] for col in TIMELINE[1:]}, fixed.sum(), stamps
+
+def recompute_delivery_time(cols, ctx):
+    """actual_delivery_time_mins from the timestamps where both are known."""
+    minutes = ((cols['delivered_time'] - cols['order_placed_time']).dt.total_seconds() / 60).round(2)
+    return minutes.fillna(cols['actual_delivery_time_mins'])
+
+def is_late(cols):
+    return cols['delivered_time'] > cols['estimated_delivery_time']
+
+def fill_delay_reasons(cols, ctx):
+    """Late deliveries without a delay_reason get a random one."""
+    reasons = cols['delay_reason']
+    missing = is_late(cols) & reasons.isna()
+    filled = reasons.astype(object)
+    filled[missing] = ctx['rng'].choice(DELAY_REASONS, size=missing.sum())
+    return {'delay_reason': filled}, missing.sum()
+
+def classify_delivery(delivered_time, estimated_delivery_time):
+    """Return (delivery_performance, delay_minutes) for whole timestamp columns.
+
+    The delay is computed once and drives both outputs. The category checks
+    run in the old row-by-row order: not delivered, no estimate, on time,
+    then late by up to 15 minutes or by more.
+    """
+    delay = ((delivered_time - estimated_delivery_time).dt.total_seconds() / 60).to_numpy()
+    codes = np.select(
+        [delivered_time.isna().to_numpy(), estimated_delivery_time.isna().to_numpy(),
+         delay <= 0, delay <= LATE_THRESHOLD_MINS],
+        [3, 4, 0, 1],
+        default=2
+    )
+    performance = pd.Categorical.from_codes(codes, categories=DELIVERY_PERFORMANCE)
+
+    # Delay minutes (if late)
+    delay_minutes = np.where(delay > 0, delay, 0).round(2)
+    return performance, delay_minutes
+
+def delivery_performance(cols, ctx):
+    performance, delay_minutes = classify_delivery(cols['delivered_time'], cols['estimated_delivery_time'])
+    return {'delivery_performance': performance, 'delay_minutes': delay_minutes}, len(delay_minutes)
 
 # =============================================================================
-# Step 8: Clean ORDERS Table
+# Step 6: CUSTOMERS Rules
 # =============================================================================
 
-print("\n🧹 Cleaning ORDERS...")
-orders = orders_raw.copy()
-
-# 1. Remove duplicates
-orders = remove_duplicates(orders, 'order_id', 'ORDERS')
-
-# 2. Standardize order status
-orders = standardize_column(orders, 'order_status', STATUS_MAPPING)
-print(f"   ✓ Standardized order statuses")
-
-# 3. Fix impossible discounts (discount > gross)
-invalid_discount_mask = orders['discount_amount'] > orders['gross_amount']
-# Set discount to 20% of gross for these cases
-orders.loc[invalid_discount_mask, 'discount_amount'] = orders.loc[invalid_discount_mask, 'gross_amount'] * 0.20
-print(f"   ✓ Fixed {invalid_discount_mask.sum()} invalid discounts")
-
-# 4. Fill missing discount_amount with 0
-missing_discounts = orders['discount_amount'].isna().sum()
-orders['discount_amount'] = orders['discount_amount'].fillna(0)
-print(f"   ✓ Filled {missing_discounts} missing discounts with 0")
-
-# 5. Recalculate net_amount
-orders['net_amount'] = orders['gross_amount'] - orders['discount_amount']
-orders['net_amount'] = orders['net_amount'].round(2)
-print(f"   ✓ Recalculated net_amount")
-
-# 6. Cap gross_amount outliers at 1500 (99th percentile approach)
-gross_cap = 1500
-outlier_gross = orders['gross_amount'] > gross_cap
-# For outliers, set to a reasonable max value
-orders.loc[outlier_gross, 'gross_amount'] = orders.loc[~outlier_gross, 'gross_amount'].quantile(0.99)
-orders.loc[outlier_gross, 'net_amount'] = orders.loc[outlier_gross, 'gross_amount'] - orders.loc[outlier_gross, 'discount_amount']
-print(f"   ✓ Capped {outlier_gross.sum()} gross_amount outliers")
-
-# 7. Clear cancellation_reason for non-cancelled orders
-non_cancelled = orders['order_status'] != 'Cancelled'
-orders.loc[non_cancelled, 'cancellation_reason'] = None
-print(f"   ✓ Validated cancellation_reason field")
-
-# 8. Ensure delivery_fee is non-negative
-orders['delivery_fee'] = orders['delivery_fee'].clip(lower=0)
-print(f"   ✓ Validated delivery fees")
-
-print(f"   ✅ ORDERS cleaned: {len(orders)} rows")
+CLEANING_RULES['CUSTOMERS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'customer_id'},
+    {'rule': 'standardize_city', 'kind': 'standardize', 'column': 'city', 'mapping': CITY_MAPPING},
+    {'rule': 'standardize_customer_tier', 'kind': 'standardize', 'column': 'customer_tier',
+     'mapping': TIER_MAPPING},
+    # signup_date should not be in the future
+    {'rule': 'cap_future_signup_dates', 'kind': 'cap', 'column': 'signup_date',
+     'upper': lambda ctx: ctx['today']},
+    # Calculated columns for analysis
+    {'rule': 'derive_tenure_days', 'kind': 'derive', 'column': 'tenure_days',
+     'fn': lambda cols, ctx: tenure_days(cols['signup_date'], ctx)}
+]
 
 # =============================================================================
-# Step 9: Clean ORDER_ITEMS Table
+# Step 7: RESTAURANTS Rules
 # =============================================================================
 
-print("\n🧹 Cleaning ORDER_ITEMS...")
-order_items = order_items_raw.copy()
-
-# 1. Remove duplicates
-order_items = remove_duplicates(order_items, 'item_id', 'ORDER_ITEMS')
-
-# 2. Remove orphan items (order_id not in orders)
-valid_order_ids = set(orders['order_id'])
-before = len(order_items)
-order_items = order_items[order_items['order_id'].isin(valid_order_ids)]
-print(f"   ✓ Removed {before - len(order_items)} orphan items")
+CLEANING_RULES['RESTAURANTS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'restaurant_id'},
+    {'rule': 'standardize_city', 'kind': 'standardize', 'column': 'city', 'mapping': CITY_MAPPING},
+    {'rule': 'standardize_cuisine_type', 'kind': 'standardize', 'column': 'cuisine_type',
+     'mapping': CUISINE_MAPPING},
+    {'rule': 'cap_prep_time_at_60', 'kind': 'cap', 'column': 'avg_prep_time_mins', 'upper': 60},
+    {'rule': 'clip_rating_1_to_5', 'kind': 'clip', 'column': 'rating', 'lower': 1.0, 'upper': 5.0}
+]
 
-# 3. Ensure quantity is positive
-order_items['quantity'] = order_items['quantity'].clip(lower=1)
-print(f"   ✓ Validated quantities")
+# =============================================================================
+# Step 8: RIDERS Rules
+# =============================================================================
 
-# 4. Ensure unit_price is positive
-order_items['unit_price'] = order_items['unit_price'].clip(lower=0.01)
-print(f"   ✓ Validated unit prices")
+CLEANING_RULES['RIDERS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'rider_id'},
+    {'rule': 'standardize_city', 'kind': 'standardize', 'column': 'city', 'mapping': CITY_MAPPING},
+    {'rule': 'fill_missing_zones', 'kind': 'fillna', 'column': 'zone', 'value': 'Unknown'},
+    # Calculated columns for analysis
+    {'rule': 'derive_tenure_days', 'kind': 'derive', 'column': 'tenure_days',
+     'fn': lambda cols, ctx: tenure_days(cols['join_date'], ctx)}
+]
 
-# 5. Recalculate item_total
-order_items['item_total'] = (order_items['unit_price'] * order_items['quantity']).round(2)
-print(f"   ✓ Recalculated item_total")
+# =============================================================================
+# Step 9: ORDERS Rules
+# =============================================================================
 
-print(f"   ✅ ORDER_ITEMS cleaned: {len(order_items)} rows")
+CLEANING_RULES['ORDERS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'order_id'},
+    {'rule': 'standardize_order_status', 'kind': 'standardize', 'column': 'order_status',
+     'mapping': STATUS_MAPPING},
+    # Discount > gross becomes 20% of gross
+    {'rule': 'fix_discount_over_gross', 'kind': 'replace_where', 'column': 'discount_amount',
+     'where': lambda cols: cols['discount_amount'] > cols['gross_amount'],
+     'value': lambda cols: cols['gross_amount'] * 0.20},
+    {'rule': 'fill_missing_discounts', 'kind': 'fillna', 'column': 'discount_amount', 'value': 0},
+    {'rule': 'cap_gross_outliers', 'kind': 'custom', 'fn': cap_gross_outliers},
+    {'rule': 'recompute_net_amount', 'kind': 'derive', 'column': 'net_amount',
+     'fn': lambda cols, ctx: (cols['gross_amount'] - cols['discount_amount']).round(2)},
+    {'rule': 'clear_cancellation_reason', 'kind': 'nullify', 'column': 'cancellation_reason',
+     'where': lambda cols: cols['order_status'] != 'Cancelled'},
+    {'rule': 'clip_negative_delivery_fees', 'kind': 'clip', 'column': 'delivery_fee', 'lower': 0},
+    # Calculated columns for analysis
+    {'rule': 'derive_order_date', 'kind': 'derive', 'column': 'order_date',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.date},
+    {'rule': 'derive_order_hour', 'kind': 'derive', 'column': 'order_hour',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.hour},
+    {'rule': 'derive_order_day_of_week', 'kind': 'derive', 'column': 'order_day_of_week',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.day_name()},
+    {'rule': 'derive_order_month', 'kind': 'derive', 'column': 'order_month',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.to_period('M').astype(str)},
+    {'rule': 'derive_order_week', 'kind': 'derive', 'column': 'order_week',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.to_period('W').astype(str)},
+    # Friday, Saturday in UAE
+    {'rule': 'derive_is_weekend', 'kind': 'derive', 'column': 'is_weekend',
+     'fn': lambda cols, ctx: cols['order_datetime'].dt.dayofweek.isin([4, 5])},
+    # Peak hours 12-13, 19-21
+    {'rule': 'derive_is_peak_hour', 'kind': 'derive', 'column': 'is_peak_hour',
+     'fn': lambda cols, ctx: cols['order_hour'].isin([12, 13, 19, 20, 21])}
+]
 
 # =============================================================================
-# Step 10: Clean DELIVERY_EVENTS Table
+# Step 10: ORDER_ITEMS Rules
 # =============================================================================
 
-print("\n🧹 Cleaning DELIVERY_EVENTS...")
-delivery_events = delivery_events_raw.copy()
+CLEANING_RULES['ORDER_ITEMS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'item_id'},
+    {'rule': 'drop_orphan_items', 'kind': 'orphans', 'column': 'order_id', 'reference': 'valid_order_ids'},
+    {'rule': 'clip_quantity_min_1', 'kind': 'clip', 'column': 'quantity', 'lower': 1},
+    {'rule': 'clip_unit_price_min_0_01', 'kind': 'clip', 'column': 'unit_price', 'lower': 0.01},
+    {'rule': 'recompute_item_total', 'kind': 'derive', 'column': 'item_total',
+     'fn': lambda cols, ctx: (cols['unit_price'] * cols['quantity']).round(2)}
+]
 
-# 1. Remove duplicates
-delivery_events = remove_duplicates(delivery_events, 'event_id', 'DELIVERY_EVENTS')
+# =============================================================================
+# Step 11: DELIVERY_EVENTS Rules
+# =============================================================================
 
-# 2. Remove orphan events (order_id not in orders)
-before = len(delivery_events)
-delivery_events = delivery_events[delivery_events['order_id'].isin(valid_order_ids)]
-print(f"   ✓ Removed {before - len(delivery_events)} orphan events")
+CLEANING_RULES['DELIVERY_EVENTS'] = [
+    {'rule': 'drop_duplicate_ids', 'kind': 'dedupe', 'column': 'event_id'},
+    {'rule': 'drop_orphan_events', 'kind': 'orphans', 'column': 'order_id', 'reference': 'valid_order_ids'},
+    {'rule': 'repair_timeline', 'kind': 'custom', 'fn': repair_timeline},
+    {'rule': 'nullify_negative_delivery_times', 'kind': 'nullify', 'column': 'actual_delivery_time_mins',
+     'where': lambda cols: cols['actual_delivery_time_mins'] < 0},
+    {'rule': 'recompute_delivery_times', 'kind': 'derive', 'column': 'actual_delivery_time_mins',
+     'fn': recompute_delivery_time},
+    {'rule': 'cap_delivery_time_at_120', 'kind': 'cap', 'column': 'actual_delivery_time_mins', 'upper': 120},
+    {'rule': 'fill_late_delay_reasons', 'kind': 'custom', 'fn': fill_delay_reasons},
+    {'rule': 'clear_on_time_delay_reasons', 'kind': 'nullify', 'column': 'delay_reason',
+     'where': lambda cols: cols['delivered_time'] <= cols['estimated_delivery_time']},
+    # Calculated columns for analysis
+    {'rule': 'classify_delivery_performance', 'kind': 'custom', 'fn': delivery_performance}
+]
 
-# 3. Convert datetime columns
-datetime_cols = ['order_placed_time', 'restaurant_confirmed_time', 'food_ready_time', 
-                 'rider_picked_up_time', 'delivered_time', 'estimated_delivery_time']
-for col in datetime_cols:
-    delivery_events[col] = pd.to_datetime(delivery_events[col], errors='coerce')
+# =============================================================================
+# Step 12: Run the Cleaning Pipeline
+# =============================================================================
 
-# 4. Fix impossible timestamps (delivered_time < order_placed_time)
-impossible_mask = (
-    delivery_events['delivered_time'].notna() & 
-    (delivery_events['delivered_time'] < delivery_events['order_placed_time'])
-)
-# For these, recalculate delivered_time as order_placed + reasonable delivery time
-for idx in delivery_events[impossible_mask].index:
-    order_placed = delivery_events.loc[idx, 'order_placed_time']
-    # Set delivered to 35-50 mins after order placed
-    delivery_events.loc[idx, 'delivered_time'] = order_placed + timedelta(minutes=np.random.randint(35, 50))
-print(f"   ✓ Fixed {impossible_mask.sum()} impossible timestamps")
-
-# 5. Fix negative delivery times
-negative_mask = delivery_events['actual_delivery_time_mins'] < 0
-delivery_events.loc[negative_mask, 'actual_delivery_time_mins'] = np.nan
-print(f"   ✓ Nullified {negative_mask.sum()} negative delivery times")
-
-# 6. Recalculate actual_delivery_time_mins where possible
-has_both_times = (
-    delivery_events['delivered_time'].notna() & 
-    delivery_events['order_placed_time'].notna()
-)
-delivery_events.loc[has_both_times, 'actual_delivery_time_mins'] = (
-    (delivery_events.loc[has_both_times, 'delivered_time'] - 
-     delivery_events.loc[has_both_times, 'order_placed_time']).dt.total_seconds() / 60
-).round(2)
-print(f"   ✓ Recalculated delivery times")
-
-# 7. Cap outlier delivery times at 120 minutes
-outlier_delivery = delivery_events['actual_delivery_time_mins'] > 120
-delivery_events.loc[outlier_delivery, 'actual_delivery_time_mins'] = 120
-print(f"   ✓ Capped {outlier_delivery.sum()} outlier delivery times")
-
-# 8. Fill missing delay_reason for late deliveries
-# First identify late deliveries
-late_mask = (
-    delivery_events['delivered_time'].notna() & 
-    delivery_events['estimated_delivery_time'].notna() &
-    (delivery_events['delivered_time'] > delivery_events['estimated_delivery_time']) &
-    delivery_events['delay_reason'].isna()
-)
-delay_reasons = ['Restaurant Prep Delay', 'High Traffic', 'Rider Delayed at Pickup', 'Wrong Address', 'Weather']
-delivery_events.loc[late_mask, 'delay_reason'] = np.random.choice(delay_reasons, size=late_mask.sum())
-print(f"   ✓ Filled {late_mask.sum()} missing delay reasons for late deliveries")
-
-# 9. Clear delay_reason for on-time deliveries
-on_time_mask = (
-    delivery_events['delivered_time'].notna() & 
-    delivery_events['estimated_delivery_time'].notna() &
-    (delivery_events['delivered_time'] <= delivery_events['estimated_delivery_time'])
-)
-delivery_events.loc[on_time_mask, 'delay_reason'] = None
-print(f"   ✓ Validated delay_reason for on-time deliveries")
+# Cleaning DAG: each table's context values taken from cleaned upstream tables,
+# as {ctx key: (table, column)}. Tables not listed here have no dependencies.
+TABLE_DEPENDENCIES = {
+    'ORDER_ITEMS': {'valid_order_ids': ('ORDERS', 'order_id')},
+    'DELIVERY_EVENTS': {'valid_order_ids': ('ORDERS', 'order_id')},
+}
 
-print(f"   ✅ DELIVERY_EVENTS cleaned: {len(delivery_events)} rows")
+# Raw tables of the current run, set once per worker process
+_RAW = {}
+
+def cleaning_context(rng, now=None, **values):
+    """Shared inputs for the rules: the seeded RNG and the run's clock."""
+    now = pd.Timestamp.now() if now is None else now
+    return {'rng': rng, 'now': now, 'today': now.normalize(), **values}
+
+def table_rng(seed, table):
+    """Independent random stream per table, so results do not depend on run order."""
+    return np.random.default_rng([seed, TABLES.index(table)])
+
+def init_clean_worker(raw):
+    """Receive the raw tables once per worker instead of once per task."""
+    _RAW.clear()
+    _RAW.update(raw)
+
+def clean_task(table, ctx):
+    """Clean one raw table in a worker; returns (cleaned, report, seconds)."""
+    start = time.perf_counter()
+    cleaned, report = clean_table(table, _RAW[table], ctx, verbose=False)
+    return cleaned, report, time.perf_counter() - start
+
+def ready_tables(pending, done):
+    """Pending tables whose dependencies are cleaned, the most depended-on first."""
+    ready = [table for table in pending
+             if all(upstream in done for upstream, _ in TABLE_DEPENDENCIES.get(table, {}).values())]
+    dependents = {table: sum(table in {upstream for upstream, _ in deps.values()}
+                             for deps in TABLE_DEPENDENCIES.values()) for table in ready}
+    return sorted(ready, key=lambda table: -dependents[table])
+
+def run_dag(raw, make_ctx, workers):
+    """Yield (table, cleaned, report, seconds) as each table finishes.
+
+    A table is submitted as soon as every table it depends on is cleaned,
+    so independent tables clean at the same time on up to `workers`
+    processes. `make_ctx(table, done)` builds a table's rule context.
+    """
+    pending, done = list(raw), {}
+    if workers == 1:
+        init_clean_worker(raw)
+        while pending:
+            table = ready_tables(pending, done)[0]
+            pending.remove(table)
+            done[table], report, seconds = clean_task(table, make_ctx(table, done))
+            yield table, done[table], report, seconds
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_clean_worker, initargs=(raw,)) as pool:
+        running = {}
+        while pending or running:
+            for table in ready_tables(pending, done):
+                pending.remove(table)
+                running[pool.submit(clean_task, table, make_ctx(table, done))] = table
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                table = running.pop(future)
+                done[table], report, seconds = future.result()
+                yield table, done[table], report, seconds
+
+def clean_tables(raw, seed, known_order_ids=(), workers=1, gross_fill=None):
+    """Clean every raw table with its rules, following TABLE_DEPENDENCIES.
+
+    `seed` drives the random repairs. `known_order_ids` are orders already
+    in the store, so items and events of earlier batches are not treated as
+    orphans in incremental runs. `gross_fill` replaces gross_amount outliers
+    (default: computed from this run's orders).
+    """
+    print("\n" + "="*70)
+    print(f"🧹 STARTING DATA CLEANING ({workers} worker{'s' if workers > 1 else ''})")
+    print("="*70)
+
+    now = pd.Timestamp.now()
+
+    def make_ctx(table, done):
+        values = {key: pd.Index(done[upstream][column])
+                  for key, (upstream, column) in TABLE_DEPENDENCIES.get(table, {}).items()}
+        if 'valid_order_ids' in values:
+            values['valid_order_ids'] = values['valid_order_ids'].append(pd.Index(known_order_ids))
+        return cleaning_context(table_rng(seed, table), now, gross_fill=gross_fill, **values)
+
+    start = time.perf_counter()
+    tables, busy = {}, 0.0
+    for table, cleaned, report, seconds in run_dag(raw, make_ctx, min(workers, len(raw))):
+        print(f"\n🧹 Cleaned {table} in {seconds:.2f}s")
+        print_report(table, report, len(cleaned))
+        tables[table] = cleaned
+        busy += seconds
+    print(f"\n⏱️  Cleaned {len(tables)} tables in {time.perf_counter() - start:.2f}s "
+          f"({busy:.2f}s of table time)")
+
+    return {table: tables[table] for table in TABLES}
 
 # =============================================================================
-# Step 11: Add Calculated Columns for Analysis
+# Step 13: Final Validation
 # =============================================================================
 
-print("\n📐 Adding calculated columns for analysis...")
+def validate(tables):
+    """Print the data quality checks for the cleaned tables."""
+    customers = tables['CUSTOMERS']
+    restaurants = tables['RESTAURANTS']
+    riders = tables['RIDERS']
+    orders = tables['ORDERS']
+    delivery_events = tables['DELIVERY_EVENTS']
+
+    print("\n" + "="*70)
+    print("✅ DATA QUALITY ASSESSMENT - AFTER CLEANING")
+    print("="*70)
+
+    print(f"\n📋 Final Row Counts:")
+    for table, df in tables.items():
+        print(f"   {table + ':':<17}{len(df):,}")
+
+    print(f"\n📊 Validation Checks:")
+    print(f"   • Duplicate customer_id: {customers['customer_id'].duplicated().sum()}")
+    print(f"   • Duplicate restaurant_id: {restaurants['restaurant_id'].duplicated().sum()}")
+    print(f"   • Duplicate rider_id: {riders['rider_id'].duplicated().sum()}")
+    print(f"   • Duplicate order_id: {orders['order_id'].duplicated().sum()}")
+    print(f"   • Duplicate event_id: {delivery_events['event_id'].duplicated().sum()}")
+
+    print(f"\n📊 Standardized Values:")
+    print(f"   • Cities: {customers['city'].unique().tolist()}")
+    print(f"   • Cuisines: {restaurants['cuisine_type'].unique().tolist()}")
+    print(f"   • Order Statuses: {orders['order_status'].unique().tolist()}")
+
+    print(f"\n📊 Outliers Remaining:")
+    print(f"   • Orders with gross_amount > {GROSS_CAP}: {len(orders[orders['gross_amount'] > GROSS_CAP])}")
+    print(f"   • Deliveries with time > 120 mins: {len(delivery_events[delivery_events['actual_delivery_time_mins'] > 120])}")
+
+    print(f"\n📊 Impossible Values Remaining:")
+    print(f"   • Negative delivery times: {len(delivery_events[delivery_events['actual_delivery_time_mins'] < 0])}")
+    print(f"   • Discount > Gross: {len(orders[orders['discount_amount'] > orders['gross_amount']])}")
 
-# ---- ORDERS: Add time-based columns ----
-orders['order_datetime'] = pd.to_datetime(orders['order_datetime'])
-orders['order_date'] = orders['order_datetime'].dt.date
-orders['order_hour'] = orders['order_datetime'].dt.hour
-orders['order_day_of_week'] = orders['order_datetime'].dt.day_name()
-orders['order_month'] = orders['order_datetime'].dt.to_period('M').astype(str)
-orders['order_week'] = orders['order_datetime'].dt.to_period('W').astype(str)
+# =============================================================================
+# Step 14: Export Cleaned Dataset
+# =============================================================================
 
-# Is weekend flag
-orders['is_weekend'] = orders['order_datetime'].dt.dayofweek.isin([4, 5])  # Friday, Saturday in UAE
+def export(tables, output_dir, gross_fill):
+    """Write the cleaned workbook, per-table CSVs and the Parquet store.
 
-# Peak hour flag (12-13, 19-21)
-orders['is_peak_hour'] = orders['order_hour'].isin([12, 13, 19, 20, 21])
+    `gross_fill` is kept in the store's state for later incremental runs.
+    """
+    print("\n" + "="*70)
+    print("📁 EXPORTING CLEANED DATASET")
+    print("="*70)
 
-print("   ✓ Added time-based columns to ORDERS")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-# ---- DELIVERY_EVENTS: Add performance columns ----
-# Delivery performance category
-def categorize_delivery(row):
-    if pd.isna(row['delivered_time']):
-        return 'Not Delivered'
-    elif pd.isna(row['estimated_delivery_time']):
-        return 'Unknown'
-    elif row['delivered_time'] <= row['estimated_delivery_time']:
-        return 'On Time'
+    # Export to Excel (sheets cap at ~1M rows, so large runs skip the workbook)
+    if max(len(df) for df in tables.values()) <= EXCEL_MAX_ROWS:
+        with pd.ExcelWriter(output_dir / 'BitesUAE_Cleaned.xlsx', engine='openpyxl') as writer:
+            for table, df in tables.items():
+                df.to_excel(writer, sheet_name=table, index=False)
+        print("✅ Exported: BitesUAE_Cleaned.xlsx")
     else:
-        delay_mins = (row['delivered_time'] - row['estimated_delivery_time']).total_seconds() / 60
-        if delay_mins <= 15:
-            return 'Late (<15 min)'
-        else:
-            return 'Late (>15 min)'
-
-delivery_events['delivery_performance'] = delivery_events.apply(categorize_delivery, axis=1)
-
-# Delay minutes (if late)
-delivery_events['delay_minutes'] = np.where(
-    delivery_events['delivered_time'] > delivery_events['estimated_delivery_time'],
-    (delivery_events['delivered_time'] - delivery_events['estimated_delivery_time']).dt.total_seconds() / 60,
-    0
-).round(2)
+        print("⚠️  Skipped BitesUAE_Cleaned.xlsx: a table exceeds Excel's row limit")
 
-print("   ✓ Added performance columns to DELIVERY_EVENTS")
+    # Also export as CSV files (useful for Power BI)
+    for table, df in tables.items():
+        df.to_csv(output_dir / f'{table}.csv', index=False)
 
-# ---- CUSTOMERS: Add tenure ----
-customers['signup_date'] = pd.to_datetime(customers['signup_date'])
-customers['tenure_days'] = (pd.Timestamp.now() - customers['signup_date']).dt.days
+    print("✅ Exported: Individual CSV files")
 
-print("   ✓ Added tenure column to CUSTOMERS")
+    # Columnar store read by the dashboard (typed Parquet, one directory per table)
+    store_dir = output_dir / 'store'
+    write_store(tables, store_dir)
+    write_state(watermarks(tables, {'gross_fill': gross_fill}), store_dir)
+    write_key_index(tables, store_dir)
+    facts = build_orders_full(tables['ORDERS'], tables['RESTAURANTS'], tables['RIDERS'],
+                              tables['DELIVERY_EVENTS'])
+    write_table(facts, FACT_TABLE, store_dir)
 
-# ---- RIDERS: Add tenure ----
-riders['join_date'] = pd.to_datetime(riders['join_date'])
-riders['tenure_days'] = (pd.Timestamp.now() - riders['join_date']).dt.days
-
-print("   ✓ Added tenure column to RIDERS")
-
-print("✅ Calculated columns added!")
+    print(f"✅ Exported: Parquet store ({store_dir}/), including {FACT_TABLE} for the dashboard")
 
 # =============================================================================
-# Step 12: Final Validation
+# Step 15: Incremental Cleaning
 # =============================================================================
 
-print("\n" + "="*70)
-print("✅ DATA QUALITY ASSESSMENT - AFTER CLEANING")
-print("="*70)
-
-print(f"\n📋 Final Row Counts:")
-print(f"   CUSTOMERS:       {len(customers):,}")
-print(f"   RESTAURANTS:     {len(restaurants):,}")
-print(f"   RIDERS:          {len(riders):,}")
-print(f"   ORDERS:          {len(orders):,}")
-print(f"   ORDER_ITEMS:     {len(order_items):,}")
-print(f"   DELIVERY_EVENTS: {len(delivery_events):,}")
-
-print(f"\n📊 Validation Checks:")
-print(f"   • Duplicate customer_id: {customers['customer_id'].duplicated().sum()}")
-print(f"   • Duplicate restaurant_id: {restaurants['restaurant_id'].duplicated().sum()}")
-print(f"   • Duplicate rider_id: {riders['rider_id'].duplicated().sum()}")
-print(f"   • Duplicate order_id: {orders['order_id'].duplicated().sum()}")
-print(f"   • Duplicate event_id: {delivery_events['event_id'].duplicated().sum()}")
-
-print(f"\n📊 Standardized Values:")
-print(f"   • Cities: {customers['city'].unique().tolist()}")
-print(f"   • Cuisines: {restaurants['cuisine_type'].unique().tolist()}")
-print(f"   • Order Statuses: {orders['order_status'].unique().tolist()}")
-
-print(f"\n📊 Outliers Remaining:")
-print(f"   • Orders with gross_amount > 1500: {len(orders[orders['gross_amount'] > 1500])}")
-print(f"   • Deliveries with time > 120 mins: {len(delivery_events[delivery_events['actual_delivery_time_mins'] > 120])}")
-
-print(f"\n📊 Impossible Values Remaining:")
-print(f"   • Negative delivery times: {len(delivery_events[delivery_events['actual_delivery_time_mins'] < 0])}")
-print(f"   • Discount > Gross: {len(orders[orders['discount_amount'] > orders['gross_amount']])}")
+class IdBitmap:
+    """Set of table IDs kept as one flag per ID number.
+
+    Generated IDs are dense (PREFIX_00001 ... PREFIX_N), so membership and
+    first-occurrence checks are array lookups at one byte per possible ID,
+    however many duplicate rows the raw table carries. IDs without a
+    numeric part are never members.
+    """
+
+    def __init__(self, flags=None):
+        self.flags = np.zeros(0, dtype=bool) if flags is None else flags
+
+    @staticmethod
+    def _numbers(ids):
+        numbers = id_key(ids)
+        if numbers.dtype.kind == 'f':
+            numbers = np.where(np.isnan(numbers), -1, numbers).astype(np.int64)
+        return numbers
+
+    def _grow(self, numbers):
+        if len(numbers) and numbers.max() >= len(self.flags):
+            flags = np.zeros(max(int(numbers.max()) + 1, 2 * len(self.flags)), dtype=bool)
+            flags[:len(self.flags)] = self.flags
+            self.flags = flags
+
+    def contains(self, ids):
+        numbers = self._numbers(ids)
+        inside = (numbers >= 0) & (numbers < len(self.flags))
+        found = np.zeros(len(numbers), dtype=bool)
+        found[inside] = self.flags[numbers[inside]]
+        return found
+
+    def add(self, ids):
+        numbers = self._numbers(ids)
+        numbers = numbers[numbers >= 0]
+        self._grow(numbers)
+        self.flags[numbers] = True
+
+    def add_first_seen(self, ids):
+        """Add IDs; return the mask of rows that are their ID's first occurrence."""
+        numbers = self._numbers(ids)
+        _, first_rows = np.unique(numbers, return_index=True)
+        first = np.zeros(len(numbers), dtype=bool)
+        first[first_rows] = True
+        first[numbers < 0] = True
+        first &= ~self.contains(ids)
+        self.add(ids)
+        return first
+
+    @classmethod
+    def load(cls, table, store_dir):
+        """The store's key index of a table; built once from its ID column for stores written without one."""
+        flags = read_key_flags(store_dir, table)
+        if flags is not None:
+            return cls(flags)
+        bitmap = cls()
+        bitmap.add(read_table(table, store_dir, [ID_COLUMNS[table]])[ID_COLUMNS[table]])
+        return bitmap
+
+    def save(self, table, store_dir):
+        write_key_flags(self.flags, table, store_dir)
+
+def write_key_index(tables, store_dir):
+    """Write the key index of every cleaned table to the store."""
+    for table, df in tables.items():
+        bitmap = IdBitmap()
+        bitmap.add(df[ID_COLUMNS[table]])
+        bitmap.save(table, store_dir)
+
+def watermarks(tables, state=None):
+    """Advance the order_datetime watermark past the cleaned orders."""
+    state = dict(state or {})
+    # Stores written before the key index also kept an event_id watermark
+    state.pop('event_id', None)
+    orders = tables.get('ORDERS', [])
+
+    if len(orders):
+        latest = orders['order_datetime'].max()
+        if state.get('order_datetime') is None or latest > pd.Timestamp(state['order_datetime']):
+            state['order_datetime'] = latest.isoformat()
+    return state
+
+def select_new_rows(raw, state, key_index):
+    """Keep raw rows whose IDs are not in the store's key index yet.
+
+    ORDERS must also be past the order_datetime watermark. Event IDs do not
+    follow order time, so DELIVERY_EVENTS have no watermark: an event is
+    new when its event_id is unseen, which covers the events of this run's
+    new orders and late events of stored ones. Checking IDs against the
+    key index costs the same however long the store's history is.
+    """
+    new = {}
+    for table, df in raw.items():
+        if table == 'ORDERS' and state.get('order_datetime'):
+            df = df[df['order_datetime'] > pd.Timestamp(state['order_datetime'])]
+        new[table] = df[~key_index[table].contains(df[ID_COLUMNS[table]])]
+        print(f"   {table + ':':<17}{len(new[table]):,} new of {len(raw[table]):,} raw rows")
+    return new
+
+def stored_order_ids(new, key_index):
+    """Order IDs the new items and events reference that are already in the store."""
+    referenced = pd.concat([new['ORDER_ITEMS']['order_id'], new['DELIVERY_EVENTS']['order_id']]).drop_duplicates()
+    return referenced[key_index['ORDERS'].contains(referenced)]
+
+def append_orders_full(tables, store_dir):
+    """Append the fact rows of newly cleaned orders to the store's ORDERS_FULL.
+
+    Events appended for orders already in the store (late events) replace
+    those orders' fact rows, rebuilt from the stored ORDERS and events, so
+    the dashboard sees every stored event. Only the ORDERS_FULL parts
+    holding those orders are rewritten.
+    """
+    if not part_paths(store_dir, FACT_TABLE):
+        # Store written before ORDERS_FULL existed: build it from every stored order
+        facts = build_orders_full(read_table('ORDERS', store_dir, ORDER_COLUMNS),
+                                  read_table('RESTAURANTS', store_dir, RESTAURANT_COLUMNS),
+                                  read_table('RIDERS', store_dir, ['rider_id']),
+                                  read_table('DELIVERY_EVENTS', store_dir, EVENT_COLUMNS))
+        write_table(facts, FACT_TABLE, store_dir)
+        print(f"   ✓ {FACT_TABLE}: built {len(facts):,} rows")
+        return
+
+    # Stored orders with newly appended events (late events) get their fact rows rebuilt
+    events = tables['DELIVERY_EVENTS']
+    late_ids = events['order_id'][~events['order_id'].isin(tables['ORDERS']['order_id'])].unique().tolist()
+    orders = tables['ORDERS']
+    if late_ids:
+        events = read_table('DELIVERY_EVENTS', store_dir, EVENT_COLUMNS,
+                            filters=[('order_id', 'in', late_ids + tables['ORDERS']['order_id'].tolist())])
+        orders = pd.concat([orders[ORDER_COLUMNS],
+                            read_table('ORDERS', store_dir, ORDER_COLUMNS, filters=[('order_id', 'in', late_ids)])],
+                           ignore_index=True)
+        orders = orders.drop_duplicates('order_id')
+
+    # Surrogate keys are row positions in the stored dimension tables, new rows included
+    facts = build_orders_full(orders, read_table('RESTAURANTS', store_dir, RESTAURANT_COLUMNS),
+                              read_table('RIDERS', store_dir, ['rider_id']), events)
+    refreshed = delete_rows(FACT_TABLE, store_dir, 'order_id', late_ids) if late_ids else 0
+    if len(facts):
+        append_table(facts, FACT_TABLE, store_dir)
+    print(f"   ✓ {FACT_TABLE}: appended {len(facts) - refreshed:,} rows, refreshed {refreshed:,} with late events")
+
+def run_incremental(raw, store_dir, state, seed, workers=1):
+    """Clean only the new raw rows and append them to the Parquet store."""
+    print("\n" + "="*70)
+    print("➕ INCREMENTAL CLEANING")
+    print("="*70)
+    if state.get('gross_fill') is None:
+        # Stores written before the fill was kept: derive it from the stored (already capped) amounts
+        state['gross_fill'] = gross_fill_of(read_table('ORDERS', store_dir, ['order_id', 'gross_amount']))
+    print(f"\n📍 Watermark: order_datetime > {state.get('order_datetime')}")
+    print(f"   ✓ gross_amount outliers will be capped to {state['gross_fill']:.2f}")
+
+    key_index = {table: IdBitmap.load(table, store_dir) for table in TABLES}
+    new = select_new_rows(raw, state, key_index)
+    tables = clean_tables(new, seed, stored_order_ids(new, key_index), workers, state['gross_fill'])
+
+    print("\n📁 Appending to the Parquet store...")
+    for table, df in tables.items():
+        if len(df):
+            append_table(df, table, store_dir)
+        key_index[table].add(df[ID_COLUMNS[table]])
+        key_index[table].save(table, store_dir)
+        print(f"   ✓ {table}: appended {len(df):,} rows")
+    append_orders_full(tables, store_dir)
+
+    state = watermarks(tables, state)
+    write_state(state, store_dir)
+    print(f"✅ Watermark advanced: order_datetime > {state.get('order_datetime')}")
 
 # =============================================================================
-# Step 13: Export Cleaned Dataset
+# Step 16: Streaming Cleaning
 # =============================================================================
 
-print("\n" + "="*70)
-print("📁 EXPORTING CLEANED DATASET")
-print("="*70)
-
-# Export to Excel
-with pd.ExcelWriter('BitesUAE_Cleaned.xlsx', engine='openpyxl') as writer:
-    customers.to_excel(writer, sheet_name='CUSTOMERS', index=False)
-    restaurants.to_excel(writer, sheet_name='RESTAURANTS', index=False)
-    riders.to_excel(writer, sheet_name='RIDERS', index=False)
-    orders.to_excel(writer, sheet_name='ORDERS', index=False)
-    order_items.to_excel(writer, sheet_name='ORDER_ITEMS', index=False)
-    delivery_events.to_excel(writer, sheet_name='DELIVERY_EVENTS', index=False)
-
-print("✅ Exported: BitesUAE_Cleaned.xlsx")
-
-# Also export as CSV files (useful for Power BI)
-customers.to_csv('CUSTOMERS.csv', index=False)
-restaurants.to_csv('RESTAURANTS.csv', index=False)
-riders.to_csv('RIDERS.csv', index=False)
-orders.to_csv('ORDERS.csv', index=False)
-order_items.to_csv('ORDER_ITEMS.csv', index=False)
-delivery_events.to_csv('DELIVERY_EVENTS.csv', index=False)
+# Fact tables cleaned chunk by chunk; the dimension tables fit in memory
+STREAMED_TABLES = ['ORDERS', 'ORDER_ITEMS', 'DELIVERY_EVENTS']
 
-print("✅ Exported: Individual CSV files")
+GROSS_RESOLUTION = 0.01  # gross_amount is in fils, so a per-fils histogram is exact
 
-# Download files
-from google.colab import files
-files.download('BitesUAE_Cleaned.xlsx')
+def iter_raw_chunks(input_dir, table, chunk_size, columns=None):
+    """Yield a raw CSV/Parquet table as parsed chunks of `chunk_size` rows."""
+    path = Path(input_dir) / f'{table}.parquet'
+    if path.exists():
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield parse_raw_types(batch.to_pandas(), table)
+    else:
+        for chunk in pd.read_csv(Path(input_dir) / f'{table}.csv', chunksize=chunk_size, usecols=columns):
+            yield parse_raw_types(chunk, table)
+
+def histogram_quantile(counts, q, resolution):
+    """Linear-interpolated quantile (pandas' default) of values binned at `resolution`."""
+    n = counts.sum()
+    position = (n - 1) * q
+    below = int(np.floor(position))
+    cumulative = np.cumsum(counts)
+    low = np.searchsorted(cumulative, below, side='right') * resolution
+    high = np.searchsorted(cumulative, min(below + 1, n - 1), side='right') * resolution
+    return low + (position - below) * (high - low)
+
+def scan_orders(input_dir, chunk_size):
+    """First pass over ORDERS: the valid order IDs and the gross_amount fill value.
+
+    Reads only order_id and gross_amount. The 99th percentile of non-outlier
+    gross amounts (first occurrences only, as after deduplication) comes from
+    a fixed-size histogram instead of holding every amount.
+    """
+    order_ids = IdBitmap()
+    counts = np.zeros(int(round(GROSS_CAP / GROSS_RESOLUTION)) + 1, dtype=np.int64)
+    for chunk in iter_raw_chunks(input_dir, 'ORDERS', chunk_size, ['order_id', 'gross_amount']):
+        gross = chunk['gross_amount'][order_ids.add_first_seen(chunk['order_id'])]
+        gross = gross[gross <= GROSS_CAP]
+        counts += np.bincount(np.round(gross.to_numpy() / GROSS_RESOLUTION).astype(np.int64),
+                              minlength=len(counts))
+    return order_ids, histogram_quantile(counts, 0.99, GROSS_RESOLUTION)
+
+def clean_chunk(table, chunk, order_ids, gross_fill, rng):
+    """Clean one chunk of a fact table with its rules; returns (cleaned, report)."""
+    # Only the order IDs this chunk references need to be checked
+    valid_order_ids = chunk['order_id'][order_ids.contains(chunk['order_id'])]
+    ctx = cleaning_context(rng, gross_fill=gross_fill, valid_order_ids=valid_order_ids)
+    return clean_table(table, chunk, ctx, verbose=False)
+
+def add_reports(total, report):
+    """Sum per-rule rows and seconds across chunks."""
+    for rule, affected, seconds in report:
+        rows, elapsed = total.get(rule, (0, 0.0))
+        total[rule] = (rows + affected, elapsed + seconds)
+    return total
+
+def stream_orders_full(store_dir):
+    """Build ORDERS_FULL one stored ORDERS part at a time.
+
+    Only the DELIVERY_EVENTS parts whose order_id range overlaps the part
+    are read, so memory stays bounded by the chunk size.
+    """
+    restaurants = read_table('RESTAURANTS', store_dir, RESTAURANT_COLUMNS)
+    riders = read_table('RIDERS', store_dir, ['rider_id'])
+    rows = 0
+    for shard, part in enumerate(part_paths(store_dir, 'ORDERS')):
+        orders = pd.read_parquet(part, columns=ORDER_COLUMNS)
+        order_range = [('order_id', '>=', orders['order_id'].min()), ('order_id', '<=', orders['order_id'].max())]
+        events = read_table('DELIVERY_EVENTS', store_dir, EVENT_COLUMNS,
+                            filters=order_range if len(orders) else [('order_id', '==', '')])
+        facts = build_orders_full(orders, restaurants, riders, events)
+        if shard == 0:
+            write_table(facts, FACT_TABLE, store_dir)
+        else:
+            append_table(facts, FACT_TABLE, store_dir)
+        rows += len(facts)
+    print(f"   ✅ {FACT_TABLE} built: {rows:,} rows")
+
+def run_streaming(input_dir, output_dir, chunk_size, seed):
+    """Clean the fact tables chunk by chunk and stream them to CSV and the store.
+
+    Global state comes from a first pass over ORDERS (valid order IDs and
+    the gross_amount fill value) and from per-table IdBitmaps of IDs already
+    written, so every chunk gets the same rules and inputs as a whole-table
+    run. Each chunk draws from its own (seed, table, chunk) random stream,
+    so randomly filled values differ from a whole-table run's.
+    """
+    print("\n" + "="*70)
+    print(f"🌊 STREAMING CLEANING ({chunk_size:,}-row chunks)")
+    print("="*70)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    store_dir = output_dir / 'store'
+
+    # Dimension tables are small enough to clean whole
+    for table in ['CUSTOMERS', 'RESTAURANTS', 'RIDERS']:
+        ctx = cleaning_context(table_rng(seed, table))
+        df, _ = clean_table(table, read_raw_table(input_dir, table), ctx)
+        df.to_csv(output_dir / f'{table}.csv', index=False)
+        write_table(df, table, store_dir)
+        write_key_index({table: df}, store_dir)
+
+    print("\n🔍 First pass over ORDERS...")
+    order_ids, gross_fill = scan_orders(input_dir, chunk_size)
+    print(f"   ✓ gross_amount outliers will be capped to {gross_fill:.2f}")
+
+    state = {'gross_fill': float(gross_fill)}
+    for table in STREAMED_TABLES:
+        print(f"\n🧹 Streaming {table}...")
+        seen, stored = IdBitmap(), IdBitmap()
+        csv_path = output_dir / f'{table}.csv'
+        rows, total = 0, {}
+        for shard, chunk in enumerate(iter_raw_chunks(input_dir, table, chunk_size)):
+            first_seen = seen.add_first_seen(chunk[ID_COLUMNS[table]])
+            total = add_reports(total, [('drop_duplicate_ids', int((~first_seen).sum()), 0.0)])
+            # Each chunk gets its own stream, so results do not depend on earlier chunks
+            rng = np.random.default_rng([seed, TABLES.index(table), shard])
+            cleaned, report = clean_chunk(table, chunk[first_seen], order_ids, gross_fill, rng)
+            total = add_reports(total, report)
+
+            cleaned.to_csv(csv_path, mode='w' if shard == 0 else 'a', header=shard == 0, index=False)
+            if shard == 0:
+                write_table(cleaned, table, store_dir)
+            else:
+                append_table(cleaned, table, store_dir)
+            stored.add(cleaned[ID_COLUMNS[table]])
+            state = watermarks({table: cleaned}, state)
+            rows += len(cleaned)
+            print(f"    Progress: {rows:,} rows cleaned...")
+        stored.save(table, store_dir)
+        print_report(table, [(rule, affected, seconds) for rule, (affected, seconds) in total.items()], rows)
+
+    print(f"\n🧩 Building {FACT_TABLE}...")
+    stream_orders_full(store_dir)
+
+    write_state(state, store_dir)
+    print(f"\n✅ Exported: Individual CSV files and Parquet store ({store_dir}/)")
 
-print("\n" + "="*70)
-print("🎉 DATA CLEANING COMPLETE!")
-print("="*70)
+# =============================================================================
+# Step 17: Main Execution
+# =============================================================================
 
-print("""
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Clean the raw BitesUAE dataset.")
+    parser.add_argument('--input', type=Path, default=Path('BitesUAE_Dataset.xlsx'),
+                        help="Raw xlsx workbook or directory of CSV/Parquet tables (default: BitesUAE_Dataset.xlsx)")
+    parser.add_argument('--output-dir', type=Path, default=Path('.'),
+                        help="Directory for the cleaned files and store/ (default: current directory)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"Seed for the random repairs, so reruns are identical (default: {DEFAULT_SEED})")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Clean only rows past the store's watermark and append them to store/")
+    parser.add_argument('--streaming', action='store_true',
+                        help="Clean ORDERS, ORDER_ITEMS and DELIVERY_EVENTS in chunks (CSV/Parquet input only)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per chunk in --streaming mode (default: {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes cleaning independent tables at once (default: all cores); "
+                             "output does not depend on it")
+    args = parser.parse_args(argv)
+
+    if not args.input.exists():
+        parser.error(f"raw dataset not found: {args.input}")
+    if args.streaming and not args.input.is_dir():
+        parser.error("--streaming needs a directory of CSV/Parquet tables as --input")
+    if args.streaming and args.incremental:
+        parser.error("--streaming and --incremental cannot be combined")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.workers < 1:
+        parser.error("--workers must be positive")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    store_dir = args.output_dir / 'store'
+
+    if args.streaming:
+        run_streaming(args.input, args.output_dir, args.chunk_size, args.seed)
+        print("\n" + "="*70)
+        print("🎉 STREAMING CLEANING COMPLETE!")
+        print("="*70)
+        return
+
+    raw = load_raw(args.input)
+
+    state = read_state(store_dir) if args.incremental else None
+    if state is not None:
+        run_incremental(raw, store_dir, state, args.seed, args.workers)
+        print("\n" + "="*70)
+        print("🎉 INCREMENTAL CLEANING COMPLETE!")
+        print("="*70)
+        return
+    if args.incremental:
+        print("\n⚠️  No cleaned store found; running a full clean first.")
+
+    assess_raw(raw)
+    gross_fill = gross_fill_of(raw['ORDERS'])
+    tables = clean_tables(raw, args.seed, workers=args.workers, gross_fill=gross_fill)
+    validate(tables)
+    export(tables, args.output_dir, gross_fill)
+
+    print("\n" + "="*70)
+    print("🎉 DATA CLEANING COMPLETE!")
+    print("="*70)
+
+    print("""
 📁 Files Created:
    • BitesUAE_Cleaned.xlsx (all tables in one file)
    • Individual CSV files for each table
+   • store/ (columnar Parquet store loaded by the dashboard)
 
 📊 Ready for Power BI:
    1. Open Power BI Desktop
@@ -548,3 +1185,6 @@ print("""
    • DELIVERY_EVENTS.rider_id → RIDERS.rider_id
    • ORDER_ITEMS.order_id → ORDERS.order_id
 """)
+
+if __name__ == '__main__':
+    main()